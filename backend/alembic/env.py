@@ -29,6 +29,7 @@ from src.models import (
     EvaluationRun,
     EvaluationResult,
     ScoreCard,
+    LatestScoreCard,
 )
 
 # this is the Alembic Config object, which provides
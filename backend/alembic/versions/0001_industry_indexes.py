@@ -0,0 +1,56 @@
+"""Composite indexes for results pagination and industry analytics
+
+Revision ID: 0001_industry_indexes
+Revises:
+Create Date: 2026-10-17 00:00:00.000000
+
+Tables are created by init_db() (Base.metadata.create_all), which skips
+tables that already exist, so databases created before these indexes were
+declared on the models only get them from this migration. Every index is
+created with IF NOT EXISTS so the migration is also safe on fresh databases.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_industry_indexes"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+INDEXES = [
+    (
+        "ix_evaluation_results_run_brand_model_id",
+        "evaluation_results",
+        ["evaluation_run_id", "brand_id", "model_name", "id"],
+    ),
+    (
+        "ix_evaluation_results_brand_intent_mentioned",
+        "evaluation_results",
+        ["brand_id", "intent_category", "is_mentioned"],
+    ),
+    ("ix_evaluation_results_intent_mentioned", "evaluation_results", ["intent_category", "is_mentioned"]),
+    ("ix_evaluation_results_mentioned_sentiment", "evaluation_results", ["is_mentioned", "sentiment"]),
+    ("ix_evaluation_results_brand_prompt", "evaluation_results", ["brand_id", "prompt_id"]),
+    ("ix_score_cards_brand_created", "score_cards", ["brand_id", "created_at"]),
+    ("ix_score_cards_composite", "score_cards", ["composite_score"]),
+    ("ix_brands_category_name", "brands", ["category", "name"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+    # Refresh planner statistics so the new indexes are picked up right away
+    if op.get_bind().dialect.name in ("sqlite", "postgresql"):
+        op.execute(sa.text("ANALYZE"))
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,40 @@
+"""Full-text search tables and indexes
+
+Revision ID: 0002_search_indexes
+Revises: 0001_industry_indexes
+Create Date: 2026-10-17 00:00:00.000000
+
+SQLite gets FTS5 tables kept in sync by triggers, PostgreSQL gets GIN
+indexes on the results' tsvector and (with pg_trgm) on brand names. init_db()
+runs the same idempotent setup, see src/services/search.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.services.search import get_search_backend
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_search_indexes"
+down_revision: Union[str, None] = "0001_industry_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    get_search_backend(bind.dialect.name).setup(bind)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for table in ("evaluation_results", "brands"):
+            for event in ("insert", "delete", "update"):
+                op.execute(sa.text(f"DROP TRIGGER IF EXISTS {table}_fts_{event}"))
+            op.execute(sa.text(f"DROP TABLE IF EXISTS {table}_fts"))
+    elif dialect == "postgresql":
+        op.drop_index("ix_brands_name_trgm", table_name="brands", if_exists=True)
+        op.drop_index("ix_evaluation_results_search", table_name="evaluation_results", if_exists=True)
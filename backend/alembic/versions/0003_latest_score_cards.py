@@ -0,0 +1,41 @@
+"""Latest scorecard per brand projection
+
+Revision ID: 0003_latest_score_cards
+Revises: 0002_search_indexes
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.services.score_queries import backfill_latest_score_cards
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_latest_score_cards"
+down_revision: Union[str, None] = "0002_search_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # init_db() may already have created the table
+    if "latest_score_cards" in sa.inspect(op.get_bind()).get_table_names():
+        backfill_latest_score_cards(op.get_bind())
+        return
+    op.create_table(
+        "latest_score_cards",
+        sa.Column("brand_id", sa.String(36), sa.ForeignKey("brands.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column(
+            "score_card_id", sa.String(36),
+            sa.ForeignKey("score_cards.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    backfill_latest_score_cards(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table("latest_score_cards")
@@ -0,0 +1,40 @@
+"""One evaluation result per (run, brand, prompt, model)
+
+Revision ID: 0004_unique_evaluation_results
+Revises: 0003_latest_score_cards
+Create Date: 2026-10-17 00:00:00.000000
+
+A job that ran twice at once could store the same evaluation twice. The
+duplicates are removed (the row with the lowest ID is kept) before the
+unique index is created; scorecards of affected runs are only corrected
+when the run is evaluated again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_unique_evaluation_results"
+down_revision: Union[str, None] = "0003_latest_score_cards"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "uq_evaluation_results_run_brand_prompt_model"
+COLUMNS = ["evaluation_run_id", "brand_id", "prompt_id", "model_name"]
+
+
+def upgrade() -> None:
+    key = ", ".join(COLUMNS)
+    result = op.get_bind().execute(sa.text(
+        "DELETE FROM evaluation_results WHERE id NOT IN "
+        f"(SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM evaluation_results GROUP BY {key}) AS kept)"
+    ))
+    if result.rowcount:
+        print(f"[migrate] Removed {result.rowcount} duplicate evaluation results")
+    op.create_index(INDEX, "evaluation_results", COLUMNS, unique=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="evaluation_results", if_exists=True)
@@ -0,0 +1,37 @@
+"""Keep the latest scorecard projection in sync with triggers
+
+Revision ID: 0005_latest_score_card_triggers
+Revises: 0004_unique_evaluation_results
+Create Date: 2026-10-17 00:00:00.000000
+
+Scripts write score_cards with raw SQL, bypassing the engine's pointer
+upserts. AFTER INSERT / DELETE triggers keep the projection current for
+them too (SQLite and PostgreSQL).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.services.score_queries import backfill_latest_score_cards, setup_latest_score_card_sync
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_latest_score_card_triggers"
+down_revision: Union[str, None] = "0004_unique_evaluation_results"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    setup_latest_score_card_sync(op.get_bind())
+    backfill_latest_score_cards(op.get_bind())
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS score_cards_latest_insert")
+        op.execute("DROP TRIGGER IF EXISTS score_cards_latest_delete")
+    elif dialect == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS score_cards_latest_sync ON score_cards")
+        op.execute("DROP FUNCTION IF EXISTS score_cards_latest_sync()")
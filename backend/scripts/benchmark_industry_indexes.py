@@ -0,0 +1,283 @@
+"""
+Benchmark the industry analytics queries before and after the composite indexes.
+
+Builds a synthetic SQLite database (1M evaluation results by default) with
+the baseline single-column indexes, records EXPLAIN QUERY PLAN output and
+timings for SQL equivalents of the /industry endpoints, then adds the indexes
+from migration 0001_industry_indexes, runs ANALYZE and measures again.
+
+Usage:
+    python scripts/benchmark_industry_indexes.py --rows 1000000 --output report.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+CATEGORIES = [
+    "Kids Fashion", "SaaS", "Fintech", "Health", "Food & Beverage",
+    "Travel", "Real Estate", "Education",
+]
+INTENTS = [
+    "discovery", "comparison", "recommendation", "purchase",
+    "review", "alternative", "price", "trust",
+]
+MODELS = ["ChatGPT", "Gemini", "Claude", "Perplexity"]
+SENTIMENTS = ["positive", "neutral", "negative"]
+
+# Only the columns the industry queries touch; single-column indexes are
+# the ones the models declared before the composite indexes were added
+SCHEMA = """
+CREATE TABLE brands (
+    id VARCHAR(36) PRIMARY KEY,
+    workspace_id VARCHAR(36) NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    slug VARCHAR(255) NOT NULL,
+    domain VARCHAR(255),
+    category VARCHAR(100) NOT NULL
+);
+CREATE INDEX ix_brands_workspace_id ON brands (workspace_id);
+CREATE INDEX ix_brands_name ON brands (name);
+CREATE INDEX ix_brands_slug ON brands (slug);
+
+CREATE TABLE evaluation_results (
+    id VARCHAR(36) PRIMARY KEY,
+    evaluation_run_id VARCHAR(36) NOT NULL,
+    brand_id VARCHAR(36) NOT NULL,
+    prompt_id VARCHAR(36) NOT NULL,
+    model_name VARCHAR(50) NOT NULL,
+    prompt_text TEXT NOT NULL,
+    intent_category VARCHAR(100) NOT NULL,
+    response_text TEXT NOT NULL,
+    response_time_ms INTEGER NOT NULL,
+    is_mentioned BOOLEAN NOT NULL,
+    mention_rank INTEGER,
+    is_cited BOOLEAN NOT NULL,
+    representation_score INTEGER NOT NULL,
+    sentiment VARCHAR(50)
+);
+CREATE INDEX ix_evaluation_results_evaluation_run_id ON evaluation_results (evaluation_run_id);
+CREATE INDEX ix_evaluation_results_brand_id ON evaluation_results (brand_id);
+CREATE INDEX ix_evaluation_results_prompt_id ON evaluation_results (prompt_id);
+CREATE INDEX ix_evaluation_results_model_name ON evaluation_results (model_name);
+
+CREATE TABLE score_cards (
+    id VARCHAR(36) PRIMARY KEY,
+    brand_id VARCHAR(36) NOT NULL,
+    evaluation_run_id VARCHAR(36),
+    composite_score INTEGER NOT NULL,
+    visibility_score INTEGER NOT NULL,
+    citation_score INTEGER NOT NULL,
+    representation_score INTEGER NOT NULL,
+    intent_score INTEGER NOT NULL,
+    created_at DATETIME NOT NULL
+);
+CREATE INDEX ix_score_cards_brand_id ON score_cards (brand_id);
+CREATE INDEX ix_score_cards_evaluation_run_id ON score_cards (evaluation_run_id);
+"""
+
+# Keep in sync with alembic/versions/0001_industry_indexes.py
+COMPOSITE_INDEXES = """
+CREATE INDEX ix_evaluation_results_run_brand_model_id
+    ON evaluation_results (evaluation_run_id, brand_id, model_name, id);
+CREATE INDEX ix_evaluation_results_brand_intent_mentioned
+    ON evaluation_results (brand_id, intent_category, is_mentioned);
+CREATE INDEX ix_evaluation_results_intent_mentioned
+    ON evaluation_results (intent_category, is_mentioned);
+CREATE INDEX ix_evaluation_results_mentioned_sentiment
+    ON evaluation_results (is_mentioned, sentiment);
+CREATE INDEX ix_evaluation_results_brand_prompt ON evaluation_results (brand_id, prompt_id);
+CREATE INDEX ix_score_cards_brand_created ON score_cards (brand_id, created_at);
+CREATE INDEX ix_score_cards_composite ON score_cards (composite_score);
+CREATE INDEX ix_brands_category_name ON brands (category, name);
+"""
+
+# (name, SQL, parameters); mirrors the queries in src/api/routes/industry.py
+QUERIES = [
+    ("categories", """
+        SELECT b.category, COUNT(DISTINCT b.id), COUNT(r.id)
+        FROM brands b LEFT JOIN evaluation_results r ON r.brand_id = b.id
+        GROUP BY b.category ORDER BY COUNT(r.id) DESC
+    """, ()),
+    ("category_scores", """
+        SELECT b.category, AVG(s.composite_score), COUNT(s.id)
+        FROM brands b JOIN score_cards s ON s.brand_id = b.id
+        GROUP BY b.category
+    """, ()),
+    ("rankings", """
+        SELECT b.name, b.category, s.composite_score
+        FROM brands b JOIN score_cards s ON s.brand_id = b.id
+        WHERE b.category = :category
+        ORDER BY s.composite_score DESC LIMIT 50
+    """, {"category": CATEGORIES[0]}),
+    ("intent_matrix", """
+        SELECT b.name, r.intent_category, COUNT(*),
+               SUM(CASE WHEN r.is_mentioned THEN 1 ELSE 0 END)
+        FROM evaluation_results r JOIN brands b ON b.id = r.brand_id
+        WHERE b.category = :category
+        GROUP BY b.name, r.intent_category ORDER BY b.name, r.intent_category
+    """, {"category": CATEGORIES[0]}),
+    ("stats_intent_breakdown", """
+        SELECT intent_category, COUNT(*), SUM(CASE WHEN is_mentioned THEN 1 ELSE 0 END)
+        FROM evaluation_results GROUP BY intent_category
+    """, ()),
+    ("stats_sentiment", """
+        SELECT sentiment, COUNT(*) FROM evaluation_results
+        WHERE is_mentioned = 1 GROUP BY sentiment
+    """, ()),
+    ("stats_category_prompts", """
+        SELECT COUNT(DISTINCT prompt_id) FROM evaluation_results
+        WHERE brand_id IN (SELECT id FROM brands WHERE category = :category)
+    """, {"category": CATEGORIES[0]}),
+    ("latest_scorecard", """
+        SELECT composite_score FROM score_cards
+        WHERE brand_id = :brand_id ORDER BY created_at DESC LIMIT 1
+    """, None),
+    ("run_scorecard_rollup", """
+        SELECT brand_id, model_name, COUNT(*), SUM(CASE WHEN is_mentioned THEN 1 ELSE 0 END)
+        FROM evaluation_results WHERE evaluation_run_id = :run_id
+        GROUP BY brand_id, model_name
+    """, None),
+    ("intents", """
+        SELECT DISTINCT intent_category FROM evaluation_results ORDER BY intent_category
+    """, ()),
+]
+
+
+def generate(conn: sqlite3.Connection, rows: int, brands: int, runs: int, seed: int) -> dict:
+    """Fill the database with synthetic brands, results and scorecards."""
+    rng = random.Random(seed)
+    conn.executescript(SCHEMA)
+
+    brand_rows = []
+    for i in range(brands):
+        brand_id = str(uuid4())
+        brand_rows.append((
+            brand_id, "ws-demo-001", f"Brand {i:05d}", f"brand-{i:05d}",
+            f"brand{i}.example.com", CATEGORIES[i % len(CATEGORIES)],
+        ))
+    conn.executemany("INSERT INTO brands VALUES (?, ?, ?, ?, ?, ?)", brand_rows)
+    brand_ids = [row[0] for row in brand_rows]
+    run_ids = [str(uuid4()) for _ in range(runs)]
+    prompt_ids = [str(uuid4()) for _ in range(500)]
+
+    batch = []
+    for _ in range(rows):
+        mentioned = rng.random() < 0.4
+        batch.append((
+            str(uuid4()), rng.choice(run_ids), rng.choice(brand_ids), rng.choice(prompt_ids),
+            rng.choice(MODELS), "What are the best options?", rng.choice(INTENTS),
+            "Synthetic response text.", rng.randint(200, 8000), mentioned,
+            rng.randint(1, 10) if mentioned else None, rng.random() < 0.2,
+            rng.randint(0, 3), rng.choice(SENTIMENTS) if mentioned else None,
+        ))
+        if len(batch) >= 50_000:
+            conn.executemany(
+                "INSERT INTO evaluation_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch
+            )
+            batch.clear()
+    if batch:
+        conn.executemany(
+            "INSERT INTO evaluation_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch
+        )
+
+    start = datetime(2025, 1, 1)
+    score_rows = []
+    for brand_id in brand_ids:
+        for run_index, run_id in enumerate(run_ids):
+            score_rows.append((
+                str(uuid4()), brand_id, run_id,
+                *(rng.randint(0, 100) for _ in range(5)),
+                (start + timedelta(days=run_index)).isoformat(" "),
+            ))
+    conn.executemany("INSERT INTO score_cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", score_rows)
+    conn.commit()
+    return {"brand_id": rng.choice(brand_ids), "run_id": rng.choice(run_ids)}
+
+
+def measure(conn: sqlite3.Connection, sample: dict, repeat: int) -> dict:
+    """EXPLAIN QUERY PLAN and median timing of every benchmark query."""
+    report = {}
+    for name, sql, params in QUERIES:
+        params = sample if params is None else params
+        plan = [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            timings.append(time.perf_counter() - started)
+        report[name] = {"plan": plan, "median_ms": round(statistics.median(timings) * 1000, 2)}
+        print(f"  {name:<24} {report[name]['median_ms']:>10.2f} ms")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Evaluation results to generate")
+    parser.add_argument("--brands", type=int, default=2000, help="Brands to generate")
+    parser.add_argument("--runs", type=int, default=20, help="Evaluation runs (scorecards per brand)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed executions per query")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db", help="SQLite file to use (default: a temporary file)")
+    parser.add_argument("--output", help="Write the JSON report here")
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), "industry_benchmark.db")
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+
+    print(f"Generating {args.rows:,} evaluation results in {path} ...")
+    started = time.perf_counter()
+    sample = generate(conn, args.rows, args.brands, args.runs, args.seed)
+    conn.execute("ANALYZE")
+    print(f"Generated in {time.perf_counter() - started:.1f}s")
+
+    print("\nBefore composite indexes:")
+    before = measure(conn, sample, args.repeat)
+
+    started = time.perf_counter()
+    conn.executescript(COMPOSITE_INDEXES)
+    conn.execute("ANALYZE")
+    index_seconds = time.perf_counter() - started
+    print(f"\nCreated composite indexes in {index_seconds:.1f}s")
+
+    print("\nAfter composite indexes:")
+    after = measure(conn, sample, args.repeat)
+    conn.close()
+
+    report = {
+        "rows": args.rows,
+        "brands": args.brands,
+        "runs": args.runs,
+        "index_build_seconds": round(index_seconds, 2),
+        "queries": {
+            name: {
+                "before": before[name],
+                "after": after[name],
+                "speedup": round(before[name]["median_ms"] / after[name]["median_ms"], 2)
+                if after[name]["median_ms"] else None,
+            }
+            for name in before
+        },
+    }
+
+    print("\nSpeedup:")
+    for name, entry in report["queries"].items():
+        print(f"  {name:<24} {entry['speedup']}x")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from ..core.config import settings
 from ..core.database import init_db, close_db
+from ..services.ai_clients import close_ai_clients, init_http_clients, close_http_clients
+from ..services.job_queue import start_job_worker, stop_job_worker
 
 
 @asynccontextmanager
@@ -27,10 +29,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         raise RuntimeError(f"Database initialization failed: {e}")
 
+    init_http_clients()
+
+    if settings.JOB_WORKER_ENABLED:
+        start_job_worker()
+
     yield
 
     # Shutdown
     print("Shutting down...")
+    await stop_job_worker()
+    await close_ai_clients()
+    await close_http_clients()
+    print("AI clients closed")
     await close_db()
     print("Database connections closed")
 
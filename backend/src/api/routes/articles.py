@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.database import get_db
 from ...models.article import Article
+from ...services.count_cache import count_rows, normalize_filter
 
 router = APIRouter()
 
@@ -42,6 +43,7 @@ class ArticleListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    total_estimated: bool = False  # total is a planner estimate
 
 
 # ---------------------------------------------------------------------------
@@ -55,9 +57,11 @@ async def list_articles(
     featured: Optional[bool] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(12, ge=1, le=50),
+    count_mode: str = Query("exact", pattern="^(exact|estimated)$", description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
 ):
     """List published articles with optional filters."""
+    category, tag = normalize_filter(category), normalize_filter(tag)
     query = select(Article).where(Article.is_published == True)
 
     if category:
@@ -67,9 +71,11 @@ async def list_articles(
     if featured is not None:
         query = query.where(Article.is_featured == featured)
 
-    # Count
-    count_q = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_q)).scalar() or 0
+    total, estimated = await count_rows(
+        db, query, "articles",
+        {"category": category, "tag": tag, "featured": featured},
+        tables=("articles",), mode=count_mode,
+    )
 
     # Paginate
     query = query.order_by(desc(Article.published_at))
@@ -83,6 +89,7 @@ async def list_articles(
         total=total,
         page=page,
         page_size=page_size,
+        total_estimated=estimated,
     )
 
 
@@ -5,11 +5,14 @@ API routes for Brand management.
 from typing import List
 from uuid import uuid4
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.database import get_db
 from ...models.brand import Brand
+from ...services.count_cache import count_rows, normalize_filter
+from ...services.score_queries import latest_score_cards
+from ...services.search import get_search_backend
 from ...schemas.brand_schemas import (
     BrandCreate,
     BrandUpdate,
@@ -26,21 +29,22 @@ async def list_brands(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=500),
     category: str = Query(None, description="Filter by category"),
+    count_mode: str = Query("exact", pattern="^(exact|estimated)$", description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List all brands for a workspace with pagination.
     """
+    category = normalize_filter(category)
     query = select(Brand).where(Brand.workspace_id == workspace_id)
 
     if category:
         query = query.where(Brand.category == category)
 
-    # Get total count (with same filters)
-    count_query = select(func.count()).select_from(Brand).where(Brand.workspace_id == workspace_id)
-    if category:
-        count_query = count_query.where(Brand.category == category)
-    total = (await db.execute(count_query)).scalar()
+    total, estimated = await count_rows(
+        db, query, "brands", {"workspace_id": workspace_id, "category": category},
+        tables=("brands",), mode=count_mode,
+    )
 
     # Apply pagination
     offset = (page - 1) * page_size
@@ -54,6 +58,7 @@ async def list_brands(
         total=total,
         page=page,
         page_size=page_size,
+        total_estimated=estimated,
     )
 
 
@@ -63,27 +68,24 @@ async def search_brands(
     workspace_id: str = Query("ws-demo-001", description="Workspace ID"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Search brands by name (case-insensitive partial match)."""
-    from ...models.scorecard import ScoreCard
-    
-    result = await db.execute(
-        select(Brand).where(
-            Brand.workspace_id == workspace_id,
-            Brand.name.ilike(f"%{q}%"),
-        ).limit(10)
+    """Search brands by name (case-insensitive partial match, best matches first)."""
+    query, order = get_search_backend(db.bind.dialect.name).filter_brands(
+        select(Brand).where(Brand.workspace_id == workspace_id), q
     )
+    result = await db.execute(query.order_by(*order).limit(10))
     brands = result.scalars().all()
-    
-    # Get scores for matched brands
-    results = []
-    for brand in brands:
+
+    # Latest score of every matched brand in one query
+    scores = {}
+    if brands:
         score_result = await db.execute(
-            select(ScoreCard)
-            .where(ScoreCard.brand_id == brand.id)
-            .order_by(ScoreCard.created_at.desc())
-            .limit(1)
+            select(latest_score_cards(brand_ids=[brand.id for brand in brands]))
         )
-        score = score_result.scalar_one_or_none()
+        scores = {score.brand_id: score for score in score_result.scalars()}
+
+    results = []
+    for brand in brands:
+        score = scores.get(brand.id)
         results.append({
             "id": brand.id,
             "name": brand.name,
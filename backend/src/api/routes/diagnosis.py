@@ -11,12 +11,13 @@ Flow:
 """
 
 import asyncio
+import functools
 import json
 import os
 import re
 import time
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from uuid import uuid4
 
 import httpx
@@ -28,126 +29,248 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ...core.config import settings
 from ...core.database import get_db
 from ...models.diagnosis import DiagnosisRecord
+from ...services.ai_clients import (
+    ResponseCache,
+    StopCondition,
+    get_response_cache,
+    get_genai_client,
+    get_http_client,
+    get_rate_limiter,
+    get_circuit_breaker,
+    get_request_hedger,
+    RequestHedger,
+    estimate_tokens,
+    parse_retry_after,
+    is_rate_limit_error,
+)
+from ...services.response_analyzer import BrandResponseAnalyzer, MentionStopCondition
+from ...services.job_queue import enqueue_job, get_latest_job
 
 router = APIRouter()
 
-# ---------------------------------------------------------------------------
-# Google GenAI SDK
-# ---------------------------------------------------------------------------
-try:
-    from google import genai
-    _genai_client = None
-
-    def get_genai_client():
-        global _genai_client
-        if _genai_client is None:
-            _genai_client = genai.Client(api_key=settings.GOOGLE_API_KEY)
-        return _genai_client
-except ImportError:
-    genai = None
-
-    def get_genai_client():
-        return None
-
-
 GEMINI_MODEL = "gemini-2.0-flash"
+OPENAI_MODEL = "gpt-4o-mini"
+GROK_MODEL = "grok-3-mini-fast"
+PERPLEXITY_MODEL = "llama-3.1-sonar-small-128k-online"
 
 
 # ---------------------------------------------------------------------------
 # Multi-platform AI helpers
 # ---------------------------------------------------------------------------
 
-async def call_gemini(prompt: str, max_tokens: int = 512) -> Optional[str]:
+def cached_model_call(provider: str, model: str):
+    """
+    Serve repeated (prompt, max_tokens) calls from the shared response cache.
+
+    Answers cut short by a stop_condition are never cached.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(
+            prompt: str, max_tokens: int = 512, stop_condition: Optional[StopCondition] = None
+        ) -> Optional[str]:
+            cache = get_response_cache()
+            if cache is None:
+                return await fn(prompt, max_tokens, stop_condition)
+            key = ResponseCache.make_key(
+                provider, model, None, prompt, {"max_tokens": max_tokens, "temperature": 0.7}
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                return cached["text"]
+
+            stopped = False
+
+            def tracked_stop(text: str) -> bool:
+                nonlocal stopped
+                stopped = stop_condition(text)
+                return stopped
+
+            text = await fn(prompt, max_tokens, tracked_stop if stop_condition else None)
+            if text is not None and not stopped:
+                cache.set(key, provider, model, {"text": text, "model": model})
+            return text
+        return wrapper
+    return decorator
+
+
+def _record_http_outcome(breaker, status_code: int, started: float):
+    """Feed an HTTP status into the provider's breaker; only 5xx counts against health."""
+    if breaker is None:
+        return
+    if status_code >= 500:
+        breaker.record_failure(f"HTTP {status_code}")
+    else:
+        breaker.record_success(time.monotonic() - started)
+
+
+async def _stream_chat_completions(
+    client, body: dict, stop_condition: StopCondition, limiter, breaker
+) -> Optional[str]:
+    """Stream a chat completion over SSE, disconnecting once stop_condition is met."""
+    started = time.monotonic()
+    async with client.stream("POST", "/chat/completions", json={**body, "stream": True}) as resp:
+        if resp.status_code != 200:
+            _record_http_outcome(breaker, resp.status_code, started)
+            if resp.status_code == 429 and limiter:
+                limiter.on_rate_limited(parse_retry_after(resp.headers))
+            return None
+        text = ""
+        async for line in resp.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            choices = json.loads(data).get("choices") or []
+            delta = choices[0].get("delta", {}).get("content") if choices else None
+            if not delta:
+                continue
+            text += delta
+            if stop_condition(text):
+                # Leaving the stream closes it, which stops generation
+                break
+    _record_http_outcome(breaker, 200, started)
+    if limiter:
+        limiter.on_success()
+    return text
+
+
+async def _call_chat_completions(
+    provider: str,
+    model: str,
+    label: str,
+    prompt: str,
+    max_tokens: int,
+    stop_condition: Optional[StopCondition] = None,
+) -> Optional[str]:
+    """POST to an OpenAI-compatible /chat/completions endpoint through the shared pool."""
+    client = get_http_client(provider)
+    if client is None:
+        return None
+    breaker = get_circuit_breaker(provider)
+    if breaker and not breaker.allow():
+        # Provider is failing; don't spend the request timeout on it
+        print(f"[diagnosis] {label} circuit open, skipping call")
+        return None
+    limiter = get_rate_limiter(provider)
+    body = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+        "temperature": 0.7,
+    }
+    try:
+        if limiter:
+            await limiter.acquire(estimate_tokens(prompt, max_tokens=max_tokens))
+        if stop_condition is not None:
+            return await _stream_chat_completions(client, body, stop_condition, limiter, breaker)
+        started = time.monotonic()
+        resp = await client.post("/chat/completions", json=body)
+        _record_http_outcome(breaker, resp.status_code, started)
+        if resp.status_code == 200:
+            if limiter:
+                limiter.on_success()
+            return resp.json()["choices"][0]["message"]["content"]
+        if resp.status_code == 429 and limiter:
+            limiter.on_rate_limited(parse_retry_after(resp.headers))
+    except Exception as e:
+        if breaker:
+            breaker.record_failure(str(e))
+        print(f"[diagnosis] {label} API error: {e}")
+    return None
+
+
+@cached_model_call("gemini", GEMINI_MODEL)
+async def call_gemini(
+    prompt: str, max_tokens: int = 512, stop_condition: Optional[StopCondition] = None
+) -> Optional[str]:
     """Call Gemini and return text response."""
     if not settings.GOOGLE_API_KEY:
         return None
     client = get_genai_client()
     if not client:
         return None
+    breaker = get_circuit_breaker("gemini")
+    if breaker and not breaker.allow():
+        print("[diagnosis] Gemini circuit open, skipping call")
+        return None
+    limiter = get_rate_limiter("gemini")
     try:
-        response = await asyncio.to_thread(
-            lambda: client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt,
-                config={"max_output_tokens": max_tokens, "temperature": 0.7},
+        if limiter:
+            await limiter.acquire(estimate_tokens(prompt, max_tokens=max_tokens))
+        started = time.monotonic()
+        config = {"max_output_tokens": max_tokens, "temperature": 0.7}
+        if stop_condition is not None:
+            text = ""
+            stream = await client.aio.models.generate_content_stream(
+                model=GEMINI_MODEL, contents=prompt, config=config
             )
+            try:
+                async for chunk in stream:
+                    text += chunk.text or ""
+                    if stop_condition(text):
+                        break
+            finally:
+                await stream.aclose()
+            if breaker:
+                breaker.record_success(time.monotonic() - started)
+            if limiter:
+                limiter.on_success()
+            return text
+
+        # Native async call; no thread from the default executor is used
+        response = await client.aio.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=prompt,
+            config=config,
         )
+        if breaker:
+            breaker.record_success(time.monotonic() - started)
+        if limiter:
+            limiter.on_success()
         return response.text
     except Exception as e:
+        rate_limited = is_rate_limit_error(e)
+        if breaker:
+            if rate_limited:
+                breaker.record_success()
+            else:
+                breaker.record_failure(str(e))
+        if limiter and rate_limited:
+            limiter.on_rate_limited()
         print(f"[diagnosis] Gemini API error: {e}")
         return None
 
 
-async def call_openai(prompt: str, max_tokens: int = 512) -> Optional[str]:
+@cached_model_call("openai", OPENAI_MODEL)
+async def call_openai(
+    prompt: str, max_tokens: int = 512, stop_condition: Optional[StopCondition] = None
+) -> Optional[str]:
     """Call OpenAI ChatGPT. Returns None if API key not set."""
-    api_key = settings.OPENAI_API_KEY
-    if not api_key:
-        return None
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json={
-                    "model": "gpt-4o-mini",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": max_tokens,
-                    "temperature": 0.7,
-                },
-            )
-            if resp.status_code == 200:
-                return resp.json()["choices"][0]["message"]["content"]
-    except Exception as e:
-        print(f"[diagnosis] OpenAI API error: {e}")
-    return None
+    return await _call_chat_completions(
+        "openai", OPENAI_MODEL, "OpenAI", prompt, max_tokens, stop_condition
+    )
 
 
-async def call_grok(prompt: str, max_tokens: int = 512) -> Optional[str]:
+@cached_model_call("grok", GROK_MODEL)
+async def call_grok(
+    prompt: str, max_tokens: int = 512, stop_condition: Optional[StopCondition] = None
+) -> Optional[str]:
     """Call xAI Grok. Returns None if API key not set."""
-    api_key = settings.XAI_API_KEY
-    if not api_key:
-        return None
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                "https://api.x.ai/v1/chat/completions",
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json={
-                    "model": "grok-3-mini-fast",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": max_tokens,
-                    "temperature": 0.7,
-                },
-            )
-            if resp.status_code == 200:
-                return resp.json()["choices"][0]["message"]["content"]
-    except Exception as e:
-        print(f"[diagnosis] Grok API error: {e}")
-    return None
+    return await _call_chat_completions(
+        "grok", GROK_MODEL, "Grok", prompt, max_tokens, stop_condition
+    )
 
 
-async def call_perplexity(prompt: str, max_tokens: int = 512) -> Optional[str]:
+@cached_model_call("perplexity", PERPLEXITY_MODEL)
+async def call_perplexity(
+    prompt: str, max_tokens: int = 512, stop_condition: Optional[StopCondition] = None
+) -> Optional[str]:
     """Call Perplexity. Returns None if API key not set."""
-    api_key = settings.PERPLEXITY_API_KEY
-    if not api_key:
-        return None
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                "https://api.perplexity.ai/chat/completions",
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json={
-                    "model": "llama-3.1-sonar-small-128k-online",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": max_tokens,
-                    "temperature": 0.7,
-                },
-            )
-            if resp.status_code == 200:
-                return resp.json()["choices"][0]["message"]["content"]
-    except Exception as e:
-        print(f"[diagnosis] Perplexity API error: {e}")
-    return None
+    return await _call_chat_completions(
+        "perplexity", PERPLEXITY_MODEL, "Perplexity", prompt, max_tokens, stop_condition
+    )
 
 
 def get_available_models() -> dict:
@@ -196,6 +319,8 @@ class DiagnosisRequest(BaseModel):
     custom_prompts: Optional[list[str]] = None
     pro: bool = False
     email: Optional[str] = None  # If admin email, auto-upgrade to pro
+    early_stop: bool = False  # Stream answers and stop once the brand's rank is known
+    hedge: bool = False  # Duplicate calls slower than the provider's p90 latency
 
 
 class PromptResult(BaseModel):
@@ -545,9 +670,44 @@ Return ONLY valid JSON array, no markdown fences."""
         return []
 
 
-async def evaluate_prompt(brand_name: str, prompt_text: str, model_name: str, model_fn, prompt_type: str = "generic") -> dict:
-    """Evaluate a single prompt against a specific AI model and analyze the response."""
-    response_text = await model_fn(prompt_text)
+# Prompt types whose result needs only the brand's mention and list rank,
+# so their answers may be cut off early. brand_specific answers name the
+# brand in the first line; their sentiment, citations and knowledge checks
+# need the whole text.
+EARLY_STOP_PROMPT_TYPES = {"generic"}
+
+
+async def evaluate_prompt(
+    brand_name: str,
+    prompt_text: str,
+    model_name: str,
+    model_fn,
+    prompt_type: str = "generic",
+    analyzer: Optional[BrandResponseAnalyzer] = None,
+    early_stop: bool = False,
+    hedger: Optional[RequestHedger] = None,
+) -> dict:
+    """
+    Evaluate a single prompt against a specific AI model and analyze the response.
+
+    With early_stop, answers to EARLY_STOP_PROMPT_TYPES prompts are
+    streamed and cut off once the brand's mention and list rank are known;
+    other prompts always get the full answer. With a hedger, a slow call is
+    duplicated and the first answer wins.
+    """
+    analyzer = analyzer or BrandResponseAnalyzer(brand_name)
+    early_stop = early_stop and prompt_type in EARLY_STOP_PROMPT_TYPES
+
+    def call():
+        if early_stop:
+            # Stop conditions track one stream each, so every attempt gets its own
+            stop_condition = MentionStopCondition(
+                analyzer.matcher, [brand_name], settings.STREAM_STOP_MAX_RANK
+            )
+            return model_fn(prompt_text, stop_condition=stop_condition)
+        return model_fn(prompt_text)
+
+    response_text = await (hedger.run(call) if hedger else call())
     if response_text is None:
         return {
             "mentioned": False,
@@ -559,112 +719,8 @@ async def evaluate_prompt(brand_name: str, prompt_text: str, model_name: str, mo
             "model_name": model_name,
         }
 
-    text_lower = response_text.lower()
-    brand_lower = brand_name.lower()
-    brand_simple = re.sub(r"['\-\s]", "", brand_lower)
-
-    is_mentioned = brand_lower in text_lower or brand_simple in re.sub(r"['\-\s]", "", text_lower)
-
-    # For brand-specific prompts, the brand name is IN the question,
-    # so AI will naturally echo it. We need to check if AI actually
-    # KNOWS about / RECOMMENDS the brand, not just echoes it.
-    if is_mentioned and prompt_type == "brand_specific":
-        # Check for "I don't have info" / "I can't verify" patterns
-        negative_patterns = [
-            "i don't have", "i do not have", "i cannot", "i can't",
-            "no specific information", "not able to verify", "not familiar with",
-            "i'm not sure", "i am not sure", "no data", "unable to find",
-            "don't have real-time", "don't have specific", "as of my last",
-            "i couldn't find", "limited information", "not enough information",
-            "i apologize", "might be a slight ambiguity",
-        ]
-        has_negative = any(p in text_lower for p in negative_patterns)
-        
-        # Check if AI actually provides substantive info about the brand
-        positive_knowledge = [
-            "known for", "specializes in", "offers", "founded", "popular for",
-            "well-known", "established", "headquartered", "their products",
-        ]
-        has_knowledge = any(p in text_lower for p in positive_knowledge)
-        
-        # If AI doesn't know the brand, mark as not genuinely mentioned
-        if has_negative and not has_knowledge:
-            is_mentioned = False
-
-    rank = None
-    snippet = None
-    if is_mentioned:
-        lines = response_text.split("\n")
-        for line in lines:
-            if brand_lower in line.lower() or brand_simple in re.sub(r"['\-\s]", "", line.lower()):
-                # Try numbered list: "1. Brand" or "1) Brand"
-                match = re.match(r"^\s*(\d+)[\.\)]\s", line)
-                if match:
-                    rank = int(match.group(1))
-                else:
-                    # Try markdown headers: "### 1. Brand" or "**1. Brand**"
-                    match = re.match(r"^\s*(?:#{1,4}\s*)?(?:\*\*)?(\d+)[\.\):]?\s", line)
-                    if match:
-                        rank = int(match.group(1))
-                    elif not rank:
-                        # Fallback: count peer list items (same indent level) before this line
-                        brand_line_idx = lines.index(line) if line in lines else -1
-                        if brand_line_idx > 0:
-                            # Find the indent/prefix pattern of the brand line
-                            brand_prefix = re.match(r'^(\s*[\*\-]\s+)', line)
-                            if brand_prefix:
-                                prefix_pattern = brand_prefix.group(1)
-                                position = 0
-                                for prev_line in lines[:brand_line_idx]:
-                                    if prev_line.startswith(prefix_pattern) and '**' in prev_line:
-                                        position += 1
-                                if position > 0:
-                                    rank = position + 1
-                snippet = line.strip()[:200]
-                break
-
-    sentiment = None
-    if is_mentioned:
-        # Enhanced sentiment analysis: check context around brand mention
-        positive_words = ["best", "top", "excellent", "quality", "premium", "trusted", "popular", 
-                         "recommended", "great", "love", "known for", "leading", "innovative",
-                         "reliable", "standout", "favorite", "well-regarded", "highly rated",
-                         "renowned", "exceptional", "superior", "impressive", "strong"]
-        negative_words = ["cheap", "poor", "bad", "worst", "avoid", "overpriced", "disappointing", 
-                         "unreliable", "controversy", "criticized", "lawsuit", "recall", "complaints",
-                         "declining", "problematic", "issues with"]
-        
-        # Weight: check words near brand mention, not just anywhere in text
-        brand_context = ""
-        for line in lines:
-            if brand_lower in line.lower() or brand_simple in re.sub(r"['\-\s]", "", line.lower()):
-                brand_context += " " + line.lower()
-        
-        context_to_check = brand_context if brand_context else text_lower
-        pos_count = sum(1 for w in positive_words if w in context_to_check)
-        neg_count = sum(1 for w in negative_words if w in context_to_check)
-        
-        if pos_count > neg_count:
-            sentiment = "positive"
-        elif neg_count > pos_count:
-            sentiment = "negative"
-        else:
-            sentiment = "neutral"
-
-    # Check for citations: URLs containing brand name or brand domain
-    brand_domain = brand_lower.replace(" ", "").replace("'", "")
-    has_citation = bool(
-        re.search(r'https?://[^\s]*' + re.escape(brand_domain), text_lower) or
-        re.search(r'https?://(?:www\.)?' + re.escape(brand_domain) + r'\.', text_lower) or
-        re.search(r'\b' + re.escape(brand_domain) + r'\.com\b', text_lower)
-    )
-
     return {
-        "mentioned": is_mentioned,
-        "rank": rank,
-        "sentiment": sentiment,
-        "snippet": snippet,
-        "has_citation": has_citation,
+        **analyzer.analyze(response_text, prompt_type),
         "response_text": response_text,
         "model_name": model_name,
     }
@@ -674,10 +730,16 @@ async def evaluate_prompt(brand_name: str, prompt_text: str, model_name: str, mo
 # Main endpoint
 # ---------------------------------------------------------------------------
 
-@router.post("", response_model=DiagnosisResponse)
-async def diagnose_brand(req: DiagnosisRequest, db: AsyncSession = Depends(get_db)):
+# Awaited with (stage, partial results) as the diagnosis pipeline progresses
+StageCallback = Callable[[str, dict], Awaitable[None]]
+
+
+def select_models(req: DiagnosisRequest) -> dict:
     """
-    Smart brand diagnosis: crawl → profile → generate prompts → evaluate → score → save.
+    Pick the models a diagnosis runs on: all available for pro, one for free.
+
+    Raises:
+        HTTPException: If the request names no brand or no model is configured
     """
     if not req.domain and not req.brand_name:
         raise HTTPException(400, "Provide either domain or brand_name")
@@ -706,6 +768,29 @@ async def diagnose_brand(req: DiagnosisRequest, db: AsyncSession = Depends(get_d
             first_model = next(iter(available_models.items()))
             models_to_use = {first_model[0]: first_model[1]}
         print(f"[diagnosis] Free tier: using single model {list(models_to_use.keys())[0]}")
+    return models_to_use
+
+
+async def run_diagnosis(
+    req: DiagnosisRequest,
+    diagnosis_id: Optional[str] = None,
+    on_stage: Optional[StageCallback] = None,
+) -> DiagnosisResponse:
+    """
+    Smart brand diagnosis: crawl → profile → generate prompts → evaluate → score.
+
+    Args:
+        req: Diagnosis parameters
+        diagnosis_id: ID of the result (default: a new UUID)
+        on_stage: Awaited with partial results as they become available:
+            "crawl", "profile", "prompts", "model_score" (once per model as
+            its evaluations finish), "score" and "competitors"
+    """
+    models_to_use = select_models(req)
+
+    async def report(stage: str, data: dict):
+        if on_stage is not None:
+            await on_stage(stage, data)
 
     print(f"[diagnosis] Starting diagnosis: domain={req.domain}, brand={req.brand_name}, models={list(models_to_use.keys())}")
 
@@ -720,6 +805,7 @@ async def diagnose_brand(req: DiagnosisRequest, db: AsyncSession = Depends(get_d
         site_text = await crawl_website(domain)
 
     print(f"[diagnosis] Step 1 done: crawled {len(site_text)} chars")
+    await report("crawl", {"crawled_chars": len(site_text)})
 
     # Step 2: Extract brand profile
     if site_text:
@@ -752,6 +838,7 @@ Return ONLY valid JSON, no markdown fences."""
             )
 
     print(f"[diagnosis] Step 2 done: profile={profile.name}, category={profile.category}")
+    await report("profile", {"profile": profile.model_dump()})
 
     # Step 3: Generate smart prompts + append custom prompts
     smart_prompts = await generate_smart_prompts(profile)
@@ -765,15 +852,22 @@ Return ONLY valid JSON, no markdown fences."""
     smart_prompts = smart_prompts[:50]
 
     print(f"[diagnosis] Step 3 done: {len(smart_prompts)} prompts (incl custom)")
+    await report("prompts", {"prompts": smart_prompts})
 
     # Step 4: Evaluate prompts across selected models
     results: list[PromptResult] = []
     cited_count = 0
     per_model_results: dict[str, list[dict]] = {m: [] for m in models_to_use}
 
+    # Brand forms, rank patterns and lexicons are compiled once per diagnosis
+    analyzer = BrandResponseAnalyzer(profile.name)
+
     async def eval_one(sp: dict, model_name: str, model_fn) -> tuple:
         try:
-            eval_result = await evaluate_prompt(profile.name, sp["text"], model_name, model_fn, sp.get("type", "generic"))
+            eval_result = await evaluate_prompt(
+                profile.name, sp["text"], model_name, model_fn, sp.get("type", "generic"),
+                analyzer, req.early_stop, get_request_hedger(model_name) if req.hedge else None,
+            )
             resp_text = eval_result.get("response_text", "")
             return (PromptResult(
                 prompt=sp["text"],
@@ -800,12 +894,42 @@ Return ONLY valid JSON, no markdown fences."""
 
     # Build tasks for all prompts x selected models
     tasks = []
+    tasks_by_model = {model_name: [] for model_name in models_to_use}
     for sp in smart_prompts:
         for model_name, model_fn in models_to_use.items():
-            tasks.append(eval_one(sp, model_name, model_fn))
+            task = asyncio.ensure_future(eval_one(sp, model_name, model_fn))
+            tasks.append(task)
+            tasks_by_model[model_name].append(task)
+
+    model_scores = {}
+
+    async def report_model(model_name: str, model_tasks: list):
+        # Reported as soon as this model's evaluations are done, before the others
+        model_results = await asyncio.gather(*model_tasks)
+        if not model_results:
+            return
+        model_mentioned = sum(1 for pr, *_ in model_results if pr.mentioned)
+        model_scores[model_name] = {
+            "score": int((model_mentioned / len(model_results)) * 100),
+            "mentioned": model_mentioned,
+            "total": len(model_results),
+        }
+        await report("model_score", {"model_scores": dict(model_scores)})
 
     generic_responses = []  # Collect for competitor discovery
+    if on_stage is not None:
+        await asyncio.gather(*(
+            report_model(model_name, model_tasks)
+            for model_name, model_tasks in tasks_by_model.items()
+        ))
     all_results = await asyncio.gather(*tasks)
+    if req.hedge:
+        for model_name in models_to_use:
+            stats = get_request_hedger(model_name).snapshot()
+            print(
+                f"[diagnosis] Hedging {model_name}: {stats['hedged']}/{stats['calls']} hedged, "
+                f"{stats['hedge_wins']} wins (primaries cancelled after {stats['primary_elapsed_ms']}ms)"
+            )
     for pr, has_cite, mn, resp_text, sp in all_results:
         results.append(pr)
         if has_cite:
@@ -915,6 +1039,7 @@ Return only one word: accurate/partially_accurate/inaccurate/insufficient_data""
         recommendation_position=recommendation_position,
         knowledge_accuracy=knowledge_accuracy,
     )
+    await report("score", {"score": score.model_dump()})
 
     # Step 5.5: Competitor Discovery — extract brands mentioned in generic responses
     competitors = []
@@ -922,6 +1047,7 @@ Return only one word: accurate/partially_accurate/inaccurate/insufficient_data""
         print(f"[diagnosis] Extracting competitors from {len(generic_responses)} generic responses...")
         competitors = await extract_competitors(profile.name, generic_responses, profile.category)
         print(f"[diagnosis] Found {len(competitors)} competitors")
+    await report("competitors", {"competitors": [c.model_dump() for c in competitors]})
 
     # Calculate competitor_gap now that competitors are available
     if competitors and len(competitors) >= 3:
@@ -990,7 +1116,7 @@ Return only one word: accurate/partially_accurate/inaccurate/insufficient_data""
         recommendations.append("Consider expanding evaluation to additional AI platforms for cross-platform insights")
 
     elapsed = round(time.time() - start_time, 1)
-    diagnosis_id = str(uuid4())
+    diagnosis_id = diagnosis_id or str(uuid4())
 
     response = DiagnosisResponse(
         id=diagnosis_id,
@@ -1004,38 +1130,101 @@ Return only one word: accurate/partially_accurate/inaccurate/insufficient_data""
         evaluation_time_seconds=elapsed,
     )
 
-    # Step 7: Save to database
+    return response
+
+
+async def save_diagnosis(db: AsyncSession, response: DiagnosisResponse):
+    """Store a finished diagnosis as a DiagnosisRecord. Failures are logged, not raised."""
+    score = response.score
     try:
         record = DiagnosisRecord(
-            id=diagnosis_id,
-            brand_name=profile.name,
-            domain=profile.domain,
-            category=profile.category,
-            composite_score=composite,
-            visibility_score=visibility,
-            citation_score=citation,
-            representation_score=representation,
-            intent_score=intent_score,
-            total_prompts=len(smart_prompts),
+            id=response.id,
+            brand_name=response.brand.name,
+            domain=response.brand.domain,
+            category=response.brand.category,
+            composite_score=score.composite,
+            visibility_score=score.visibility,
+            citation_score=score.citation,
+            representation_score=score.representation,
+            intent_score=score.intent,
+            total_prompts=score.total_prompts,
             mentioned_count=score.mentioned_count,
-            models_used=models_used,
-            results_json=[r.model_dump() for r in results],
-            insights=insights,
-            recommendations=recommendations[:5],
-            competitors_json=[c.model_dump() for c in competitors],
-            per_model_scores=per_model_scores if per_model_scores else None,
+            models_used=score.models_used,
+            results_json=[r.model_dump() for r in response.results],
+            insights=response.insights,
+            recommendations=response.recommendations,
+            competitors_json=[c.model_dump() for c in response.competitors],
+            per_model_scores=score.per_model_scores if score.per_model_scores else None,
             created_at=datetime.utcnow(),
         )
         db.add(record)
         await db.commit()
-        print(f"[diagnosis] Saved diagnosis {diagnosis_id} to DB")
+        print(f"[diagnosis] Saved diagnosis {response.id} to DB")
     except Exception as e:
         print(f"[diagnosis] Failed to save to DB: {e}")
         await db.rollback()
 
+
+@router.post("", response_model=DiagnosisResponse)
+async def diagnose_brand(req: DiagnosisRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Smart brand diagnosis: crawl → profile → generate prompts → evaluate → score → save.
+
+    Runs inside the request; POST /diagnosis/jobs runs the same pipeline in
+    the background.
+    """
+    response = await run_diagnosis(req)
+    await save_diagnosis(db, response)
     return response
 
 
+@router.post("/jobs", status_code=202)
+async def create_diagnosis_job(req: DiagnosisRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Queue a diagnosis and return its ID immediately.
+
+    Poll GET /diagnosis/jobs/{id} for partial results; the finished diagnosis
+    is also available at GET /diagnosis/{id}.
+    """
+    select_models(req)  # Reject bad requests before queueing
+    diagnosis_id = str(uuid4())
+    await enqueue_job(
+        db,
+        "diagnosis",
+        {"diagnosis_id": diagnosis_id, **req.model_dump()},
+        ref_id=diagnosis_id,
+    )
+    await db.commit()
+    return {"id": diagnosis_id, "status": "pending"}
+
+
+@router.get("/jobs/{diagnosis_id}")
+async def get_diagnosis_job(diagnosis_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Status and partial results of a queued diagnosis.
+
+    `stage` names the last finished pipeline stage; `partial` holds what is
+    known so far (profile, prompts, model_scores, score, competitors). Once
+    completed, `result` is the full diagnosis response.
+    """
+    job = await get_latest_job(db, "diagnosis", diagnosis_id)
+    if not job:
+        raise HTTPException(404, "Diagnosis job not found")
+
+    partial = dict(job.result or {})
+    result = partial.pop("response", None)
+    return {
+        "id": diagnosis_id,
+        "status": job.status,
+        "stage": partial.pop("stage", None),
+        "partial": partial,
+        "result": result,
+        "error": job.error_message if job.status == "failed" else None,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+    }
+
+
 # ---------------------------------------------------------------------------
 # History & retrieval endpoints
 # ---------------------------------------------------------------------------
@@ -2,23 +2,87 @@
 API routes for Evaluation management.
 """
 
-from typing import List
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.database import get_db
+from ...core.config import settings
+from ...core.database import get_db, get_session_factory
+from ...core.pagination import keyset_paginate, split_page
 from ...models.evaluation import EvaluationRun, EvaluationResult
+from ...services.event_broker import Event, get_event_broker
+from ...services.job_queue import enqueue_job, get_active_job, get_latest_job
 from ...schemas.evaluation_schemas import (
     EvaluationRunCreate,
     EvaluationRunResponse,
     EvaluationRunDetailResponse,
     EvaluationResultResponse,
+    EvaluationResultPageResponse,
 )
 
 router = APIRouter()
 
+# Run statuses after which no more events are published
+FINAL_STATUSES = {"completed", "failed"}
+
+RESULT_FIELDS = [column.name for column in EvaluationResult.__table__.columns]
+# Large text columns left out of result listings unless asked for with fields=
+HEAVY_RESULT_FIELDS = {"response_text", "mention_context", "description_text"}
+# Unique sort key for keyset pagination of a run's results
+RESULT_SORT_KEY = ["brand_id", "model_name", "id"]
+
+
+def _result_columns(fields: Optional[str]) -> list:
+    """Columns selected for a fields= projection ("*" selects all)."""
+    if not fields:
+        names = [name for name in RESULT_FIELDS if name not in HEAVY_RESULT_FIELDS]
+    elif fields.strip() == "*":
+        names = RESULT_FIELDS
+    else:
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - set(RESULT_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+            )
+        # The sort key is always returned so clients can tell rows apart
+        requested.update(RESULT_SORT_KEY)
+        names = [name for name in RESULT_FIELDS if name in requested]
+    return [EvaluationResult.__table__.c[name] for name in names]
+
+
+async def _fetch_results_page(
+    db: AsyncSession,
+    run_id: str,
+    fields: Optional[str],
+    limit: int,
+    cursor: Optional[str] = None,
+    brand_id: Optional[str] = None,
+    model_name: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """One keyset page of a run's results, projected to the requested fields."""
+    query = select(*_result_columns(fields)).where(
+        EvaluationResult.evaluation_run_id == run_id
+    )
+    if brand_id:
+        query = query.where(EvaluationResult.brand_id == brand_id)
+    if model_name:
+        query = query.where(EvaluationResult.model_name == model_name)
+
+    key_columns = [EvaluationResult.__table__.c[name] for name in RESULT_SORT_KEY]
+    try:
+        query = keyset_paginate(query, key_columns, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    result = await db.execute(query)
+    rows, next_cursor = split_page(result.all(), RESULT_SORT_KEY, limit)
+    return [dict(row._mapping) for row in rows], next_cursor
+
 
 @router.get("", response_model=List[EvaluationRunResponse])
 async def list_evaluation_runs(
@@ -46,10 +110,15 @@ async def list_evaluation_runs(
 async def get_evaluation_run(
     run_id: str,
     workspace_id: str = Query(..., description="Workspace ID"),
+    fields: Optional[str] = Query(None, description="Comma-separated result fields, or *"),
+    limit: int = Query(100, ge=0, le=1000, description="Results to include"),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get a specific evaluation run with results.
+    Get a specific evaluation run with the first page of its results.
+
+    Results are projected like GET /{run_id}/results; follow next_cursor
+    there for the remaining pages.
     """
     # Get evaluation run
     result = await db.execute(
@@ -63,16 +132,14 @@ async def get_evaluation_run(
     if not run:
         raise HTTPException(status_code=404, detail="Evaluation run not found")
 
-    # Get results
-    results_query = select(EvaluationResult).where(
-        EvaluationResult.evaluation_run_id == run_id
-    )
-    results_result = await db.execute(results_query)
-    results = results_result.scalars().all()
+    results, next_cursor = [], None
+    if limit:
+        results, next_cursor = await _fetch_results_page(db, run_id, fields, limit)
 
     return EvaluationRunDetailResponse(
         **run.__dict__,
         results=results,
+        next_cursor=next_cursor,
     )
 
 
@@ -80,13 +147,12 @@ async def get_evaluation_run(
 async def create_evaluation_run(
     run_data: EvaluationRunCreate,
     workspace_id: str = Query(..., description="Workspace ID"),
-    background_tasks: BackgroundTasks = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Create a new evaluation run.
 
-    This will start a background task to execute the evaluation.
+    The run is queued as a background job and executed by a job worker.
     """
     run = EvaluationRun(
         id=str(uuid4()),
@@ -99,57 +165,200 @@ async def create_evaluation_run(
     )
 
     db.add(run)
+    # Run and job are committed together so a job never points at a missing run
+    await enqueue_job(
+        db,
+        "evaluation_run",
+        {
+            "run_id": run.id,
+            "brand_ids": run_data.brand_ids,
+            "models": run_data.models,
+            "prompt_ids": run_data.prompt_ids,
+            "share_responses": run_data.share_responses,
+            "early_stop": run_data.early_stop,
+        },
+        ref_id=run.id,
+    )
     await db.commit()
     await db.refresh(run)
 
-    # TODO: Start background evaluation task
-    # if background_tasks:
-    #     background_tasks.add_task(
-    #         run_evaluation,
-    #         run_id=run.id,
-    #         brand_ids=run_data.brand_ids,
-    #         models=run_data.models,
-    #         prompt_ids=run_data.prompt_ids,
-    #     )
+    return run
+
+
+@router.post("/{run_id}/resume", response_model=EvaluationRunResponse, status_code=202)
+async def resume_evaluation_run(
+    run_id: str,
+    workspace_id: str = Query(..., description="Workspace ID"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Resume a failed or interrupted evaluation run.
+
+    Only (brand, prompt, model) triples without a stored result are evaluated.
+    """
+    result = await db.execute(
+        select(EvaluationRun).where(
+            EvaluationRun.id == run_id,
+            EvaluationRun.workspace_id == workspace_id,
+        )
+    )
+    run = result.scalar_one_or_none()
+
+    if not run:
+        raise HTTPException(status_code=404, detail="Evaluation run not found")
+    if run.status == "completed":
+        raise HTTPException(status_code=409, detail="Evaluation run already completed")
+    if await get_active_job(db, "evaluation_run", run_id):
+        raise HTTPException(status_code=409, detail="Evaluation run is already queued or running")
+
+    previous = await get_latest_job(db, "evaluation_run", run_id)
+    if previous is None:
+        raise HTTPException(status_code=409, detail="Evaluation run has no job to resume")
+
+    await enqueue_job(db, "evaluation_run", previous.payload, ref_id=run_id)
+    run.status = "pending"
+    run.error_message = None
+    await db.commit()
+    await db.refresh(run)
 
     return run
 
 
-@router.get("/{run_id}/results", response_model=List[EvaluationResultResponse])
+async def _read_run_state(run_id: str) -> tuple:
+    """Status and progress of a run, in a short-lived session of its own."""
+    async with get_session_factory()() as session:
+        result = await session.execute(
+            select(EvaluationRun.status, EvaluationRun.progress).where(EvaluationRun.id == run_id)
+        )
+        row = result.one()
+        return row.status, row.progress
+
+
+@router.get("/{run_id}/events")
+async def stream_evaluation_events(
+    run_id: str,
+    workspace_id: str = Query(..., description="Workspace ID"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream a run's progress as Server-Sent Events.
+
+    Event types: status, progress, result (one per evaluated brand/prompt/model
+    triple), scorecard and retrying (an attempt failed and the job queue will
+    run it again; the run is pending until then). The stream opens with the
+    run's current status and closes once the run completes or fails with no
+    attempts left. Runs executed by a worker in another process are followed
+    by polling only their status and progress.
+    """
+    result = await db.execute(
+        select(EvaluationRun.status, EvaluationRun.progress).where(
+            EvaluationRun.id == run_id,
+            EvaluationRun.workspace_id == workspace_id,
+        )
+    )
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Evaluation run not found")
+
+    broker = get_event_broker()
+
+    async def event_stream():
+        async with broker.subscribe(run_id) as queue:
+            status, progress = row.status, row.progress
+            yield Event("status", {"status": status, "progress": progress}).encode()
+
+            while status not in FINAL_STATUSES:
+                publishing = broker.is_publishing(run_id)
+                timeout = (
+                    settings.EVENT_STREAM_KEEPALIVE if publishing
+                    else settings.EVENT_STREAM_POLL_INTERVAL
+                )
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    if publishing:
+                        yield ": keep-alive\n\n"
+                        continue
+                    # No publisher here (queued, or run by another process)
+                    state = await _read_run_state(run_id)
+                    if state == (status, progress):
+                        yield ": keep-alive\n\n"
+                        continue
+                    event_type = "status" if state[0] != status else "progress"
+                    status, progress = state
+                    event = Event(event_type, {"status": status, "progress": progress})
+
+                yield event.encode()
+                if event.type in ("status", "retrying"):
+                    status = event.data["status"]
+                elif event.type == "progress":
+                    progress = event.data["progress"]
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{run_id}/results", response_model=EvaluationResultPageResponse)
 async def get_evaluation_results(
     run_id: str,
     workspace_id: str = Query(..., description="Workspace ID"),
     brand_id: str = Query(None, description="Filter by brand"),
     model_name: str = Query(None, description="Filter by AI model"),
+    fields: Optional[str] = Query(None, description="Comma-separated result fields, or *"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get evaluation results for a specific run.
+    Get one page of evaluation results for a specific run.
+
+    Results are ordered by (brand_id, model_name, id). Without fields=,
+    response_text, mention_context and description_text are left out; fetch
+    them per result from /{run_id}/results/{result_id} or ask with fields=.
+    Follow next_cursor for the next page; it is null on the last page.
     """
     # Verify run exists and belongs to workspace
     run_result = await db.execute(
-        select(EvaluationRun).where(
+        select(EvaluationRun.id).where(
             EvaluationRun.id == run_id,
             EvaluationRun.workspace_id == workspace_id,
         )
     )
-    run = run_result.scalar_one_or_none()
-
-    if not run:
+    if run_result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Evaluation run not found")
 
-    # Get results
-    query = select(EvaluationResult).where(
-        EvaluationResult.evaluation_run_id == run_id
+    results, next_cursor = await _fetch_results_page(
+        db, run_id, fields, limit, cursor, brand_id, model_name
     )
+    return EvaluationResultPageResponse(results=results, next_cursor=next_cursor)
 
-    if brand_id:
-        query = query.where(EvaluationResult.brand_id == brand_id)
 
-    if model_name:
-        query = query.where(EvaluationResult.model_name == model_name)
+@router.get("/{run_id}/results/{result_id}", response_model=EvaluationResultResponse)
+async def get_evaluation_result(
+    run_id: str,
+    result_id: str,
+    workspace_id: str = Query(..., description="Workspace ID"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get one evaluation result with its full response text.
+    """
+    result = await db.execute(
+        select(EvaluationResult)
+        .join(EvaluationRun, EvaluationResult.evaluation_run_id == EvaluationRun.id)
+        .where(
+            EvaluationResult.id == result_id,
+            EvaluationResult.evaluation_run_id == run_id,
+            EvaluationRun.workspace_id == workspace_id,
+        )
+    )
+    evaluation_result = result.scalar_one_or_none()
 
-    result = await db.execute(query)
-    results = result.scalars().all()
+    if not evaluation_result:
+        raise HTTPException(status_code=404, detail="Evaluation result not found")
 
-    return results
+    return evaluation_result
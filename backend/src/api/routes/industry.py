@@ -4,15 +4,19 @@ Supports multi-industry filtering via category parameter.
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select, func, case, and_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.database import get_db
+from ...core.pagination import keyset_paginate, split_page
 from ...models.brand import Brand
 from ...models.prompt import Prompt
 from ...models.evaluation import EvaluationResult
 from ...models.scorecard import ScoreCard
+from ...services.count_cache import count_rows, normalize_filter
+from ...services.score_queries import latest_score_cards
+from ...services.search import get_search_backend
 
 router = APIRouter()
 
@@ -98,26 +102,27 @@ async def get_brand_rankings(
     category: Optional[str] = Query(None, description="Filter by industry category"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Brand leaderboard with all score dimensions."""
+    """Brand leaderboard of each brand's latest scores, with all score dimensions."""
+    latest = latest_score_cards()
     order_map = {
-        "composite": ScoreCard.composite_score,
-        "visibility": ScoreCard.visibility_score,
-        "citation": ScoreCard.citation_score,
-        "representation": ScoreCard.representation_score,
-        "intent": ScoreCard.intent_score,
-        "mentions": ScoreCard.total_mentions,
+        "composite": latest.composite_score,
+        "visibility": latest.visibility_score,
+        "citation": latest.citation_score,
+        "representation": latest.representation_score,
+        "intent": latest.intent_score,
+        "mentions": latest.total_mentions,
     }
-    order_col = order_map.get(sort_by, ScoreCard.composite_score)
+    order_col = order_map.get(sort_by, latest.composite_score)
 
     query = (
         select(
             Brand.name, Brand.domain, Brand.category,
-            ScoreCard.composite_score, ScoreCard.visibility_score,
-            ScoreCard.citation_score, ScoreCard.representation_score,
-            ScoreCard.intent_score, ScoreCard.total_mentions,
-            ScoreCard.evaluation_count,
+            latest.composite_score, latest.visibility_score,
+            latest.citation_score, latest.representation_score,
+            latest.intent_score, latest.total_mentions,
+            latest.evaluation_count,
         )
-        .join(ScoreCard, ScoreCard.brand_id == Brand.id)
+        .join(latest, latest.brand_id == Brand.id)
     )
 
     conditions = _category_filter(category)
@@ -310,9 +315,20 @@ async def get_raw_data(
     category: Optional[str] = Query(None, description="Filter by industry category"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=10, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; overrides page"),
+    count_mode: str = Query("exact", pattern="^(exact|estimated)$", description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Raw evaluation data with filtering and pagination."""
+    """
+    Raw evaluation data with filtering and pagination; searches return best matches first.
+
+    Pages are ordered by a unique key (relevance, brand, intent, result ID).
+    Following next_cursor is constant-time at any depth; page numbers still
+    work but get slower the deeper they go.
+    """
+    brand, intent, sentiment, search, category = (
+        normalize_filter(value) for value in (brand, intent, sentiment, search, category)
+    )
     query = (
         select(
             Brand.name.label("brand_name"),
@@ -327,6 +343,7 @@ async def get_raw_data(
             EvaluationResult.response_time_ms,
             EvaluationResult.is_cited,
             EvaluationResult.representation_score,
+            EvaluationResult.id,
         )
         .join(Brand, Brand.id == EvaluationResult.brand_id)
     )
@@ -342,21 +359,34 @@ async def get_raw_data(
         conditions.append(EvaluationResult.is_mentioned == mentioned)
     if sentiment:
         conditions.append(EvaluationResult.sentiment == sentiment)
-    if search:
-        conditions.append(
-            EvaluationResult.prompt_text.ilike(f"%{search}%")
-            | EvaluationResult.response_text.ilike(f"%{search}%")
-        )
     if conditions:
         query = query.where(and_(*conditions))
+    sort_columns = [Brand.name, EvaluationResult.intent_category, EvaluationResult.id]
+    key_names = ["brand_name", "intent_category", "id"]
+    if search:
+        query, rank = get_search_backend(db.bind.dialect.name).filter_results(query, search)
+        if rank is not None:
+            query = query.add_columns(rank.label("search_rank"))
+            sort_columns.insert(0, rank)
+            key_names.insert(0, "search_rank")
+
+    total, estimated = await count_rows(
+        db, query, "industry_raw",
+        {
+            "brand": brand, "intent": intent, "mentioned": mentioned,
+            "sentiment": sentiment, "search": search, "category": category,
+        },
+        tables=("evaluation_results", "brands"), mode=count_mode,
+    )
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
-
-    offset = (page - 1) * page_size
-    query = query.order_by(Brand.name, EvaluationResult.intent_category).offset(offset).limit(page_size)
+    try:
+        query = keyset_paginate(query, sort_columns, cursor, page_size)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not cursor:
+        query = query.offset((page - 1) * page_size)
     result = await db.execute(query)
-    rows = result.all()
+    rows, next_cursor = split_page(result.all(), key_names, page_size)
 
     return {
         "data": [
@@ -373,6 +403,8 @@ async def get_raw_data(
         "pagination": {
             "page": page, "page_size": page_size,
             "total": total, "total_pages": (total + page_size - 1) // page_size,
+            "total_estimated": estimated,
+            "next_cursor": next_cursor,
         },
         "filters": {
             "brand": brand, "intent": intent, "mentioned": mentioned,
@@ -5,12 +5,12 @@ API routes for Public Dataset Insights.
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.database import get_db
-from ...models.scorecard import ScoreCard
 from ...models.brand import Brand
+from ...services.score_queries import latest_score_cards
 from ...services.public_datasets import DatasetFetcher, BrandExtractor, InsightPreprocessor
 
 
@@ -324,27 +324,8 @@ async def get_industry_stats(
     """
     Get aggregated industry statistics from scored brands.
     """
-    # Get latest score per brand via subquery
-    subquery = (
-        select(
-            ScoreCard.brand_id,
-            func.max(ScoreCard.created_at).label("max_created_at"),
-        )
-        .join(Brand, Brand.id == ScoreCard.brand_id)
-        .where(Brand.workspace_id == workspace_id)
-        .group_by(ScoreCard.brand_id)
-        .subquery()
-    )
-
-    query = (
-        select(ScoreCard, Brand.name)
-        .join(Brand, Brand.id == ScoreCard.brand_id)
-        .join(
-            subquery,
-            (ScoreCard.brand_id == subquery.c.brand_id)
-            & (ScoreCard.created_at == subquery.c.max_created_at),
-        )
-    )
+    latest = latest_score_cards(workspace_id=workspace_id)
+    query = select(latest, Brand.name).join(Brand, Brand.id == latest.brand_id)
 
     result = await db.execute(query)
     rows = result.all()
@@ -7,6 +7,13 @@ from typing import List
 from fastapi import APIRouter
 
 from src.core.config import settings
+from src.services.ai_clients import (
+    get_response_cache,
+    get_rate_limiter,
+    get_circuit_breaker,
+    executor_stats,
+    hedging_stats,
+)
 
 
 router = APIRouter()
@@ -22,11 +29,15 @@ async def list_models() -> List[dict]:
     - id: Model identifier for evaluation
     - available: Whether the API key is configured
     - model: Specific model version
+    - provider: Provider the model is called through
+    - health: Circuit breaker state (closed, open or half_open) and recent
+      error rate of the provider
     """
     models = [
         {
             "id": "Gemini",
             "name": "Google Gemini",
+            "provider": "gemini",
             "model": settings.GOOGLE_MODEL,
             "available": bool(settings.GOOGLE_API_KEY),
             "description": "Google's multimodal AI model",
@@ -35,6 +46,7 @@ async def list_models() -> List[dict]:
         {
             "id": "ChatGPT",
             "name": "OpenAI ChatGPT",
+            "provider": "openai",
             "model": settings.OPENAI_MODEL,
             "available": bool(settings.OPENAI_API_KEY),
             "description": "OpenAI's GPT-4 language model",
@@ -43,6 +55,7 @@ async def list_models() -> List[dict]:
         {
             "id": "Claude",
             "name": "Anthropic Claude",
+            "provider": "anthropic",
             "model": settings.ANTHROPIC_MODEL,
             "available": bool(settings.ANTHROPIC_API_KEY),
             "description": "Anthropic's AI assistant",
@@ -51,17 +64,57 @@ async def list_models() -> List[dict]:
         {
             "id": "Perplexity",
             "name": "Perplexity AI",
+            "provider": "perplexity",
             "model": "pplx-70b-online",
             "available": bool(settings.PERPLEXITY_API_KEY),
             "description": "Real-time search AI",
             "icon": "P",
         },
     ]
+    for model in models:
+        breaker = get_circuit_breaker(model["provider"])
+        model["health"] = breaker.snapshot() if breaker else None
     return models
 
 
 @router.get("/available")
 async def list_available_models() -> List[dict]:
-    """List only models that have API keys configured."""
+    """
+    List only models that have API keys configured and are healthy.
+
+    Models whose provider circuit is open are left out until it recovers;
+    half-open ones are listed since they accept a probe call.
+    """
     all_models = await list_models()
-    return [m for m in all_models if m["available"]]
+    return [
+        m for m in all_models
+        if m["available"] and not (m["health"] and m["health"]["state"] == "open")
+    ]
+
+
+@router.get("/cache")
+async def get_cache_stats() -> dict:
+    """LLM response cache hit/miss counters since process start."""
+    cache = get_response_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get("/rate-limits")
+async def get_rate_limits() -> dict:
+    """Current adaptive rate-limit state for each configured provider."""
+    limiters = [get_rate_limiter(provider) for provider in settings.PROVIDER_RATE_LIMITS]
+    return {"providers": [limiter.snapshot() for limiter in limiters if limiter]}
+
+
+@router.get("/hedging")
+async def get_hedging_stats() -> dict:
+    """Hedged diagnosis calls per provider: hedge rate, wins and latency saved."""
+    return {"providers": hedging_stats()}
+
+
+@router.get("/executors")
+async def get_executor_stats() -> dict:
+    """Queue depth of the dedicated executors for blocking SDK calls."""
+    return {"executors": executor_stats()}
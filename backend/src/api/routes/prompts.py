@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.database import get_db
 from ...models.prompt import Prompt
+from ...services.count_cache import count_rows, normalize_filter
 from ...schemas.prompt_schemas import (
     PromptCreate,
     PromptUpdate,
@@ -45,9 +46,11 @@ async def list_prompts(
     page_size: int = Query(50, ge=1, le=200),
     category: Optional[str] = Query(None, description="Filter by intent category"),
     search: Optional[str] = Query(None, description="Search prompt text"),
+    count_mode: str = Query("exact", pattern="^(exact|estimated)$", description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
 ):
     """List all prompts with optional filters and pagination."""
+    category, search = normalize_filter(category), normalize_filter(search)
     query = select(Prompt)
 
     if category:
@@ -56,15 +59,10 @@ async def list_prompts(
     if search:
         query = query.where(Prompt.text.ilike(f"%{search}%"))
 
-    # Total count
-    count_query = select(func.count(Prompt.id))
-    if category:
-        count_query = count_query.where(Prompt.intent_category == category)
-    if search:
-        count_query = count_query.where(Prompt.text.ilike(f"%{search}%"))
-
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    total, estimated = await count_rows(
+        db, query, "prompts", {"category": category, "search": search},
+        tables=("prompts",), mode=count_mode,
+    )
 
     # Paginate
     offset = (page - 1) * page_size
@@ -79,6 +77,7 @@ async def list_prompts(
         total=total,
         page=page,
         page_size=page_size,
+        total_estimated=estimated,
     )
 
 
@@ -12,6 +12,7 @@ from ...models.scorecard import ScoreCard
 from ...models.brand import Brand
 from ...models.evaluation import EvaluationRun
 from ...schemas.score_schemas import ScoreCardResponse, ScoreHistoryResponse
+from ...services.score_queries import latest_score_cards
 
 router = APIRouter()
 
@@ -102,31 +103,7 @@ async def get_workspace_scores(
     If latest_only=True, returns only the most recent score for each brand.
     """
     if latest_only:
-        # Subquery to get latest score ID per brand
-        from sqlalchemy import func
-
-        subquery = (
-            select(
-                ScoreCard.brand_id,
-                func.max(ScoreCard.created_at).label("max_created_at"),
-            )
-            .join(Brand, Brand.id == ScoreCard.brand_id)
-            .where(Brand.workspace_id == workspace_id)
-            .group_by(ScoreCard.brand_id)
-            .subquery()
-        )
-
-        # Get scores matching the latest created_at for each brand
-        query = (
-            select(ScoreCard)
-            .join(Brand, Brand.id == ScoreCard.brand_id)
-            .join(
-                subquery,
-                (ScoreCard.brand_id == subquery.c.brand_id)
-                & (ScoreCard.created_at == subquery.c.max_created_at),
-            )
-            .where(Brand.workspace_id == workspace_id)
-        )
+        query = select(latest_score_cards(workspace_id=workspace_id))
     else:
         # Get all scores for workspace
         query = (
@@ -226,28 +203,10 @@ async def get_brand_comparison(
     if not id_list:
         return []
 
-    subquery = (
-        select(
-            ScoreCard.brand_id,
-            func.max(ScoreCard.created_at).label("max_created_at"),
-        )
-        .join(Brand, Brand.id == ScoreCard.brand_id)
-        .where(
-            Brand.workspace_id == workspace_id,
-            ScoreCard.brand_id.in_(id_list),
-        )
-        .group_by(ScoreCard.brand_id)
-        .subquery()
-    )
-
+    latest = latest_score_cards(workspace_id=workspace_id, brand_ids=id_list)
     query = (
-        select(ScoreCard, Brand.name, Brand.category)
-        .join(Brand, Brand.id == ScoreCard.brand_id)
-        .join(
-            subquery,
-            (ScoreCard.brand_id == subquery.c.brand_id)
-            & (ScoreCard.created_at == subquery.c.max_created_at),
-        )
+        select(latest, Brand.name, Brand.category)
+        .join(Brand, Brand.id == latest.brand_id)
     )
 
     result = await db.execute(query)
@@ -50,6 +50,15 @@ class Settings(BaseSettings):
     AI_REQUEST_TIMEOUT: int = 30  # seconds
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 2  # seconds
+    HTTP_MAX_CONNECTIONS: int = 100  # Per-provider pooled connections
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    GEMINI_EXECUTOR_WORKERS: int = 8  # Threads for the legacy (blocking) Gemini SDK
+
+    # LLM Response Cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "data/llm_cache.sqlite3"
+    LLM_CACHE_TTL_SECONDS: int = 86400  # 24 hours
+    LLM_CACHE_MAX_ENTRIES: int = 50000
 
     # Stripe
     STRIPE_SECRET_KEY: Optional[str] = None
@@ -75,7 +84,47 @@ class Settings(BaseSettings):
     # Evaluation
     DEFAULT_INTENT_POOL_PATH: str = "data/intent_pool.json"
     DEFAULT_BRANDS_PATH: str = "data/brands_database.json"
-    MAX_CONCURRENT_EVALUATIONS: int = 5
+    MAX_CONCURRENT_EVALUATIONS: int = 5  # Concurrent AI calls per evaluation run
+    PROVIDER_MAX_CONCURRENCY: dict[str, int] = {"openai": 5, "gemini": 5}  # Per-provider caps
+    STREAM_STOP_MAX_RANK: int = 10  # Early-stop streams once a list passes this rank
+    RESULT_BATCH_SIZE: int = 200  # Evaluation results per bulk insert
+    RESULT_FLUSH_INTERVAL: float = 5.0  # seconds a buffered result may wait
+    PROVIDER_RATE_LIMITS: dict[str, dict[str, int]] = {  # Requests/tokens per minute quotas
+        "openai": {"rpm": 500, "tpm": 200000},
+        "gemini": {"rpm": 1000, "tpm": 1000000},
+        "grok": {"rpm": 480},
+        "perplexity": {"rpm": 50},
+    }
+    CIRCUIT_BREAKER_ENABLED: bool = True  # Fail fast on providers that keep failing
+    CIRCUIT_FAILURE_RATE: float = 0.5  # Open when this fraction of recent calls failed
+    CIRCUIT_SLOW_CALL_SECONDS: float = 60.0  # Calls slower than this count against health
+    CIRCUIT_MIN_CALLS: int = 5  # Recent calls needed before the breaker can open
+    CIRCUIT_WINDOW_SECONDS: float = 60.0  # How far back calls are considered
+    CIRCUIT_OPEN_SECONDS: float = 30.0  # Cool-down before a probe call is let through
+    CIRCUIT_MAX_DEFER: float = 300.0  # seconds evaluation work waits on an open breaker
+    HEDGE_PERCENTILE: float = 0.9  # Hedge diagnosis calls slower than this latency percentile
+    HEDGE_BUDGET: float = 0.1  # Most duplicate calls, as a fraction of hedged-path calls
+    HEDGE_MIN_SAMPLES: int = 20  # Latencies observed before hedging starts
+    HEDGE_MIN_DELAY: float = 0.5  # seconds
+
+    # Background Jobs
+    JOB_WORKER_ENABLED: bool = True  # Run a worker inside the API process
+    JOB_WORKER_CONCURRENCY: int = 1  # Jobs executed at once per worker
+    JOB_POLL_INTERVAL: float = 2.0  # seconds between polls when idle
+    JOB_HEARTBEAT_INTERVAL: int = 15  # seconds
+    JOB_STALE_AFTER: int = 90  # Reclaim running jobs without a heartbeat for this long
+    JOB_MAX_ATTEMPTS: int = 3
+
+    # Run Event Streams
+    EVENT_STREAM_KEEPALIVE: float = 15.0  # seconds between SSE keep-alive comments
+    EVENT_STREAM_POLL_INTERVAL: float = 5.0  # DB poll when the run executes in another process
+
+    # Search
+    SEARCH_BACKEND: str = "auto"  # "auto" (FTS5 / tsvector by database) or "like"
+
+    # Listing Totals
+    COUNT_CACHE_TTL: float = 60.0  # seconds; bounds staleness from other processes' writes
+    COUNT_CACHE_MAX_ENTRIES: int = 1000
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -76,6 +76,11 @@ def _get_session_factory() -> async_sessionmaker:
     return _session_factory
 
 
+def get_session_factory() -> async_sessionmaker:
+    """Session factory for code that runs outside a request (e.g. job workers)."""
+    return _get_session_factory()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions."""
     factory = _get_session_factory()
@@ -96,6 +101,16 @@ async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+        # Full-text search tables and indexes
+        from ..services.search import get_search_backend
+        await conn.run_sync(get_search_backend(engine.dialect.name).setup)
+
+        # Latest-scorecard projection: sync triggers, then repair anything
+        # written before they existed
+        from ..services.score_queries import backfill_latest_score_cards, setup_latest_score_card_sync
+        await conn.run_sync(setup_latest_score_card_sync)
+        await conn.run_sync(backfill_latest_score_cards)
+
 
 async def close_db():
     """Close database connections."""
@@ -0,0 +1,80 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A page is ordered by a unique tuple of columns; the cursor is the sort key
+of the last row served, so the next page starts with
+WHERE (a, b, id) > (:a, :b, :id) and uses an index range scan instead of
+scanning and discarding OFFSET rows. Cursors are opaque URL-safe strings.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and set(value) == {"dt"}:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a row's sort key as an opaque cursor."""
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or has the wrong number of values
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return [_decode_value(value) for value in values]
+
+
+def keyset_paginate(query: Select, columns: Sequence, cursor: Optional[str], limit: int) -> Select:
+    """
+    Order a query by the key columns and restrict it to one page after the cursor.
+
+    One extra row is fetched so split_page() can tell whether a next page exists.
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    if cursor:
+        values = decode_cursor(cursor, len(columns))
+        query = query.where(tuple_(*columns) > tuple_(*values))
+    return query.order_by(*columns).limit(limit + 1)
+
+
+def split_page(rows: Sequence, key_names: Sequence[str], limit: int) -> Tuple[list, Optional[str]]:
+    """
+    Trim the look-ahead row of a keyset_paginate() result.
+
+    Returns:
+        (rows of this page, cursor for the next page or None on the last page)
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, name) for name in key_names])
@@ -6,10 +6,11 @@ from .workspace import Workspace
 from .brand import Brand
 from .prompt import Prompt
 from .evaluation import EvaluationRun, EvaluationResult
-from .scorecard import ScoreCard
+from .scorecard import ScoreCard, LatestScoreCard
 from .user import User
 from .public_insight import PublicInsight, BrandMention
 from .diagnosis import DiagnosisRecord
+from .job import BackgroundJob
 
 __all__ = [
     "Workspace",
@@ -18,8 +19,10 @@ __all__ = [
     "EvaluationRun",
     "EvaluationResult",
     "ScoreCard",
+    "LatestScoreCard",
     "User",
     "PublicInsight",
     "BrandMention",
     "DiagnosisRecord",
+    "BackgroundJob",
 ]
@@ -4,7 +4,7 @@ Brand model representing kids fashion brands to track.
 
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import String, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.database import Base
@@ -14,6 +14,10 @@ class Brand(Base):
     """Brand model for tracking kids fashion brands."""
 
     __tablename__ = "brands"
+    __table_args__ = (
+        # Category filters and per-category roll-ups, ordered by name
+        Index("ix_brands_category_name", "category", "name"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     workspace_id: Mapped[str] = mapped_column(String(36), ForeignKey("workspaces.id"), nullable=False, index=True)
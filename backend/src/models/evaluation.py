@@ -4,7 +4,7 @@ Evaluation models for tracking AI evaluation runs and results.
 
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import String, DateTime, ForeignKey, Integer, Boolean, Text, JSON, Float
+from sqlalchemy import String, DateTime, ForeignKey, Integer, Boolean, Text, JSON, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.database import Base
@@ -48,6 +48,33 @@ class EvaluationResult(Base):
     """Individual evaluation result for a brand-prompt-model combination."""
 
     __tablename__ = "evaluation_results"
+    __table_args__ = (
+        # One result per (run, brand, prompt, model): a job retried or run
+        # twice must not store (and score) the same evaluation again
+        Index(
+            "uq_evaluation_results_run_brand_prompt_model",
+            "evaluation_run_id", "brand_id", "prompt_id", "model_name",
+            unique=True,
+        ),
+        # Keyset pagination of a run's results by (brand, model, id); its
+        # (run, brand, model) prefix also serves the per-run scorecard roll-up
+        Index(
+            "ix_evaluation_results_run_brand_model_id",
+            "evaluation_run_id", "brand_id", "model_name", "id",
+        ),
+        # Industry analytics: brand x intent mention rates (intent matrix,
+        # per-category intent breakdown) without touching the table rows
+        Index(
+            "ix_evaluation_results_brand_intent_mentioned",
+            "brand_id", "intent_category", "is_mentioned",
+        ),
+        # Global intent breakdown and the distinct intent list
+        Index("ix_evaluation_results_intent_mentioned", "intent_category", "is_mentioned"),
+        # Sentiment distribution of mentioned results
+        Index("ix_evaluation_results_mentioned_sentiment", "is_mentioned", "sentiment"),
+        # Distinct prompts per category
+        Index("ix_evaluation_results_brand_prompt", "brand_id", "prompt_id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     evaluation_run_id: Mapped[str] = mapped_column(String(36), ForeignKey("evaluation_runs.id"), nullable=False, index=True)
@@ -0,0 +1,48 @@
+"""
+BackgroundJob model for the database-backed job queue.
+"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, DateTime, Integer, Text, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.database import Base
+
+
+class BackgroundJob(Base):
+    """A unit of background work claimed and executed by a job worker."""
+
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        # Workers poll for the oldest runnable job
+        Index("ix_background_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # evaluation_run, ...
+    ref_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True, index=True)  # e.g. run ID
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+
+    # Status
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    # Status: pending, running, completed, failed
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Lease: the worker holding the job refreshes heartbeat_at while it runs
+    locked_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Outcome
+    result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob(id={self.id}, kind={self.kind}, status={self.status})>"
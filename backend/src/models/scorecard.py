@@ -4,7 +4,7 @@ ScoreCard model for aggregated GEO scores.
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, ForeignKey, Integer, Float, JSON
+from sqlalchemy import String, DateTime, ForeignKey, Integer, Float, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.database import Base
@@ -14,6 +14,12 @@ class ScoreCard(Base):
     """Aggregated GEO scores for a brand."""
 
     __tablename__ = "score_cards"
+    __table_args__ = (
+        # Latest scorecard per brand
+        Index("ix_score_cards_brand_created", "brand_id", "created_at"),
+        # Industry rankings ordered by score
+        Index("ix_score_cards_composite", "composite_score"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     brand_id: Mapped[str] = mapped_column(String(36), ForeignKey("brands.id"), nullable=False, index=True)
@@ -54,3 +60,20 @@ class ScoreCard(Base):
 
     def __repr__(self) -> str:
         return f"<ScoreCard(id={self.id}, brand_id={self.brand_id}, composite={self.composite_score})>"
+
+
+class LatestScoreCard(Base):
+    """Pointer from each brand to its most recent ScoreCard, kept up to date on write."""
+
+    __tablename__ = "latest_score_cards"
+
+    brand_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("brands.id", ondelete="CASCADE"), primary_key=True
+    )
+    score_card_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("score_cards.id", ondelete="CASCADE"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # of the ScoreCard
+
+    def __repr__(self) -> str:
+        return f"<LatestScoreCard(brand_id={self.brand_id}, score_card_id={self.score_card_id})>"
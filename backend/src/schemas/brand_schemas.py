@@ -59,3 +59,4 @@ class BrandListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    total_estimated: bool = False  # total is a planner estimate
@@ -2,7 +2,7 @@
 Pydantic schemas for Evaluation API endpoints.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -13,6 +13,8 @@ class EvaluationRunCreate(BaseModel):
     brand_ids: List[str] = Field(..., min_items=1)
     models: List[str] = Field(..., min_items=1)
     prompt_ids: Optional[List[str]] = None  # If None, use all prompts
+    share_responses: bool = False  # One AI call per (prompt, model), analyzed for every brand
+    early_stop: bool = False  # Stream answers and stop once every brand's rank is known
 
 
 class EvaluationRunResponse(BaseModel):
@@ -60,5 +62,12 @@ class EvaluationResultResponse(BaseModel):
 
 
 class EvaluationRunDetailResponse(EvaluationRunResponse):
-    """Schema for detailed evaluation run with results."""
-    results: List[EvaluationResultResponse]
+    """Schema for detailed evaluation run with the first page of its results."""
+    results: List[Dict[str, Any]]  # Projected result fields
+    next_cursor: Optional[str] = None  # Pass to /results?cursor= for the next page
+
+
+class EvaluationResultPageResponse(BaseModel):
+    """Schema for one page of a run's results."""
+    results: List[Dict[str, Any]]  # Projected result fields
+    next_cursor: Optional[str] = None  # Pass as cursor= for the next page; None on the last
@@ -47,6 +47,7 @@ class PromptListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    total_estimated: bool = False  # total is a planner estimate
 
 
 class PromptCategoryResponse(BaseModel):
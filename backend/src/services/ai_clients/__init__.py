@@ -2,15 +2,60 @@
 AI client implementations for different platforms.
 """
 
-from .base import BaseAIClient, AIResponse
+from .base import BaseAIClient, AIResponse, StopCondition
 from .openai_client import OpenAIClient, OpenAIClientWithRetry
 from .gemini_client import GeminiClient, GeminiClientWithRetry
+from .cache import ResponseCache, CachedAIClient, get_response_cache, with_response_cache
+from .registry import MODEL_PROVIDERS, get_ai_client, get_genai_client, close_ai_clients
+from .http_pool import init_http_clients, get_http_client, close_http_clients
+from .executor import BoundedExecutor, get_gemini_executor, executor_stats
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+    circuit_breaker_states,
+)
+from .hedging import RequestHedger, get_request_hedger, hedging_stats
+from .rate_limiter import (
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+    estimate_tokens,
+    parse_retry_after,
+    is_rate_limit_error,
+)
 
 __all__ = [
     "BaseAIClient",
     "AIResponse",
+    "StopCondition",
     "OpenAIClient",
     "OpenAIClientWithRetry",
     "GeminiClient",
     "GeminiClientWithRetry",
+    "ResponseCache",
+    "CachedAIClient",
+    "get_response_cache",
+    "with_response_cache",
+    "MODEL_PROVIDERS",
+    "get_ai_client",
+    "get_genai_client",
+    "close_ai_clients",
+    "init_http_clients",
+    "get_http_client",
+    "close_http_clients",
+    "BoundedExecutor",
+    "get_gemini_executor",
+    "executor_stats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
+    "circuit_breaker_states",
+    "RequestHedger",
+    "get_request_hedger",
+    "hedging_stats",
+    "AdaptiveRateLimiter",
+    "get_rate_limiter",
+    "estimate_tokens",
+    "parse_retry_after",
+    "is_rate_limit_error",
 ]
@@ -3,9 +3,12 @@ Base abstract class for AI model clients.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 from dataclasses import dataclass
 
+# Called with the text streamed so far; returning True ends the stream early
+StopCondition = Callable[[str], bool]
+
 
 @dataclass
 class AIResponse:
@@ -16,11 +19,17 @@ class AIResponse:
     response_time_ms: int
     raw_response: Optional[dict] = None
     error: Optional[str] = None
+    cached: bool = False  # Served from the response cache
+    rate_limited: bool = False  # Provider answered 429 / quota exhausted
+    truncated: bool = False  # Stream ended early by a stop condition
+    circuit_open: bool = False  # Rejected without a call; the provider's breaker is open
 
 
 class BaseAIClient(ABC):
     """Abstract base class for AI model clients."""
 
+    provider: str = "unknown"  # Provider identifier, e.g. "openai"
+
     def __init__(self, api_key: str, model_name: str, timeout: int = 30):
         """
         Initialize AI client.
@@ -34,14 +43,29 @@ class BaseAIClient(ABC):
         self.model_name = model_name
         self.timeout = timeout
 
+    def generation_params(self) -> dict:
+        """
+        Return the generation parameters that affect the model's output.
+
+        Used together with the prompt to key cached responses.
+        """
+        return {}
+
     @abstractmethod
-    async def chat(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
+    async def chat(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_condition: Optional[StopCondition] = None,
+    ) -> AIResponse:
         """
         Send a chat prompt to the AI model.
 
         Args:
             prompt: User prompt/query
             system_prompt: Optional system instructions
+            stop_condition: If given, the response is streamed and the stream
+                is cancelled as soon as this returns True for the text so far
 
         Returns:
             AIResponse with text and metadata
@@ -51,6 +75,10 @@ class BaseAIClient(ABC):
         """
         pass
 
+    async def close(self):
+        """Release network resources held by the client."""
+        pass
+
     @abstractmethod
     async def is_available(self) -> bool:
         """
@@ -0,0 +1,258 @@
+"""
+Persistent cache for AI model responses.
+
+Responses are stored in a local SQLite file keyed by a hash of everything
+that determines the answer (provider, model, system prompt, prompt and
+generation parameters), so re-runs and crashed runs can reuse recent
+answers instead of paying for them again.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .base import BaseAIClient, AIResponse, StopCondition
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL expiry and size-bounded eviction."""
+
+    def __init__(self, path: str, ttl_seconds: int = 86400, max_entries: int = 50000):
+        """
+        Initialize response cache.
+
+        Args:
+            path: SQLite file to store responses in
+            ttl_seconds: How long a cached response stays valid
+            max_entries: Maximum number of stored responses before the least
+                recently used ones are evicted
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Lookups are single-row primary-key reads on a local file, so they
+        # run inline instead of occupying executor threads.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at)"
+        )
+        self._size = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model_name: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build a content-addressed key for a model request."""
+        material = json.dumps(
+            [provider, model_name, system_prompt or "", prompt, params or {}],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            payload, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= 1
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+        return json.loads(payload)
+
+    def set(self, key: str, provider: str, model: str, payload: Dict[str, Any]):
+        """Store a payload, evicting the least recently used entries if full."""
+        now = time.time()
+        with self._lock:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, json.dumps(payload, ensure_ascii=False), now, now),
+            ).rowcount
+            if not inserted:
+                self._conn.execute(
+                    "UPDATE responses SET payload = ?, created_at = ?, accessed_at = ? WHERE key = ?",
+                    (json.dumps(payload, ensure_ascii=False), now, now, key),
+                )
+            self._size += inserted
+            self.writes += 1
+
+            if self._size > self.max_entries:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the least recently used ones (lock held)."""
+        removed = self._conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        self._size -= removed
+        self.evictions += removed
+
+        if self._size > self.max_entries:
+            # Evict an extra 10% so we don't evict on every insert
+            excess = self._size - self.max_entries + self.max_entries // 10
+            removed = self._conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?
+                )
+                """,
+                (excess,),
+            ).rowcount
+            self._size -= removed
+            self.evictions += removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": self._size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedAIClient(BaseAIClient):
+    """Wraps an AI client and serves repeated requests from a ResponseCache."""
+
+    def __init__(self, client: BaseAIClient, cache: ResponseCache):
+        super().__init__(client.api_key, client.model_name, client.timeout)
+        self.client = client
+        self.cache = cache
+        self.provider = client.provider
+
+    def generation_params(self) -> dict:
+        return self.client.generation_params()
+
+    async def chat(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_condition: Optional[StopCondition] = None,
+    ) -> AIResponse:
+        """
+        Return a cached response if one is fresh, otherwise call the model.
+
+        A cached full answer also satisfies a streaming request.
+        """
+        key = self.cache.make_key(
+            self.provider,
+            self.model_name,
+            system_prompt,
+            prompt,
+            self.client.generation_params(),
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return AIResponse(
+                text=cached["text"],
+                model=cached["model"],
+                response_time_ms=cached["response_time_ms"],
+                cached=True,
+            )
+
+        response = await self.client.chat(prompt, system_prompt, stop_condition)
+
+        # Never cache failures or answers cut short by a stop condition
+        if not response.error and not response.truncated:
+            self.cache.set(
+                key,
+                self.provider,
+                self.model_name,
+                {
+                    "text": response.text,
+                    "model": response.model,
+                    "response_time_ms": response.response_time_ms,
+                },
+            )
+        return response
+
+    async def close(self):
+        await self.client.close()
+
+    async def is_available(self) -> bool:
+        return await self.client.is_available()
+
+
+# Lazy process-wide cache
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the shared response cache, or None if caching is disabled."""
+    global _response_cache
+    from ...core.config import settings
+
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            path=settings.LLM_CACHE_PATH,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+    return _response_cache
+
+
+def with_response_cache(client: BaseAIClient) -> BaseAIClient:
+    """Wrap client with the shared response cache when caching is enabled."""
+    cache = get_response_cache()
+    if cache is None:
+        return client
+    return CachedAIClient(client, cache)
@@ -0,0 +1,226 @@
+"""
+Per-provider circuit breakers.
+
+A breaker watches the outcome and latency of recent calls to one provider.
+When too many of them fail (or are too slow) it opens, and calls fail fast
+instead of spending retries and backoff sleeps on a dead endpoint. After a
+cool-down it lets a single probe call through (half-open); a successful
+probe closes it again, a failed one re-opens it.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """A call was rejected because the provider's breaker is open."""
+
+    def __init__(self, provider: str, message: str = ""):
+        self.provider = provider
+        super().__init__(message or f"{provider} circuit open")
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker driven by error rate and latency."""
+
+    def __init__(
+        self,
+        provider: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 30.0,
+        slow_rate_threshold: float = 0.8,
+        min_calls: int = 5,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            provider: Provider identifier (e.g. "openai")
+            failure_rate_threshold: Open when this fraction of recent calls failed
+            slow_call_seconds: Successful calls slower than this count as slow
+            slow_rate_threshold: Open when this fraction of recent calls was slow
+            min_calls: Calls needed in the window before the rates are judged
+            window_seconds: How far back calls are considered
+            open_seconds: Time spent open before a probe is allowed
+            half_open_max_calls: Probe calls allowed at once while half-open
+        """
+        self.provider = provider
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate_threshold = slow_rate_threshold
+        self.min_calls = max(1, min_calls)
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()  # (time, failed, slow)
+        self._probes = 0
+        self._probe_started = 0.0
+
+        self.opened_count = 0
+        self.rejected_count = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open once its cool-down ends."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def _probe_slot_free(self, now: float) -> bool:
+        # A probe whose caller vanished (e.g. was cancelled) must not block
+        # the breaker forever
+        return (
+            self._probes < self.half_open_max_calls
+            or now - self._probe_started >= self.open_seconds
+        )
+
+    def available(self) -> bool:
+        """Whether a call made now would be let through."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        return state == HALF_OPEN and self._probe_slot_free(time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Ask to make a call. Every allowed call must be followed by
+        record_success() or record_failure().
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        now = time.monotonic()
+        if state == HALF_OPEN and self._probe_slot_free(now):
+            if self._probes >= self.half_open_max_calls:
+                self._probes = 0
+            self._probes += 1
+            self._probe_started = now
+            return True
+        self.rejected_count += 1
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    async def wait_until_available(self, max_wait: float) -> bool:
+        """
+        Sleep while the breaker would reject calls, up to max_wait seconds.
+
+        Returns:
+            True if the breaker lets calls through again
+        """
+        deadline = time.monotonic() + max_wait
+        while not self.available():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(max(self.retry_after(), 0.5), remaining))
+        return True
+
+    def _open(self, now: float):
+        self._state = OPEN
+        self._opened_at = now
+        self._calls.clear()
+        self.opened_count += 1
+        print(f"[circuit] {self.provider} circuit opened for {self.open_seconds:.0f}s")
+
+    def _record(self, failed: bool, slow: bool):
+        now = time.monotonic()
+        state = self.state
+        if state == HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+            if failed or slow:
+                self._open(now)
+            else:
+                self._state = CLOSED
+                self._calls.clear()
+                print(f"[circuit] {self.provider} circuit closed")
+            return
+        if state == OPEN:
+            # Late result of a call started before the breaker opened
+            return
+
+        self._calls.append((now, failed, slow))
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+        total = len(self._calls)
+        if total < self.min_calls:
+            return
+        failures = sum(1 for _, call_failed, _ in self._calls if call_failed)
+        slow_calls = sum(1 for _, _, call_slow in self._calls if call_slow)
+        if (
+            failures / total >= self.failure_rate_threshold
+            or slow_calls / total >= self.slow_rate_threshold
+        ):
+            self._open(now)
+
+    def record_success(self, latency_seconds: float = 0.0):
+        """Record a call that got an answer (a 429 counts: the provider is up)."""
+        self._record(failed=False, slow=latency_seconds > self.slow_call_seconds)
+
+    def record_failure(self, error: Optional[str] = None):
+        """Record a call that failed or timed out."""
+        if error:
+            self.last_error = error[:200]
+        self._record(failed=True, slow=False)
+
+    def snapshot(self) -> dict:
+        """Current state and recent error rate, for monitoring."""
+        state = self.state
+        total = len(self._calls)
+        failures = sum(1 for _, call_failed, _ in self._calls if call_failed)
+        return {
+            "provider": self.provider,
+            "state": state,
+            "recent_calls": total,
+            "error_rate": round(failures / total, 3) if total else 0.0,
+            "retry_after_seconds": round(self.retry_after(), 1),
+            "opened_count": self.opened_count,
+            "rejected_count": self.rejected_count,
+            "last_error": self.last_error,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: str) -> Optional[CircuitBreaker]:
+    """Return the shared breaker for a provider, or None if breakers are disabled."""
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        from ...core.config import settings
+
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return None
+        breaker = CircuitBreaker(
+            provider,
+            failure_rate_threshold=settings.CIRCUIT_FAILURE_RATE,
+            slow_call_seconds=settings.CIRCUIT_SLOW_CALL_SECONDS,
+            min_calls=settings.CIRCUIT_MIN_CALLS,
+            window_seconds=settings.CIRCUIT_WINDOW_SECONDS,
+            open_seconds=settings.CIRCUIT_OPEN_SECONDS,
+        )
+        _breakers[provider] = breaker
+    return breaker
+
+
+def circuit_breaker_states() -> list:
+    """Snapshots of every breaker created so far."""
+    return [breaker.snapshot() for breaker in _breakers.values()]
@@ -0,0 +1,117 @@
+"""
+Dedicated, sized thread pool for blocking SDK calls.
+
+Blocking calls (e.g. the legacy google-generativeai SDK) used to run on the
+event loop's default executor, so a large diagnosis fan-out could occupy
+every default thread and starve unrelated asyncio.to_thread users such as
+password hashing. A BoundedExecutor keeps them on their own pool and
+reports how many calls are queued behind it.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class BoundedExecutor:
+    """Thread pool with a fixed size and queue-depth metrics."""
+
+    def __init__(self, name: str, max_workers: int):
+        """
+        Initialize executor.
+
+        Args:
+            name: Thread name prefix and metrics label
+            max_workers: Number of threads; further calls wait in the queue
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_queue_depth = 0
+
+    def _call(self, token: dict, fn: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            token["started"] = True
+            if not token["abandoned"]:
+                self.queued -= 1
+            self.running += 1
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool and await its result."""
+        token = {"started": False, "abandoned": False}
+        with self._lock:
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._pool, functools.partial(self._call, token, fn, *args, **kwargs)
+            )
+        except asyncio.CancelledError:
+            # A caller that gives up while still queued leaves the queue
+            with self._lock:
+                if not token["started"]:
+                    token["abandoned"] = True
+                    self.queued -= 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        """Current queue depth and counters."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "max_queue_depth": self.max_queue_depth,
+            }
+
+    def shutdown(self):
+        """Stop accepting work and release the threads."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_gemini_executor: Optional[BoundedExecutor] = None
+
+
+def get_gemini_executor() -> BoundedExecutor:
+    """Return the shared executor for blocking Gemini SDK calls."""
+    global _gemini_executor
+    if _gemini_executor is None:
+        from ...core.config import settings
+
+        _gemini_executor = BoundedExecutor("gemini", settings.GEMINI_EXECUTOR_WORKERS)
+    return _gemini_executor
+
+
+def executor_stats() -> list:
+    """Stats for every executor created so far."""
+    return [_gemini_executor.stats()] if _gemini_executor is not None else []
+
+
+def shutdown_executors():
+    """Shut down every executor created so far."""
+    global _gemini_executor
+    if _gemini_executor is not None:
+        _gemini_executor.shutdown()
+        _gemini_executor = None
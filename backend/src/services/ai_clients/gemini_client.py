@@ -1,5 +1,9 @@
 """
 Google Gemini AI client implementation.
+
+Uses the async API of the google-genai SDK. If only the legacy
+google-generativeai SDK is installed, its blocking calls run on a
+dedicated bounded executor instead of the event loop's default pool.
 """
 
 import asyncio
@@ -7,45 +11,100 @@ import time
 from typing import Optional
 
 try:
-    import google.generativeai as genai
+    from google import genai
 except ImportError:
     genai = None
 
-from .base import BaseAIClient, AIResponse
+try:
+    import google.generativeai as legacy_genai
+except ImportError:
+    legacy_genai = None
+
+from .base import BaseAIClient, AIResponse, StopCondition
+from .executor import get_gemini_executor
+from .circuit_breaker import get_circuit_breaker
+from .rate_limiter import get_rate_limiter, estimate_tokens, is_rate_limit_error
 
 
 class GeminiClient(BaseAIClient):
     """Client for Google Gemini API."""
 
+    provider = "gemini"
+
     def __init__(self, api_key: str, model_name: str = "gemini-pro", timeout: int = 30):
-        if genai is None:
+        if genai is None and legacy_genai is None:
             raise ImportError(
-                "google-generativeai package not installed. "
-                "Install with: pip install google-generativeai"
+                "google-genai package not installed. "
+                "Install with: pip install google-genai"
             )
 
         self.api_key = api_key
         self.model_name = model_name
         self.timeout = timeout
 
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model_name)
+        if genai is not None:
+            # Shared with the diagnosis router and closed by close_ai_clients();
+            # imported here because the registry imports this module
+            from .registry import get_genai_client
+
+            self.client = get_genai_client(api_key)
+            self.model = None
+            self.executor = None
+        else:
+            # Legacy SDK is synchronous only
+            legacy_genai.configure(api_key=api_key)
+            self.client = None
+            self.model = legacy_genai.GenerativeModel(model_name)
+            self.executor = get_gemini_executor()
+        self.rate_limiter = get_rate_limiter(self.provider)
+
+    async def _generate(self, contents: str):
+        if self.client is not None:
+            return await self.client.aio.models.generate_content(
+                model=self.model_name, contents=contents
+            )
+        return await self.executor.run(self.model.generate_content, contents)
+
+    async def _stream(self, contents: str, stop_condition: StopCondition) -> tuple:
+        """Consume a streamed response until it ends or stop_condition is met."""
+        if self.client is None:
+            return await self.executor.run(self._stream_legacy, contents, stop_condition)
+
+        text = ""
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.model_name, contents=contents
+        )
+        try:
+            async for chunk in stream:
+                text += chunk.text or ""
+                if stop_condition(text):
+                    return text, True
+        finally:
+            await stream.aclose()
+        return text, False
+
+    def _stream_legacy(self, contents: str, stop_condition: StopCondition) -> tuple:
+        text = ""
+        for chunk in self.model.generate_content(contents, stream=True):
+            text += chunk.text
+            if stop_condition(text):
+                return text, True
+        return text, False
 
     async def is_available(self) -> bool:
         """Check if Gemini API is available."""
         try:
             # Simple test to check if API key is valid
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, self.model.generate_content, "Hello"
-            )
+            await self._generate("Hello")
             return True
         except Exception:
             return False
 
     async def chat(
-        self, prompt: str, system_prompt: Optional[str] = None
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_condition: Optional[StopCondition] = None,
     ) -> AIResponse:
         """
         Send a chat request to Gemini API.
@@ -53,10 +112,13 @@ class GeminiClient(BaseAIClient):
         Args:
             prompt: The user prompt
             system_prompt: Optional system instruction (Gemini supports this)
+            stop_condition: Stream the answer and stop once this returns True
 
         Returns:
             AIResponse with the model's response
         """
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(estimate_tokens(prompt, system_prompt))
         start_time = time.time()
 
         try:
@@ -65,16 +127,25 @@ class GeminiClient(BaseAIClient):
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\n{prompt}"
 
-            # Gemini API is synchronous, so we run it in an executor
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, self.model.generate_content, full_prompt
-            )
+            if stop_condition is not None:
+                text, truncated = await self._stream(full_prompt, stop_condition)
+                if self.rate_limiter:
+                    self.rate_limiter.on_success()
+                return AIResponse(
+                    text=text,
+                    model=self.model_name,
+                    response_time_ms=int((time.time() - start_time) * 1000),
+                    truncated=truncated,
+                )
+
+            response = await self._generate(full_prompt)
 
             response_time_ms = int((time.time() - start_time) * 1000)
+            if self.rate_limiter:
+                self.rate_limiter.on_success()
 
             # Extract text from response
-            response_text = response.text if hasattr(response, "text") else ""
+            response_text = (response.text or "") if hasattr(response, "text") else ""
 
             # Extract raw response safely (API changed across SDK versions)
             raw = {}
@@ -102,12 +173,16 @@ class GeminiClient(BaseAIClient):
         except Exception as e:
             response_time_ms = int((time.time() - start_time) * 1000)
             error_message = str(e)
+            rate_limited = is_rate_limit_error(e)
+            if rate_limited and self.rate_limiter:
+                self.rate_limiter.on_rate_limited()
 
             return AIResponse(
                 text="",
                 model=self.model_name,
                 response_time_ms=response_time_ms,
                 error=error_message,
+                rate_limited=rate_limited,
             )
 
 
@@ -127,7 +202,10 @@ class GeminiClientWithRetry(GeminiClient):
         self.retry_delay = retry_delay
 
     async def chat(
-        self, prompt: str, system_prompt: Optional[str] = None
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_condition: Optional[StopCondition] = None,
     ) -> AIResponse:
         """
         Send a chat request with automatic retry on failure.
@@ -135,10 +213,30 @@ class GeminiClientWithRetry(GeminiClient):
         Implements exponential backoff: 2s, 4s, 8s, etc.
         """
         last_error = None
+        breaker = get_circuit_breaker(self.provider)
 
         for attempt in range(self.max_retries):
+            # Fail fast instead of retrying against a provider that is down
+            if breaker and not breaker.allow():
+                return AIResponse(
+                    text="",
+                    model=self.model_name,
+                    response_time_ms=0,
+                    error=(
+                        f"{self.provider} circuit open; retry in {breaker.retry_after():.0f}s. "
+                        f"Last error: {last_error or breaker.last_error}"
+                    ),
+                    circuit_open=True,
+                )
+
+            rate_limited = False
             try:
-                response = await super().chat(prompt, system_prompt)
+                response = await super().chat(prompt, system_prompt, stop_condition)
+                if breaker:
+                    if response.error and not response.rate_limited:
+                        breaker.record_failure(response.error)
+                    else:
+                        breaker.record_success(response.response_time_ms / 1000)
 
                 # If no error, return immediately
                 if not response.error:
@@ -146,12 +244,16 @@ class GeminiClientWithRetry(GeminiClient):
 
                 # If there's an error, store it and retry
                 last_error = response.error
+                rate_limited = response.rate_limited
 
             except Exception as e:
                 last_error = str(e)
+                if breaker:
+                    breaker.record_failure(last_error)
 
-            # If not the last attempt, wait before retrying
-            if attempt < self.max_retries - 1:
+            # If not the last attempt, wait before retrying; rate-limited
+            # calls are already paced by the rate limiter
+            if attempt < self.max_retries - 1 and not rate_limited:
                 wait_time = self.retry_delay * (2**attempt)  # Exponential backoff
                 await asyncio.sleep(wait_time)
 
@@ -0,0 +1,179 @@
+"""
+Request hedging for tail-latency reduction.
+
+A hedged call that has not returned by the provider's rolling p90 latency
+gets a duplicate, and whichever answers first wins. Duplicates are capped
+by a budget (a fraction of all calls), so hedging only ever targets the
+slow tail. A primary that loses is cancelled so a hedge never pays for two
+full completions; the time it had been running when the hedge won is a
+lower bound on its latency, so it feeds the percentile in its place.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """Rolling latency tracker and hedging policy for one provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        percentile: float = 0.9,
+        budget: float = 0.1,
+        min_samples: int = 20,
+        min_delay: float = 0.5,
+        window: int = 200,
+    ):
+        """
+        Initialize hedger.
+
+        Args:
+            provider: Provider identifier (e.g. "openai")
+            percentile: Latency percentile after which a duplicate is sent
+            budget: Most duplicates as a fraction of all calls
+            min_samples: Latencies needed before any call is hedged
+            min_delay: Never hedge sooner than this many seconds
+            window: Number of recent latencies the percentile is taken over
+        """
+        self.provider = provider
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        # Sum of how long each cancelled primary had run when its hedge won
+        self.primary_elapsed_seconds = 0.0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little data."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def _observe(self, task: asyncio.Future, started: float):
+        """Record the latency of a call that produced an answer."""
+        if task.cancelled() or task.exception() is not None or task.result() is None:
+            return
+        self.latencies.append(time.monotonic() - started)
+
+    async def run(self, factory: Callable[[], Awaitable[Optional[T]]]) -> Optional[T]:
+        """
+        Run factory(), hedging it with a second factory() call if it is slow.
+
+        A None result counts as a failure: the other call is awaited instead.
+
+        Args:
+            factory: Returns a fresh coroutine for one attempt of the call
+
+        Returns:
+            The first non-None result, or the primary's result if both failed
+        """
+        self.calls += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(factory())
+        primary.add_done_callback(lambda task: self._observe(task, started))
+
+        delay = self.hedge_delay()
+        if delay is None or self.hedged >= self.budget * self.calls:
+            return await primary
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            return primary.result()
+        return await self._race(factory, primary, started)
+
+    async def _race(
+        self,
+        factory: Callable[[], Awaitable[Optional[T]]],
+        primary: asyncio.Future,
+        started: float,
+    ) -> Optional[T]:
+        self.hedged += 1
+        hedge_started = time.monotonic()
+        hedge = asyncio.ensure_future(factory())
+        hedge.add_done_callback(lambda task: self._observe(task, hedge_started))
+
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the primary when both finished in the same step
+                for task in sorted(done, key=lambda task: task is not primary):
+                    if task.exception() is not None or task.result() is None:
+                        continue
+                    if task is primary:
+                        hedge.cancel()
+                    else:
+                        self._cancel_primary(primary, time.monotonic() - started)
+                    return task.result()
+        except asyncio.CancelledError:
+            primary.cancel()
+            hedge.cancel()
+            raise
+
+        # Both failed; report the primary's outcome
+        return primary.result()
+
+    def _cancel_primary(self, primary: asyncio.Future, elapsed: float):
+        """Cancel a primary its hedge beat, recording how long it had run."""
+        self.hedge_wins += 1
+        primary.cancel()
+        self.primary_elapsed_seconds += elapsed
+        # Its latency is at least this long; leaving it out would drag the
+        # percentile down and hedge ever more calls
+        self.latencies.append(elapsed)
+
+    def snapshot(self) -> dict:
+        """Hedging rate and latency saved, for monitoring."""
+        delay = self.hedge_delay()
+        return {
+            "provider": self.provider,
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_rate": round(self.hedged / self.calls, 3) if self.calls else 0.0,
+            "hedge_wins": self.hedge_wins,
+            # Lower bound on the latency hedge wins saved
+            "primary_elapsed_ms": round(self.primary_elapsed_seconds * 1000),
+            "hedge_delay_ms": round(delay * 1000) if delay is not None else None,
+            "samples": len(self.latencies),
+        }
+
+
+_hedgers: Dict[str, RequestHedger] = {}
+
+
+def get_request_hedger(provider: str) -> RequestHedger:
+    """Return the shared hedger for a provider."""
+    hedger = _hedgers.get(provider)
+    if hedger is None:
+        from ...core.config import settings
+
+        hedger = RequestHedger(
+            provider,
+            percentile=settings.HEDGE_PERCENTILE,
+            budget=settings.HEDGE_BUDGET,
+            min_samples=settings.HEDGE_MIN_SAMPLES,
+            min_delay=settings.HEDGE_MIN_DELAY,
+        )
+        _hedgers[provider] = hedger
+    return hedger
+
+
+def hedging_stats() -> list:
+    """Snapshots of every hedger created so far."""
+    return [hedger.snapshot() for hedger in _hedgers.values()]
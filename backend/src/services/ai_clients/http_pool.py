@@ -0,0 +1,73 @@
+"""
+Shared keep-alive HTTP clients for OpenAI-compatible chat APIs.
+
+The diagnosis callers used to open a fresh httpx.AsyncClient (and TLS
+handshake) per call. Instead, one client per provider is created at app
+startup, reused by every diagnosis and closed in the FastAPI lifespan.
+"""
+
+from typing import Dict, Optional
+
+import httpx
+
+from ...core.config import settings
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# provider -> (base URL, settings attribute holding the API key)
+PROVIDER_ENDPOINTS = {
+    "openai": ("https://api.openai.com/v1", "OPENAI_API_KEY"),
+    "grok": ("https://api.x.ai/v1", "XAI_API_KEY"),
+    "perplexity": ("https://api.perplexity.ai", "PERPLEXITY_API_KEY"),
+}
+
+_http_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _build_http_client(provider: str) -> Optional[httpx.AsyncClient]:
+    base_url, key_setting = PROVIDER_ENDPOINTS[provider]
+    api_key = getattr(settings, key_setting)
+    if not api_key:
+        return None
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        timeout=settings.AI_REQUEST_TIMEOUT,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
+def init_http_clients():
+    """Create a pooled client for every provider with an API key configured."""
+    for provider in PROVIDER_ENDPOINTS:
+        if provider not in _http_clients:
+            client = _build_http_client(provider)
+            if client is not None:
+                _http_clients[provider] = client
+
+
+def get_http_client(provider: str) -> Optional[httpx.AsyncClient]:
+    """Return the shared client for a provider, or None if it has no API key."""
+    client = _http_clients.get(provider)
+    if client is None or client.is_closed:
+        client = _build_http_client(provider)
+        if client is not None:
+            _http_clients[provider] = client
+    return client
+
+
+async def close_http_clients():
+    """Close all pooled clients and their connections."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
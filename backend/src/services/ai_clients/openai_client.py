@@ -6,14 +6,18 @@ import time
 import asyncio
 from typing import Optional
 from openai import AsyncOpenAI
-from openai import OpenAIError
+from openai import OpenAIError, RateLimitError
 
-from .base import BaseAIClient, AIResponse
+from .base import BaseAIClient, AIResponse, StopCondition
+from .circuit_breaker import get_circuit_breaker
+from .rate_limiter import get_rate_limiter, estimate_tokens, parse_retry_after
 
 
 class OpenAIClient(BaseAIClient):
     """OpenAI ChatGPT client implementation."""
 
+    provider = "openai"
+
     def __init__(self, api_key: str, model_name: str = "gpt-4-turbo-preview", timeout: int = 30):
         """
         Initialize OpenAI client.
@@ -24,15 +28,51 @@ class OpenAIClient(BaseAIClient):
             timeout: Request timeout in seconds
         """
         super().__init__(api_key, model_name, timeout)
-        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+        # Retries are handled by OpenAIClientWithRetry and the rate limiter,
+        # so the SDK's own 429 backoff is disabled.
+        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout, max_retries=0)
+        self.rate_limiter = get_rate_limiter(self.provider)
+        self.temperature = 0.7
+        self.max_tokens = 2000
+
+    def generation_params(self) -> dict:
+        return {"temperature": self.temperature, "max_tokens": self.max_tokens}
+
+    async def _stream(self, messages: list, stop_condition: StopCondition) -> tuple:
+        """Stream a completion until it ends or stop_condition is met."""
+        stream = await self.client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+        )
+        text = ""
+        try:
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                text += chunk.choices[0].delta.content
+                if stop_condition(text):
+                    # Closing the connection stops generation (and billing)
+                    return text, True
+        finally:
+            await stream.response.aclose()
+        return text, False
 
-    async def chat(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
+    async def chat(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_condition: Optional[StopCondition] = None,
+    ) -> AIResponse:
         """
         Send a chat prompt to ChatGPT.
 
         Args:
             prompt: User query
             system_prompt: Optional system instructions
+            stop_condition: Stream the answer and stop once this returns True
 
         Returns:
             AIResponse with ChatGPT's response
@@ -40,6 +80,10 @@ class OpenAIClient(BaseAIClient):
         Raises:
             OpenAIError: If API call fails
         """
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(
+                estimate_tokens(prompt, system_prompt, self.max_tokens)
+            )
         start_time = time.time()
 
         try:
@@ -48,14 +92,27 @@ class OpenAIClient(BaseAIClient):
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
 
+            if stop_condition is not None:
+                text, truncated = await self._stream(messages, stop_condition)
+                if self.rate_limiter:
+                    self.rate_limiter.on_success()
+                return AIResponse(
+                    text=text,
+                    model=self.model_name,
+                    response_time_ms=int((time.time() - start_time) * 1000),
+                    truncated=truncated,
+                )
+
             response = await self.client.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
-                temperature=0.7,
-                max_tokens=2000,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
             )
 
             response_time_ms = int((time.time() - start_time) * 1000)
+            if self.rate_limiter:
+                self.rate_limiter.on_success()
 
             return AIResponse(
                 text=response.choices[0].message.content or "",
@@ -64,6 +121,18 @@ class OpenAIClient(BaseAIClient):
                 raw_response=response.model_dump(),
             )
 
+        except RateLimitError as e:
+            response_time_ms = int((time.time() - start_time) * 1000)
+            if self.rate_limiter:
+                self.rate_limiter.on_rate_limited(parse_retry_after(e.response.headers))
+            return AIResponse(
+                text="",
+                model=self.model_name,
+                response_time_ms=response_time_ms,
+                error=str(e),
+                rate_limited=True,
+            )
+
         except OpenAIError as e:
             response_time_ms = int((time.time() - start_time) * 1000)
             return AIResponse(
@@ -73,6 +142,10 @@ class OpenAIClient(BaseAIClient):
                 error=str(e),
             )
 
+    async def close(self):
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+
     async def is_available(self) -> bool:
         """
         Check if OpenAI API is available.
@@ -117,22 +190,48 @@ class OpenAIClientWithRetry(OpenAIClient):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
-    async def chat(self, prompt: str, system_prompt: Optional[str] = None) -> AIResponse:
+    async def chat(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_condition: Optional[StopCondition] = None,
+    ) -> AIResponse:
         """
         Send chat prompt with automatic retries on failure.
 
         Args:
             prompt: User query
             system_prompt: Optional system instructions
+            stop_condition: Stream the answer and stop once this returns True
 
         Returns:
             AIResponse with ChatGPT's response
         """
         last_error = None
+        breaker = get_circuit_breaker(self.provider)
 
         for attempt in range(self.max_retries):
+            # Fail fast instead of retrying against a provider that is down
+            if breaker and not breaker.allow():
+                return AIResponse(
+                    text="",
+                    model=self.model_name,
+                    response_time_ms=0,
+                    error=(
+                        f"{self.provider} circuit open; retry in {breaker.retry_after():.0f}s. "
+                        f"Last error: {last_error or breaker.last_error}"
+                    ),
+                    circuit_open=True,
+                )
+
+            rate_limited = False
             try:
-                response = await super().chat(prompt, system_prompt)
+                response = await super().chat(prompt, system_prompt, stop_condition)
+                if breaker:
+                    if response.error and not response.rate_limited:
+                        breaker.record_failure(response.error)
+                    else:
+                        breaker.record_success(response.response_time_ms / 1000)
 
                 # If no error, return immediately
                 if not response.error:
@@ -140,12 +239,16 @@ class OpenAIClientWithRetry(OpenAIClient):
 
                 # If error occurred, save it and retry
                 last_error = response.error
+                rate_limited = response.rate_limited
 
             except Exception as e:
                 last_error = str(e)
+                if breaker:
+                    breaker.record_failure(last_error)
 
-            # Wait before retrying (exponential backoff)
-            if attempt < self.max_retries - 1:
+            # Wait before retrying (exponential backoff); rate-limited calls
+            # are already paced by the rate limiter
+            if attempt < self.max_retries - 1 and not rate_limited:
                 await asyncio.sleep(self.retry_delay * (2**attempt))
 
         # All retries failed, return error response
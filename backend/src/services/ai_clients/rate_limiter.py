@@ -0,0 +1,171 @@
+"""
+Per-provider async rate limiting with AIMD adaptation.
+
+Each provider gets a requests-per-minute bucket and an optional
+tokens-per-minute bucket. Callers reserve capacity before every request;
+on a 429 the effective rate is halved (and paused for Retry-After), and
+each success grows it back additively toward the configured quota.
+"""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of polling."""
+
+    def __init__(self, per_minute: float, burst_seconds: float = 10.0):
+        self.per_minute = per_minute
+        self.burst_seconds = burst_seconds
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        return max(1.0, self.per_minute / 60.0 * self.burst_seconds)
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Take amount from the bucket and return how long to wait before using it.
+
+        The balance may go negative; later callers then queue behind it.
+        """
+        rate = self.per_minute / 60.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        # A single request larger than the bucket can never fit; cap it
+        self.tokens -= min(amount, self.capacity)
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / rate
+
+
+class AdaptiveRateLimiter:
+    """Requests- and tokens-per-minute limiter for one provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        rpm: int,
+        tpm: Optional[int] = None,
+        min_fraction: float = 0.1,
+        increase_step: float = 0.01,
+        default_cooldown: float = 2.0,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            provider: Provider identifier (e.g. "openai")
+            rpm: Requests-per-minute quota
+            tpm: Optional tokens-per-minute quota
+            min_fraction: Lowest fraction of the quota AIMD may shrink to
+            increase_step: Fraction of the quota regained per successful call
+            default_cooldown: Pause after a 429 that carries no Retry-After
+        """
+        self.provider = provider
+        self.rpm = rpm
+        self.tpm = tpm
+        self.min_fraction = min_fraction
+        self.increase_step = increase_step
+        self.default_cooldown = default_cooldown
+
+        self.fraction = 1.0
+        self.paused_until = 0.0
+        self.rate_limited_count = 0
+        self._requests = TokenBucket(rpm)
+        self._tokens = TokenBucket(tpm) if tpm else None
+
+    def _apply_fraction(self):
+        self._requests.per_minute = self.rpm * self.fraction
+        if self._tokens is not None:
+            self._tokens.per_minute = self.tpm * self.fraction
+
+    async def acquire(self, tokens: int = 0):
+        """Wait until a request of roughly `tokens` tokens may be sent."""
+        now = time.monotonic()
+        wait = max(0.0, self.paused_until - now)
+        wait = max(wait, self._requests.reserve(1, now))
+        if self._tokens is not None and tokens:
+            wait = max(wait, self._tokens.reserve(tokens, now))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        """Additively grow the rate back toward the full quota."""
+        if self.fraction < 1.0:
+            self.fraction = min(1.0, self.fraction + self.increase_step)
+            self._apply_fraction()
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """Halve the rate and pause new requests for Retry-After seconds."""
+        self.rate_limited_count += 1
+        self.fraction = max(self.min_fraction, self.fraction / 2)
+        self._apply_fraction()
+        pause = retry_after if retry_after is not None else self.default_cooldown
+        self.paused_until = max(self.paused_until, time.monotonic() + pause)
+
+    def snapshot(self) -> dict:
+        """Current effective limits, for monitoring."""
+        return {
+            "provider": self.provider,
+            "rpm": round(self.rpm * self.fraction, 1),
+            "tpm": round(self.tpm * self.fraction) if self.tpm else None,
+            "fraction": round(self.fraction, 3),
+            "rate_limited_count": self.rate_limited_count,
+            "paused_for_seconds": round(max(0.0, self.paused_until - time.monotonic()), 1),
+        }
+
+
+def estimate_tokens(prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 0) -> int:
+    """Rough token estimate (4 chars per token) for TPM reservations."""
+    chars = len(prompt) + len(system_prompt or "")
+    return chars // 4 + max_tokens
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Read a Retry-After (seconds or HTTP date) or retry-after-ms header."""
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Detect quota errors from SDKs that don't expose a status code."""
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message or "ResourceExhausted" in message
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str) -> Optional[AdaptiveRateLimiter]:
+    """Return the shared limiter for a provider, or None if it has no quota configured."""
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        from ...core.config import settings
+
+        limits = settings.PROVIDER_RATE_LIMITS.get(provider)
+        if not limits:
+            return None
+        limiter = AdaptiveRateLimiter(provider, rpm=limits["rpm"], tpm=limits.get("tpm"))
+        _limiters[provider] = limiter
+    return limiter
@@ -0,0 +1,106 @@
+"""
+Process-wide registry of long-lived AI clients.
+
+Each provider client is built once and shared by every EvaluationService
+and the diagnosis router, so HTTP keep-alive connections and SDK setup
+are reused across calls. Clients are closed in the FastAPI lifespan.
+"""
+
+from typing import Dict, Optional
+
+from ...core.config import settings
+from .base import BaseAIClient
+from .openai_client import OpenAIClientWithRetry
+from .gemini_client import GeminiClientWithRetry
+from .cache import with_response_cache
+from .executor import shutdown_executors
+
+try:
+    from google import genai
+except ImportError:
+    genai = None
+
+
+# Provider behind each evaluation model
+MODEL_PROVIDERS = {
+    "ChatGPT": "openai",
+    "Gemini": "gemini",
+}
+
+_clients: Dict[str, BaseAIClient] = {}
+_genai_clients: Dict[str, object] = {}  # google-genai SDK clients by API key
+
+
+def _build_client(model_name: str) -> BaseAIClient:
+    if model_name == "ChatGPT":
+        client = OpenAIClientWithRetry(
+            api_key=settings.OPENAI_API_KEY,
+            model_name=settings.OPENAI_MODEL,
+            timeout=settings.AI_REQUEST_TIMEOUT,
+            max_retries=settings.MAX_RETRIES,
+            retry_delay=settings.RETRY_DELAY,
+        )
+    elif model_name == "Gemini":
+        client = GeminiClientWithRetry(
+            api_key=settings.GOOGLE_API_KEY,
+            model_name=settings.GOOGLE_MODEL,
+            timeout=settings.AI_REQUEST_TIMEOUT,
+            max_retries=settings.MAX_RETRIES,
+            retry_delay=settings.RETRY_DELAY,
+        )
+    # TODO: Add other models (Claude, Perplexity)
+    else:
+        raise ValueError(f"Unsupported model: {model_name}")
+    return with_response_cache(client)
+
+
+def get_ai_client(model_name: str) -> BaseAIClient:
+    """Return the shared client for an evaluation model, creating it on first use."""
+    client = _clients.get(model_name)
+    if client is None:
+        client = _build_client(model_name)
+        _clients[model_name] = client
+    return client
+
+
+def get_genai_client(api_key: Optional[str] = None):
+    """
+    Return the shared Google GenAI SDK client, or None if unavailable.
+
+    Args:
+        api_key: Key the client authenticates with (default: GOOGLE_API_KEY)
+    """
+    if genai is None:
+        return None
+    api_key = api_key or settings.GOOGLE_API_KEY
+    client = _genai_clients.get(api_key)
+    if client is None:
+        client = genai.Client(api_key=api_key)
+        _genai_clients[api_key] = client
+    return client
+
+
+async def close_ai_clients():
+    """Close every shared client and its connection pool."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            print(f"Failed to close {client.provider} client: {e}")
+
+    genai_clients = list(_genai_clients.values())
+    _genai_clients.clear()
+    for genai_client in genai_clients:
+        try:
+            aclose = getattr(genai_client.aio, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            close = getattr(genai_client, "close", None)
+            if close is not None:
+                close()
+        except Exception as e:
+            print(f"Failed to close GenAI client: {e}")
+
+    shutdown_executors()
@@ -0,0 +1,241 @@
+"""
+Single-pass multi-brand mention matcher.
+
+Builds an Aho-Corasick automaton over every brand name and alias once, then
+finds all of them in a response with one scan, so analysis cost depends on
+the response length rather than the size of the brand catalog.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+# Characters dropped from both terms and text in compact matching, so that
+# "Coca Cola", "coca-cola" and "CocaCola" all match the same brand
+COMPACT_STRIP = re.compile(r"['\-\s]")
+
+DEFAULT_RANK_PATTERN = r"^\s*(\d+)\."
+
+
+def _is_word_char(char: str) -> bool:
+    """Same definition as the regex \\w class for str patterns."""
+    return char.isalnum() or char == "_"
+
+
+def compact(text: str) -> str:
+    """Drop apostrophes, hyphens and whitespace."""
+    return COMPACT_STRIP.sub("", text)
+
+
+def lower_with_offsets(text: str) -> Tuple[str, Optional[List[int]]]:
+    """
+    Lowercase text for matching, keeping track of where each character came from.
+
+    Lowercasing can lengthen a text ("İ" becomes two characters), so
+    offsets into the lowered text are not offsets into the original.
+
+    Returns:
+        (text.lower(), original offset of each lowered character, or None
+        when every character lowered to exactly one and offsets are unchanged)
+    """
+    lowered = text.lower()
+    # Lowercasing never shortens a character, so equal lengths mean one to one
+    if len(lowered) == len(text):
+        return lowered, None
+    offsets: List[int] = []
+    for position, char in enumerate(text):
+        offsets.extend([position] * len(char.lower()))
+    return lowered, offsets
+
+
+@dataclass
+class BrandHit:
+    """One occurrence of a brand term in a text."""
+    key: str  # Brand identifier the matched term belongs to
+    term: str  # Term as registered (lowercased)
+    start: int  # Offsets into the original text, end exclusive
+    end: int
+    line: int  # 0-based index into text.split("\n")
+    rank: Optional[int] = None  # Number of the list item on that line, if any
+    compact: bool = False  # Found only after stripping apostrophes/hyphens/spaces
+
+
+class _Automaton:
+    """Aho-Corasick automaton over lowercased terms."""
+
+    def __init__(self, terms: List[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for index, term in enumerate(terms):
+            if not term:
+                continue
+            node = 0
+            for char in term:
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][char] = next_node
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                node = next_node
+            self.output[node].append(index)
+
+        # Breadth-first failure links; each node inherits the outputs of its
+        # failure target so a scan reports every term ending at a position
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def scan(self, text: str) -> Iterable[Tuple[int, int]]:
+        """Yield (term index, end offset) for every occurrence, by end offset."""
+        goto, fail, output = self.goto, self.fail, self.output
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in output[node]:
+                yield index, position + 1
+
+
+class BrandMatcher:
+    """
+    Reusable matcher over a catalog of brand terms.
+
+    Matching is case-insensitive (str.lower() on both sides) and reported
+    at offsets into the original text. With word_boundary=True a term only matches
+    where the regex r"\\b<term>\\b" would; otherwise any substring matches.
+    Build it once per catalog and call find_all() for each response.
+    """
+
+    def __init__(
+        self,
+        terms: Union[Mapping[str, Iterable[str]], Iterable[Tuple[str, str]]],
+        word_boundary: bool = True,
+        compact_variants: bool = False,
+        rank_pattern: str = DEFAULT_RANK_PATTERN,
+        overlapping: bool = False,
+    ):
+        """
+        Initialize matcher.
+
+        Args:
+            terms: {key: [name, alias, ...]} or (key, term) pairs. The key is
+                returned with each hit (a brand ID or canonical name).
+            word_boundary: Require regex word boundaries around each term
+            compact_variants: Also match terms with apostrophes, hyphens and
+                whitespace removed from both term and text
+            rank_pattern: Regex whose first group is the list number of a line
+            overlapping: Report overlapping occurrences of the same term
+                (like str.find at every offset) instead of re.finditer's
+                non-overlapping ones
+        """
+        if isinstance(terms, Mapping):
+            pairs = [(key, term) for key, key_terms in terms.items() for term in key_terms]
+        else:
+            pairs = list(terms)
+
+        self.word_boundary = word_boundary
+        self.overlapping = overlapping
+        self.keys = [key for key, _ in pairs]
+        self.terms = [term.lower() for _, term in pairs]
+        self.rank_pattern = re.compile(rank_pattern)
+        self._automaton = _Automaton(self.terms)
+
+        self._compact_automaton = None
+        if compact_variants:
+            self.compact_terms = [compact(term) for term in self.terms]
+            self._compact_automaton = _Automaton(self.compact_terms)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _has_boundaries(self, text: str, start: int, end: int) -> bool:
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        return (
+            before != _is_word_char(text[start])
+            and after != _is_word_char(text[end - 1])
+        )
+
+    def find_all(self, text: str) -> List[BrandHit]:
+        """
+        Scan text once and return every term occurrence, ordered by offset.
+
+        Like re.finditer, occurrences of the same term never overlap unless
+        the matcher was built with overlapping=True.
+        """
+        text_lower, lower_offsets = lower_with_offsets(text)
+        newlines = [i for i, char in enumerate(text) if char == "\n"]
+        lines: Optional[List[str]] = None
+        ranks: Dict[int, Optional[int]] = {}
+
+        def original(start: int, end: int) -> Tuple[int, int]:
+            """Map a span of text_lower back onto text."""
+            if lower_offsets is None:
+                return start, end
+            return lower_offsets[start], lower_offsets[end - 1] + 1
+
+        def locate(start: int) -> Tuple[int, Optional[int]]:
+            nonlocal lines
+            line = bisect.bisect_left(newlines, start)
+            if line not in ranks:
+                if lines is None:
+                    lines = text.split("\n")
+                match = self.rank_pattern.match(lines[line])
+                ranks[line] = int(match.group(1)) if match else None
+            return line, ranks[line]
+
+        hits: List[BrandHit] = []
+        seen = set()
+        last_end: Dict[int, int] = {}
+        for index, lower_end in self._automaton.scan(text_lower):
+            lower_start = lower_end - len(self.terms[index])
+            if not self.overlapping and lower_start < last_end.get(index, 0):
+                continue
+            start, end = original(lower_start, lower_end)
+            if self.word_boundary and not self._has_boundaries(text, start, end):
+                continue
+            last_end[index] = lower_end
+            line, rank = locate(start)
+            hits.append(BrandHit(self.keys[index], self.terms[index], start, end, line, rank))
+            seen.add((index, start, end))
+
+        if self._compact_automaton is not None:
+            # offsets[i] is the position in text_lower of the i-th kept character
+            offsets = [i for i, char in enumerate(text_lower) if not COMPACT_STRIP.match(char)]
+            compact_text = "".join(text_lower[i] for i in offsets)
+            last_end = {}
+            for index, end in self._compact_automaton.scan(compact_text):
+                compact_start = end - len(self.compact_terms[index])
+                if not self.overlapping and compact_start < last_end.get(index, 0):
+                    continue
+                last_end[index] = end
+                start, stop = original(offsets[compact_start], offsets[end - 1] + 1)
+                if (index, start, stop) in seen:
+                    continue
+                line, rank = locate(start)
+                hits.append(BrandHit(
+                    self.keys[index], self.terms[index], start, stop, line, rank, compact=True
+                ))
+
+        hits.sort(key=lambda hit: (hit.start, hit.end))
+        return hits
+
+    def find_by_key(self, text: str) -> Dict[str, List[BrandHit]]:
+        """Scan text once and group the hits by brand key."""
+        grouped: Dict[str, List[BrandHit]] = {}
+        for hit in self.find_all(text):
+            grouped.setdefault(hit.key, []).append(hit)
+        return grouped
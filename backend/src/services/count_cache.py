@@ -0,0 +1,237 @@
+"""
+Cached totals for paginated listings.
+
+Listing endpoints report the total number of matches, which used to mean a
+COUNT over the full filtered query on every page request. Totals are
+cached per endpoint and filter set; routes strip text filters with
+normalize_filter() first, so surrounding whitespace never splits a key.
+A cached total is dropped as soon as a committed write touches one of the
+tables it counted. The TTL bounds staleness from writes made by other
+processes.
+
+count_mode="estimated" reads the planner's row estimate on PostgreSQL
+instead of counting (SQLite has no estimates and counts exactly).
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, event, func, select
+from sqlalchemy.exc import CompileError, DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+
+
+class CountCache:
+    """LRU of totals, invalidated through per-table write versions."""
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1000):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds a total is served without recounting
+            max_entries: Most totals kept; least recently used go first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float, Tuple[int, ...]]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(scope: str, filters: Dict[str, Any]) -> str:
+        """
+        Cache key of an endpoint and its filters; unset filters are ignored.
+
+        Values are used verbatim: they must be exactly the values the query
+        filters with, or differently spelled filters would share a total.
+        """
+        normalized = {name: value for name, value in filters.items() if value is not None and value != ""}
+        return scope + ":" + json.dumps(normalized, sort_keys=True, default=str)
+
+    def _table_versions(self, tables: Sequence[str]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def get(self, key: str, tables: Sequence[str]) -> Optional[Any]:
+        """Cached value, or None if missing, expired or invalidated by a write."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at, versions = entry
+        if time.monotonic() >= expires_at or versions != self._table_versions(tables):
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def versions(self, tables: Sequence[str]) -> Tuple[int, ...]:
+        """Snapshot to pass to put(); take it before counting."""
+        return self._table_versions(tables)
+
+    def put(self, key: str, value: Any, versions: Tuple[int, ...]):
+        """
+        Store a value computed at the given table versions.
+
+        A write committed while counting bumps a version, so such a value
+        is discarded on its next lookup.
+        """
+        self._entries[key] = (value, time.monotonic() + self.ttl, versions)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, tables: Iterable[str]):
+        """Drop every total that counted rows of these tables."""
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+    def stats(self) -> dict:
+        """Hit rate and size, for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+def normalize_filter(value: Optional[str]) -> Optional[str]:
+    """
+    Strip surrounding whitespace from a text filter; blank means unset.
+
+    Routes filter with the normalized value and pass the same value to
+    count_rows(), so the query and the cache key always agree.
+    """
+    if value is None:
+        return None
+    return value.strip() or None
+
+
+_cache: Optional[CountCache] = None
+
+
+def get_count_cache() -> CountCache:
+    """Return the process-wide count cache."""
+    global _cache
+    if _cache is None:
+        _cache = CountCache(ttl=settings.COUNT_CACHE_TTL, max_entries=settings.COUNT_CACHE_MAX_ENTRIES)
+    return _cache
+
+
+# Write-driven invalidation: sessions remember the tables they wrote and
+# invalidate them once the transaction commits
+
+_WRITTEN_TABLES = "count_cache_written_tables"
+
+
+def mark_written(session, *tables: str):
+    """
+    Record tables written outside the ORM (e.g. COPY) on a Session or
+    AsyncSession; their totals are invalidated when it commits.
+    """
+    session.info.setdefault(_WRITTEN_TABLES, set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context):
+    mark_written(
+        session,
+        *{
+            obj.__table__.name
+            for obj in (*session.new, *session.dirty, *session.deleted)
+            if hasattr(obj, "__table__")
+        },
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(orm_execute_state):
+    # Bulk INSERT / UPDATE / DELETE statements bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and hasattr(table, "name"):
+            mark_written(orm_execute_state.session, table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session):
+    tables = session.info.pop(_WRITTEN_TABLES, None)
+    if tables:
+        get_count_cache().invalidate(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session):
+    session.info.pop(_WRITTEN_TABLES, None)
+
+
+async def _estimate(db: AsyncSession, query: Select) -> Optional[int]:
+    """Planner row estimate of a query on PostgreSQL, or None."""
+    if db.bind.dialect.name != "postgresql":
+        return None
+    try:
+        sql = query.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+    except CompileError:
+        return None
+    # Sent verbatim: the inlined filter values are user input, and text()
+    # would read something like "foo :bar" inside them as a bind parameter
+    connection = await db.connection()
+    try:
+        async with db.begin_nested():
+            plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    except DBAPIError as e:
+        print(f"[count] Estimate failed, counting exactly: {e.orig}")
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+    db: AsyncSession,
+    query: Select,
+    scope: str,
+    filters: Dict[str, Any],
+    tables: Sequence[str],
+    mode: str = "exact",
+) -> Tuple[int, bool]:
+    """
+    Total rows of a filtered listing query, from the cache when possible.
+
+    Args:
+        db: Session to count with
+        query: The listing query, without ordering or pagination
+        scope: Endpoint name, part of the cache key
+        filters: The request's filter values, part of the cache key
+        tables: Tables the query reads; writes to them invalidate the total
+        mode: "exact", or "estimated" to use planner statistics where available
+
+    Returns:
+        (total, whether the total is an estimate)
+    """
+    cache = get_count_cache()
+    key = cache.key(f"{scope}:{mode}", filters)
+    cached = cache.get(key, tables)
+    if cached is not None:
+        return cached
+
+    versions = cache.versions(tables)
+    estimated = False
+    total = None
+    if mode == "estimated":
+        total = await _estimate(db, query)
+        estimated = total is not None
+    if total is None:
+        total = (await db.execute(select(func.count()).select_from(query.subquery()))).scalar() or 0
+    cache.put(key, (total, estimated), versions)
+    return total, estimated
@@ -0,0 +1,94 @@
+"""
+Bounded-concurrency scheduler for fanning out evaluation calls.
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+from .ai_clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+T = TypeVar("T")
+
+
+class EvaluationScheduler:
+    """
+    Runs evaluation jobs concurrently with a global limit and per-provider limits.
+
+    Jobs are (provider, factory) pairs where the factory returns the coroutine
+    to run. A job first waits for a slot on its provider, then for a global
+    slot, so a saturated provider never holds global slots it cannot use.
+
+    With circuit breakers, jobs for a provider whose breaker is open are
+    deferred (without holding a global slot) until it lets calls through
+    again. A job that raises CircuitOpenError is deferred and retried the
+    same way; after max_defer seconds the error is propagated.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        provider_limits: Optional[Dict[str, int]] = None,
+        circuit_breakers: Optional[Callable[[str], Optional[CircuitBreaker]]] = None,
+        max_defer: float = 300.0,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum number of jobs in flight across all providers
+            provider_limits: Optional per-provider caps (e.g. {"openai": 4})
+            circuit_breakers: Returns the breaker for a provider (or None)
+            max_defer: Longest a job waits on an open breaker, in seconds
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.provider_limits = provider_limits or {}
+        self.circuit_breakers = circuit_breakers
+        self.max_defer = max_defer
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._providers: Dict[str, asyncio.Semaphore] = {}
+
+    def _provider_semaphore(self, provider: str) -> asyncio.Semaphore:
+        semaphore = self._providers.get(provider)
+        if semaphore is None:
+            limit = self.provider_limits.get(provider, self.max_concurrency)
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._providers[provider] = semaphore
+        return semaphore
+
+    async def _run_job(self, provider: str, factory: Callable[[], Awaitable[T]]) -> T:
+        breaker = self.circuit_breakers(provider) if self.circuit_breakers else None
+        deadline = time.monotonic() + self.max_defer
+        async with self._provider_semaphore(provider):
+            while True:
+                if breaker is not None and not breaker.available():
+                    await breaker.wait_until_available(max(0.0, deadline - time.monotonic()))
+                try:
+                    async with self._global:
+                        return await factory()
+                except CircuitOpenError:
+                    if breaker is None or time.monotonic() >= deadline:
+                        raise
+
+    async def run(
+        self, jobs: Iterable[Tuple[str, Callable[[], Awaitable[T]]]]
+    ) -> AsyncIterator[T]:
+        """
+        Run all jobs and yield their results in completion order.
+
+        If a job raises, the remaining jobs are cancelled and the exception
+        is propagated to the caller.
+        """
+        tasks = [
+            asyncio.create_task(self._run_job(provider, factory))
+            for provider, factory in jobs
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            pending = [t for t in tasks if not t.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
@@ -5,10 +5,11 @@ Evaluation service for orchestrating AI model evaluations.
 import asyncio
 import re
 from datetime import datetime
+from functools import partial
 from typing import List, Optional
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, delete, case, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.config import settings
@@ -17,12 +18,20 @@ from ..models.prompt import Prompt
 from ..models.evaluation import EvaluationRun, EvaluationResult
 from ..models.scorecard import ScoreCard
 from ..services.ai_clients import (
-    OpenAIClientWithRetry,
-    GeminiClientWithRetry,
     AIResponse,
+    MODEL_PROVIDERS,
+    CircuitOpenError,
+    get_ai_client,
+    get_circuit_breaker,
 )
 from ..schemas.models import GEOScoreCard
 from ..services.scorers import GEOScorer
+from ..services.evaluation_scheduler import EvaluationScheduler
+from ..services.result_writer import ResultBulkWriter
+from ..services.brand_matcher import BrandHit, BrandMatcher
+from ..services.response_analyzer import MentionStopCondition
+from ..services.event_broker import get_event_broker
+from ..services.score_queries import delete_score_cards, record_latest_score_cards
 
 
 class EvaluationService:
@@ -31,6 +40,8 @@ class EvaluationService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.scorers = {}  # Cache scorers
+        self.cache_hits = 0  # Responses served from the LLM cache this run
+        self.cache_misses = 0
 
     async def _safe_commit(self):
         """Commit with rollback recovery for SQLite resilience."""
@@ -54,6 +65,9 @@ class EvaluationService:
         brand_ids: List[str],
         models: List[str],
         prompt_ids: Optional[List[str]] = None,
+        share_responses: bool = False,
+        early_stop: bool = False,
+        retry_on_failure: bool = False,
     ):
         """
         Run a complete evaluation for multiple brands across multiple models.
@@ -63,18 +77,39 @@ class EvaluationService:
             brand_ids: List of brand IDs to evaluate
             models: List of AI models to use (e.g., ["ChatGPT", "Gemini"])
             prompt_ids: Optional list of specific prompts to use (default: all)
+            share_responses: Fetch one response per (prompt, model) and analyze
+                it for every brand, instead of one call per brand. Prompts are
+                not brand-specific, so this divides API calls by the brand count.
+            early_stop: Stream each answer and cancel it once every brand's
+                mention and list rank are known (or the list passes
+                STREAM_STOP_MAX_RANK). Saves latency and output tokens, but
+                later text (citations, descriptions) is not analyzed.
+            retry_on_failure: The caller runs this again if it fails (the job
+                queue has attempts left): a failure puts the run back to
+                pending and publishes a retrying event instead of failed.
+
+        Runs are resumable: calling this again for a run that died part-way
+        only evaluates the (brand, prompt, model) triples that have no stored
+        result yet, or only an errored (empty) one. Scorecards are computed
+        once every triple is stored.
+
+        Status changes, progress, per-triple results and scorecards are
+        published on the event broker under the run ID.
         """
         # Get evaluation run
         run_result = await self.db.execute(
             select(EvaluationRun).where(EvaluationRun.id == run_id)
         )
         run = run_result.scalar_one()
+        events = get_event_broker()
+        events.start(run_id)
 
         try:
             # Update status to running
             run.status = "running"
             run.started_at = datetime.utcnow()
             await self._safe_commit()
+            events.publish(run_id, "status", {"status": "running"})
 
             # Get brands
             brands_result = await self.db.execute(
@@ -116,41 +151,140 @@ class EvaluationService:
             run.prompt_count = len(prompt_data)
             await self._safe_commit()
 
+            # Resume support: triples already stored for this run (from an
+            # earlier attempt that died part-way) are not evaluated again.
+            # Results without an answer (the provider errored) are dropped
+            # first so those triples are retried instead of scored as misses.
+            await self.db.execute(
+                delete(EvaluationResult).where(
+                    EvaluationResult.evaluation_run_id == run_id,
+                    EvaluationResult.response_text == "",
+                )
+            )
+            done_result = await self.db.execute(
+                select(
+                    EvaluationResult.brand_id,
+                    EvaluationResult.prompt_id,
+                    EvaluationResult.model_name,
+                ).where(EvaluationResult.evaluation_run_id == run_id)
+            )
+            done = {tuple(row) for row in done_result.all()}
+
             # Calculate total tasks
             total_tasks = len(brand_data) * len(prompt_data) * len(models)
-            completed_tasks = 0
-
-            # Process each combination using plain dicts (no ORM lazy loads)
-            for brand in brand_data:
+            completed_tasks = sum(
+                1
+                for brand in brand_data
+                for prompt in prompt_data
+                for model_name in models
+                if (brand["id"], prompt["id"], model_name) in done
+            )
+            if completed_tasks:
+                print(f"  Resuming run {run_id}: {completed_tasks}/{total_tasks} already evaluated")
+
+            # Fan out AI calls; only this coroutine touches the DB session
+            scheduler = EvaluationScheduler(
+                max_concurrency=settings.MAX_CONCURRENT_EVALUATIONS,
+                provider_limits=settings.PROVIDER_MAX_CONCURRENCY,
+                circuit_breakers=get_circuit_breaker,
+                max_defer=settings.CIRCUIT_MAX_DEFER,
+            )
+            # Each job fetches one response and analyzes it for a group of
+            # brands: every brand at once when sharing, one brand otherwise
+            if share_responses:
+                brand_groups = [brand_data]
+            else:
+                brand_groups = [[brand] for brand in brand_data]
+            # One automaton over every brand name, so each response is
+            # scanned once no matter how many brands are analyzed
+            matcher = BrandMatcher(
+                {brand["id"]: [brand["name"]] for brand in brand_data},
+                word_boundary=False,
+            )
+            jobs = []
+            for brands_group in brand_groups:
                 for prompt in prompt_data:
                     for model_name in models:
-                        # Run evaluation for this combination
-                        await self._evaluate_single(
-                            run_id=run_id,
-                            brand=brand,
-                            prompt=prompt,
-                            model_name=model_name,
-                        )
-
-                        # Update progress
-                        completed_tasks += 1
-                        run.progress = int((completed_tasks / total_tasks) * 100)
-
-                    # Commit after each prompt (batch of models) to reduce DB pressure
-                    await self._safe_commit()
-
-                # Calculate scores for this brand
-                await self._calculate_brand_score(run_id, brand["id"])
-                await self._safe_commit()
+                        pending_brands = [
+                            brand for brand in brands_group
+                            if (brand["id"], prompt["id"], model_name) not in done
+                        ]
+                        if not pending_brands:
+                            continue
+                        jobs.append((
+                            MODEL_PROVIDERS.get(model_name, model_name),
+                            partial(
+                                self._evaluate_prompt,
+                                run_id=run_id,
+                                brands=pending_brands,
+                                prompt=prompt,
+                                model_name=model_name,
+                                matcher=matcher,
+                                early_stop=early_stop,
+                            ),
+                        ))
+
+            # Results are buffered and inserted in batches; every flush is
+            # committed so it doubles as a resume checkpoint
+            writer = ResultBulkWriter(self.db)
+            async for job_results in scheduler.run(jobs):
+                for row in job_results:
+                    # Update progress
+                    completed_tasks += 1
+                    progress = int((completed_tasks / total_tasks) * 100)
+                    events.publish(run_id, "result", {
+                        "brand_id": row["brand_id"],
+                        "prompt_id": row["prompt_id"],
+                        "model_name": row["model_name"],
+                        "is_mentioned": row["is_mentioned"],
+                        "mention_rank": row["mention_rank"],
+                        "completed": completed_tasks,
+                        "total": total_tasks,
+                    })
+                    if progress != run.progress:
+                        events.publish(run_id, "progress", {
+                            "progress": progress,
+                            "completed": completed_tasks,
+                            "total": total_tasks,
+                        })
+                    run.progress = progress
+
+                    if await writer.add(row):
+                        await self._safe_commit()
+            await writer.flush()
+            await self._safe_commit()
 
-                # Log progress
-                print(f"  [{completed_tasks}/{total_tasks}] {brand['name']} - score calculated")
+            # Every triple is stored; score each brand once. Scorecards left
+            # by an earlier attempt are replaced.
+            await delete_score_cards(self.db, ScoreCard.evaluation_run_id == run_id)
+            score_cards = await self._calculate_run_scores(run_id)
+            await self.db.flush()
+            await record_latest_score_cards(self.db, score_cards)
+            print(f"  Scores calculated for {len(brand_data)} brands")
+            await self._safe_commit()
+            for card in score_cards:
+                events.publish(run_id, "scorecard", {
+                    "brand_id": card.brand_id,
+                    "composite_score": card.composite_score,
+                    "visibility_score": card.visibility_score,
+                    "citation_score": card.citation_score,
+                    "representation_score": card.representation_score,
+                    "intent_score": card.intent_score,
+                    "total_mentions": card.total_mentions,
+                })
+
+            if self.cache_hits:
+                print(
+                    f"  LLM cache: {self.cache_hits} hits, {self.cache_misses} misses "
+                    f"({self.cache_hits} API calls saved)"
+                )
 
             # Mark as completed
             run.status = "completed"
             run.completed_at = datetime.utcnow()
             run.progress = 100
             await self._safe_commit()
+            events.publish(run_id, "status", {"status": "completed", "progress": 100})
 
         except Exception as e:
             # Mark as failed with rollback recovery
@@ -163,39 +297,85 @@ class EvaluationService:
                     select(EvaluationRun).where(EvaluationRun.id == run_id)
                 )
                 run = run_result.scalar_one()
-                run.status = "failed"
+                run.status = "pending" if retry_on_failure else "failed"
                 run.error_message = str(e)[:500]
                 await self._safe_commit()
             except Exception:
                 pass
+            if retry_on_failure:
+                events.publish(run_id, "retrying", {"status": "pending", "error": str(e)[:500]})
+            else:
+                events.publish(run_id, "status", {"status": "failed", "error": str(e)[:500]})
             raise
+        finally:
+            events.finish(run_id)
 
-    async def _evaluate_single(
+    async def _evaluate_prompt(
         self,
         run_id: str,
-        brand: dict,
+        brands: List[dict],
         prompt: dict,
         model_name: str,
-    ):
+        matcher: BrandMatcher,
+        early_stop: bool = False,
+    ) -> List[dict]:
         """
-        Evaluate a single brand-prompt-model combination.
+        Fetch one response for a prompt-model pair and analyze it for each brand.
+
+        Runs concurrently with other evaluations, so it never touches the
+        DB session; the caller writes the returned result rows.
 
         Args:
-            brand: Dict with keys: id, name, domain, positioning
+            brands: Dicts with keys: id, name, domain, positioning
             prompt: Dict with keys: id, text, intent_category
+            matcher: Matcher keyed by brand ID over the run's brand names
+            early_stop: Stop streaming once every brand's rank is known
         """
         # Get AI client
         client = await self._get_ai_client(model_name)
 
+        stop_condition = None
+        if early_stop:
+            stop_condition = MentionStopCondition(
+                matcher, [brand["id"] for brand in brands], settings.STREAM_STOP_MAX_RANK
+            )
+
         # Make API call
         response = await client.chat(
             prompt=prompt["text"],
             system_prompt="You are a helpful assistant. Provide accurate, factual information.",
+            stop_condition=stop_condition,
         )
+        if response.circuit_open:
+            # Nothing is stored; the scheduler defers the job until the
+            # provider recovers, or fails the run so it can be resumed
+            raise CircuitOpenError(MODEL_PROVIDERS.get(model_name, model_name), response.error)
+        if response.cached:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+        hits_by_brand = matcher.find_by_key(response.text)
+        return [
+            self._build_result(
+                run_id, brand, prompt, model_name, response, hits_by_brand.get(brand["id"], [])
+            )
+            for brand in brands
+        ]
 
+    def _build_result(
+        self,
+        run_id: str,
+        brand: dict,
+        prompt: dict,
+        model_name: str,
+        response: AIResponse,
+        hits: List[BrandHit],
+    ) -> dict:
+        """Analyze a model response for one brand and build its evaluation_results row."""
         # Analyze response for brand mentions
         is_mentioned, mention_rank, mention_context = self._analyze_mention(
-            response.text, brand["name"]
+            response.text, hits
         )
 
         # Check for citations
@@ -203,70 +383,98 @@ class EvaluationService:
 
         # Analyze representation
         representation_score, description, sentiment = self._analyze_representation(
-            response.text, brand["name"], brand["positioning"]
+            response.text, hits, brand["positioning"]
         )
 
-        # Save result
-        result = EvaluationResult(
-            id=str(uuid4()),
-            evaluation_run_id=run_id,
-            brand_id=brand["id"],
-            prompt_id=prompt["id"],
-            model_name=model_name,
-            prompt_text=prompt["text"],
-            intent_category=prompt["intent_category"],
-            response_text=response.text,
-            response_time_ms=response.response_time_ms,
-            is_mentioned=is_mentioned,
-            mention_rank=mention_rank,
-            mention_context=mention_context,
-            is_cited=is_cited,
-            citation_urls=citation_urls,
-            representation_score=representation_score,
-            description_text=description,
-            sentiment=sentiment,
-        )
+        return {
+            "id": str(uuid4()),
+            "evaluation_run_id": run_id,
+            "brand_id": brand["id"],
+            "prompt_id": prompt["id"],
+            "model_name": model_name,
+            "prompt_text": prompt["text"],
+            "intent_category": prompt["intent_category"],
+            "response_text": response.text,
+            "response_time_ms": response.response_time_ms,
+            "is_mentioned": is_mentioned,
+            "mention_rank": mention_rank,
+            "mention_context": mention_context,
+            "is_cited": is_cited,
+            "citation_urls": citation_urls,
+            "representation_score": representation_score,
+            "description_text": description,
+            "sentiment": sentiment,
+            "intent_fit_score": None,
+            "evaluated_at": datetime.utcnow(),
+        }
+
+    async def _calculate_run_scores(self, run_id: str) -> List[ScoreCard]:
+        """
+        Calculate aggregated GEO scores for every brand in a run.
 
-        self.db.add(result)
+        One grouped query per run returns counts and sums per
+        (brand, model, intent); the per-brand roll-up happens in Python on
+        those few rows, so response bodies are never loaded.
 
-    async def _calculate_brand_score(self, run_id: str, brand_id: str):
-        """
-        Calculate aggregated GEO score for a brand based on evaluation results.
+        Returns:
+            The ScoreCards added to the session
         """
-        # Get all results for this brand in this run
-        results_query = select(EvaluationResult).where(
-            EvaluationResult.evaluation_run_id == run_id,
-            EvaluationResult.brand_id == brand_id,
+        mentioned = case((EvaluationResult.is_mentioned, 1), else_=0)
+        stats_query = (
+            select(
+                EvaluationResult.brand_id,
+                EvaluationResult.model_name,
+                EvaluationResult.intent_category,
+                func.count().label("total"),
+                func.sum(mentioned).label("mentioned"),
+                func.sum(case((EvaluationResult.is_cited, 1), else_=0)).label("cited"),
+                func.sum(EvaluationResult.representation_score).label("representation"),
+                func.sum(
+                    case((EvaluationResult.is_mentioned, EvaluationResult.mention_rank), else_=0)
+                ).label("rank_sum"),
+            )
+            .where(EvaluationResult.evaluation_run_id == run_id)
+            .group_by(
+                EvaluationResult.brand_id,
+                EvaluationResult.model_name,
+                EvaluationResult.intent_category,
+            )
         )
-        results_result = await self.db.execute(results_query)
-        results = results_result.scalars().all()
+        stats_result = await self.db.execute(stats_query)
+
+        groups_by_brand = {}
+        for row in stats_result.all():
+            groups_by_brand.setdefault(row.brand_id, []).append(row)
 
-        if not results:
-            return
+        score_cards = [
+            self._build_score_card(run_id, brand_id, groups)
+            for brand_id, groups in groups_by_brand.items()
+        ]
+        self.db.add_all(score_cards)
+        return score_cards
 
+    def _build_score_card(self, run_id: str, brand_id: str, groups: list) -> ScoreCard:
+        """Roll up one brand's (model, intent) aggregate rows into a ScoreCard."""
         # Calculate metrics
-        total_results = len(results)
-        mentioned_results = [r for r in results if r.is_mentioned]
-        cited_results = [r for r in results if r.is_cited]
+        total_results = sum(g.total for g in groups)
+        total_mentioned = sum(g.mentioned or 0 for g in groups)
+        total_cited = sum(g.cited or 0 for g in groups)
+        # NULL ranks of mentioned results count as 0, as before
+        rank_sum = sum(g.rank_sum or 0 for g in groups)
 
         # Visibility: mention rate and average rank
-        mention_rate = len(mentioned_results) / total_results
-        avg_rank = (
-            sum(r.mention_rank for r in mentioned_results if r.mention_rank)
-            / len(mentioned_results)
-            if mentioned_results
-            else None
-        )
+        mention_rate = total_mentioned / total_results
+        avg_rank = rank_sum / total_mentioned if total_mentioned else None
 
         # Citation rate
-        citation_rate = len(cited_results) / total_results
+        citation_rate = total_cited / total_results
 
         # Representation: average score
-        avg_representation = sum(r.representation_score for r in results) / total_results
+        avg_representation = sum(g.representation or 0 for g in groups) / total_results
 
         # Intent coverage: unique intents where brand was mentioned
-        intents_mentioned = set(r.intent_category for r in mentioned_results)
-        all_intents = set(r.intent_category for r in results)
+        intents_mentioned = set(g.intent_category for g in groups if g.mentioned)
+        all_intents = set(g.intent_category for g in groups)
         intent_coverage = len(intents_mentioned) / len(all_intents) if all_intents else 0
 
         # Calculate GEO scores
@@ -284,17 +492,21 @@ class EvaluationService:
         )
 
         # Model breakdown
-        model_scores = {}
-        for model_name in set(r.model_name for r in results):
-            model_results = [r for r in results if r.model_name == model_name]
-            model_mentions = [r for r in model_results if r.is_mentioned]
-            model_scores[model_name] = {
-                "score": int((len(model_mentions) / len(model_results)) * 100),
-                "mentions": len(model_mentions),
+        model_totals = {}
+        for g in groups:
+            totals = model_totals.setdefault(g.model_name, [0, 0])
+            totals[0] += g.total
+            totals[1] += g.mentioned or 0
+        model_scores = {
+            model_name: {
+                "score": int((mentions / total) * 100),
+                "mentions": mentions,
             }
+            for model_name, (total, mentions) in model_totals.items()
+        }
 
         # Create score card
-        score_card = ScoreCard(
+        return ScoreCard(
             id=str(uuid4()),
             brand_id=brand_id,
             evaluation_run_id=run_id,
@@ -303,7 +515,7 @@ class EvaluationService:
             citation_score=citation_score,
             representation_score=representation_score,
             intent_score=intent_score,
-            total_mentions=len(mentioned_results),
+            total_mentions=total_mentioned,
             avg_rank=avg_rank,
             citation_rate=citation_rate,
             intent_coverage=intent_coverage,
@@ -312,55 +524,33 @@ class EvaluationService:
             last_evaluation_date=datetime.utcnow(),
         )
 
-        self.db.add(score_card)
-
     async def _get_ai_client(self, model_name: str):
-        """Get AI client for the specified model."""
-        if model_name == "ChatGPT":
-            return OpenAIClientWithRetry(
-                api_key=settings.OPENAI_API_KEY,
-                model_name=settings.OPENAI_MODEL,
-                timeout=settings.AI_REQUEST_TIMEOUT,
-                max_retries=settings.MAX_RETRIES,
-                retry_delay=settings.RETRY_DELAY,
-            )
-        elif model_name == "Gemini":
-            return GeminiClientWithRetry(
-                api_key=settings.GOOGLE_API_KEY,
-                model_name=settings.GOOGLE_MODEL,
-                timeout=settings.AI_REQUEST_TIMEOUT,
-                max_retries=settings.MAX_RETRIES,
-                retry_delay=settings.RETRY_DELAY,
-            )
-        # TODO: Add other models (Claude, Perplexity)
-        else:
-            raise ValueError(f"Unsupported model: {model_name}")
+        """Get the shared AI client for the specified model."""
+        return get_ai_client(model_name)
 
-    def _analyze_mention(self, text: str, brand_name: str) -> tuple:
+    def _analyze_mention(self, text: str, hits: List[BrandHit]) -> tuple:
         """
         Analyze if and where the brand is mentioned in the response.
 
+        Args:
+            hits: Case-insensitive occurrences of the brand name, by offset
+
         Returns: (is_mentioned, mention_rank, mention_context)
         """
-        # Simple case-insensitive search
-        text_lower = text.lower()
-        brand_lower = brand_name.lower()
-
-        if brand_lower not in text_lower:
+        if not hits:
             return False, None, None
 
         # Find position/rank in list if present
         # Look for numbered lists (1., 2., etc.)
         lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if brand_lower in line.lower():
-                # Try to extract rank from numbered list
-                match = re.match(r"^\s*(\d+)\.", line)
-                if match:
-                    rank = int(match.group(1))
-                    return True, rank, line.strip()
-                else:
-                    return True, i + 1, line.strip()
+        for hit in hits:
+            if "\n" in text[hit.start:hit.end]:
+                continue
+            line = lines[hit.line]
+            if hit.rank is not None:
+                return True, hit.rank, line.strip()
+            else:
+                return True, hit.line + 1, line.strip()
 
         # If not in a list, just mentioned
         return True, None, text[:200]  # First 200 chars as context
@@ -384,7 +574,7 @@ class EvaluationService:
         return len(cited_urls) > 0, cited_urls
 
     def _analyze_representation(
-        self, text: str, brand_name: str, positioning: Optional[str]
+        self, text: str, hits: List[BrandHit], positioning: Optional[str]
     ) -> tuple:
         """
         Analyze how the brand is represented in the response.
@@ -393,16 +583,17 @@ class EvaluationService:
         """
         # Simple heuristic for now
         # In production, would use NLP/LLM to analyze
-        text_lower = text.lower()
-        brand_lower = brand_name.lower()
-
-        if brand_lower not in text_lower:
+        if not hits:
             return 0, None, None
 
-        # Extract sentence containing brand
-        sentences = text.split(".")
+        # Extract first sentence containing brand
         brand_sentence = next(
-            (s for s in sentences if brand_lower in s.lower()), None
+            (
+                text.split(".")[text.count(".", 0, hit.start)]
+                for hit in hits
+                if "." not in text[hit.start:hit.end]
+            ),
+            None,
         )
 
         if not brand_sentence:
@@ -0,0 +1,95 @@
+"""
+In-process publish/subscribe for evaluation run events.
+
+The evaluation engine publishes progress, per-triple completions and
+scorecards under the run ID; the SSE endpoint subscribes and forwards them
+to dashboards, which then no longer need to poll the database. Events only
+reach subscribers in the same process as the publisher.
+"""
+
+import asyncio
+import itertools
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+
+class Event:
+    """One published (or synthesized, id-less) event."""
+
+    __slots__ = ("id", "type", "data")
+
+    def __init__(self, event_type: str, data: Dict[str, Any], event_id: Optional[int] = None):
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+
+    def encode(self) -> str:
+        """Server-Sent Events wire format."""
+        lines = [] if self.id is None else [f"id: {self.id}"]
+        lines.append(f"event: {self.type}")
+        lines.append(f"data: {json.dumps(self.data, default=str)}")
+        return "\n".join(lines) + "\n\n"
+
+
+class EventBroker:
+    """Fan-out of events to per-subscriber queues, keyed by topic."""
+
+    def __init__(self, max_queue_size: int = 1000):
+        """
+        Initialize broker.
+
+        Args:
+            max_queue_size: Events buffered per subscriber; a subscriber that
+                falls further behind loses its oldest events
+        """
+        self.max_queue_size = max_queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._publishing: Set[str] = set()
+        self._ids = itertools.count(1)
+
+    def start(self, topic: str):
+        """Mark a topic as having a publisher in this process."""
+        self._publishing.add(topic)
+
+    def finish(self, topic: str):
+        """Mark a topic's publisher as done."""
+        self._publishing.discard(topic)
+
+    def is_publishing(self, topic: str) -> bool:
+        """Whether events for the topic are produced in this process."""
+        return topic in self._publishing
+
+    def publish(self, topic: str, event_type: str, data: Optional[Dict[str, Any]] = None):
+        """Deliver an event to every current subscriber of the topic. Never blocks."""
+        queues = self._subscribers.get(topic)
+        if not queues:
+            return
+        event = Event(event_type, data or {}, next(self._ids))
+        for queue in queues:
+            if queue.full():
+                # Slow consumer: drop its oldest event rather than block the engine
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[asyncio.Queue]:
+        """Receive the topic's events on a queue for the duration of the block."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.setdefault(topic, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(topic)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[topic]
+
+
+_broker = EventBroker()
+
+
+def get_event_broker() -> EventBroker:
+    """Return the process-wide event broker."""
+    return _broker
@@ -0,0 +1,399 @@
+"""
+Database-backed background job queue.
+
+Jobs are rows in `background_jobs`. Any number of workers (inside the API
+process or started with `python -m src.worker`) poll for runnable jobs and
+claim them with a conditional UPDATE, so each job runs on exactly one
+worker. A running job holds a lease that its worker refreshes with a
+heartbeat; if the worker dies (deploy, crash, OOM), the lease goes stale
+and another worker reclaims the job.
+"""
+
+import asyncio
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import get_session_factory
+from ..models.job import BackgroundJob
+
+JobHandler = Callable[[BackgroundJob], Awaitable[Optional[dict]]]
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str):
+    """Register an async handler for jobs of the given kind."""
+    def decorator(fn: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = fn
+        return fn
+    return decorator
+
+
+async def enqueue_job(
+    db: AsyncSession,
+    kind: str,
+    payload: Dict[str, Any],
+    ref_id: Optional[str] = None,
+    max_attempts: Optional[int] = None,
+) -> BackgroundJob:
+    """
+    Persist a new pending job.
+
+    The job is added to the caller's session; it becomes visible to workers
+    when the caller commits.
+
+    Args:
+        kind: Handler name (e.g. "evaluation_run")
+        payload: JSON arguments for the handler
+        ref_id: ID of the entity the job works on, for lookups
+        max_attempts: Override for JOB_MAX_ATTEMPTS
+    """
+    job = BackgroundJob(
+        id=str(uuid4()),
+        kind=kind,
+        ref_id=ref_id,
+        payload=payload,
+        status="pending",
+        attempts=0,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_after=datetime.utcnow(),
+    )
+    db.add(job)
+    return job
+
+
+async def get_active_job(db: AsyncSession, kind: str, ref_id: str) -> Optional[BackgroundJob]:
+    """Return the pending or running job of a kind for an entity, if any."""
+    result = await db.execute(
+        select(BackgroundJob).where(
+            BackgroundJob.kind == kind,
+            BackgroundJob.ref_id == ref_id,
+            BackgroundJob.status.in_(["pending", "running"]),
+        )
+    )
+    return result.scalars().first()
+
+
+async def get_latest_job(db: AsyncSession, kind: str, ref_id: str) -> Optional[BackgroundJob]:
+    """Return the most recently created job of a kind for an entity."""
+    result = await db.execute(
+        select(BackgroundJob)
+        .where(BackgroundJob.kind == kind, BackgroundJob.ref_id == ref_id)
+        .order_by(BackgroundJob.created_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def will_retry(job: BackgroundJob) -> bool:
+    """Whether a failure of the job's current attempt is retried."""
+    return job.attempts < job.max_attempts
+
+
+async def update_job_result(job_id: str, result: Dict[str, Any]):
+    """Store partial results of a running job so pollers see them before it finishes."""
+    async with get_session_factory()() as db:
+        await db.execute(
+            update(BackgroundJob).where(BackgroundJob.id == job_id).values(result=result)
+        )
+        await db.commit()
+
+
+class JobWorker:
+    """Polls the job table and executes claimed jobs."""
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            worker_id: Lease owner name (default: hostname:pid:random)
+            concurrency: Maximum jobs executed at once
+            poll_interval: Seconds to sleep when no job is runnable
+        """
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+        self.concurrency = max(1, concurrency or settings.JOB_WORKER_CONCURRENCY)
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL
+        self.heartbeat_interval = settings.JOB_HEARTBEAT_INTERVAL
+        self.stale_after = timedelta(seconds=settings.JOB_STALE_AFTER)
+
+        self._session_factory = get_session_factory()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+
+    async def _claim(self) -> Optional[BackgroundJob]:
+        """Atomically take ownership of the oldest runnable or stale job."""
+        now = datetime.utcnow()
+        stale_before = now - self.stale_after
+
+        async with self._session_factory() as db:
+            # Jobs whose lease went stale after their last attempt are failed
+            await db.execute(
+                update(BackgroundJob)
+                .where(
+                    BackgroundJob.status == "running",
+                    BackgroundJob.heartbeat_at < stale_before,
+                    BackgroundJob.attempts >= BackgroundJob.max_attempts,
+                )
+                .values(
+                    status="failed",
+                    locked_by=None,
+                    error_message="Worker lost while running final attempt",
+                    completed_at=now,
+                )
+            )
+            await db.commit()
+
+            candidates = await db.execute(
+                select(BackgroundJob.id, BackgroundJob.status, BackgroundJob.locked_by)
+                .where(
+                    or_(
+                        and_(
+                            BackgroundJob.status == "pending",
+                            BackgroundJob.run_after <= now,
+                        ),
+                        and_(
+                            BackgroundJob.status == "running",
+                            BackgroundJob.heartbeat_at < stale_before,
+                        ),
+                    ),
+                    BackgroundJob.kind.in_(list(JOB_HANDLERS)),
+                )
+                .order_by(BackgroundJob.run_after)
+                .limit(self.concurrency * 2)
+            )
+
+            for job_id, status, locked_by in candidates.all():
+                # Only succeeds if nobody claimed the job since we read it
+                claimed = await db.execute(
+                    update(BackgroundJob)
+                    .where(
+                        BackgroundJob.id == job_id,
+                        BackgroundJob.status == status,
+                        (
+                            BackgroundJob.locked_by.is_(None)
+                            if locked_by is None
+                            else BackgroundJob.locked_by == locked_by
+                        ),
+                    )
+                    .values(
+                        status="running",
+                        locked_by=self.worker_id,
+                        heartbeat_at=now,
+                        started_at=now,
+                        attempts=BackgroundJob.attempts + 1,
+                    )
+                )
+                await db.commit()
+                if claimed.rowcount == 1:
+                    job = await db.get(BackgroundJob, job_id)
+                    if status == "running":
+                        print(f"[jobs] Reclaimed stale job {job_id} from {locked_by}")
+                    return job
+        return None
+
+    async def _heartbeat(self, job_id: str, work: asyncio.Task):
+        """
+        Refresh the job lease until cancelled.
+
+        If the lease is lost (the job went stale and another worker reclaimed
+        it), the handler task is cancelled and the heartbeat returns: the job
+        must not run twice at once.
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self._session_factory() as db:
+                    refreshed = await db.execute(
+                        update(BackgroundJob)
+                        .where(
+                            BackgroundJob.id == job_id,
+                            BackgroundJob.locked_by == self.worker_id,
+                        )
+                        .values(heartbeat_at=datetime.utcnow())
+                    )
+                    await db.commit()
+                    if refreshed.rowcount == 0:
+                        print(f"[jobs] Lost lease on job {job_id}, cancelling it")
+                        work.cancel()
+                        return
+            except Exception as e:
+                print(f"[jobs] Heartbeat failed for job {job_id}: {e}")
+
+    async def _finish(self, job_id: str, **values):
+        async with self._session_factory() as db:
+            await db.execute(
+                update(BackgroundJob)
+                .where(
+                    BackgroundJob.id == job_id,
+                    BackgroundJob.locked_by == self.worker_id,
+                )
+                .values(locked_by=None, **values)
+            )
+            await db.commit()
+
+    async def _execute(self, job: BackgroundJob):
+        """Run a claimed job and record its outcome."""
+        handler = JOB_HANDLERS[job.kind]
+        work = asyncio.create_task(handler(job))
+        heartbeat = asyncio.create_task(self._heartbeat(job.id, work))
+        print(f"[jobs] {self.worker_id} running {job.kind} job {job.id} (attempt {job.attempts})")
+        try:
+            result = await work
+        except asyncio.CancelledError:
+            if heartbeat.done() and not heartbeat.cancelled():
+                # The heartbeat lost the lease: the job belongs to another
+                # worker now, so its row is neither finished nor retried here
+                print(f"[jobs] Abandoned {job.kind} job {job.id}")
+                return
+            # Shutting down: hand the job back without using up an attempt
+            await asyncio.shield(
+                self._finish(job.id, status="pending", attempts=job.attempts - 1)
+            )
+            raise
+        except Exception as e:
+            print(f"[jobs] {job.kind} job {job.id} failed: {e}")
+            if will_retry(job):
+                delay = settings.RETRY_DELAY * (2 ** job.attempts)
+                await self._finish(
+                    job.id,
+                    status="pending",
+                    error_message=str(e)[:500],
+                    run_after=datetime.utcnow() + timedelta(seconds=delay),
+                )
+            else:
+                await self._finish(
+                    job.id,
+                    status="failed",
+                    error_message=str(e)[:500],
+                    completed_at=datetime.utcnow(),
+                )
+        else:
+            await self._finish(
+                job.id,
+                status="completed",
+                result=result,
+                error_message=None,
+                completed_at=datetime.utcnow(),
+            )
+        finally:
+            heartbeat.cancel()
+
+    async def run(self):
+        """Poll and execute jobs until stop() is called."""
+        print(f"[jobs] Worker {self.worker_id} started (concurrency={self.concurrency})")
+        while not self._stopping:
+            job = None
+            if len(self._running) < self.concurrency:
+                try:
+                    job = await self._claim()
+                except Exception as e:
+                    print(f"[jobs] Failed to claim job: {e}")
+
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            task = asyncio.create_task(self._execute(job))
+            self._running[job.id] = task
+            task.add_done_callback(lambda _t, job_id=job.id: self._running.pop(job_id, None))
+
+    async def stop(self):
+        """Stop polling and hand running jobs back to the queue."""
+        self._stopping = True
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ---------------------------------------------------------------------------
+# Job handlers
+# ---------------------------------------------------------------------------
+
+@job_handler("evaluation_run")
+async def run_evaluation_job(job: BackgroundJob) -> dict:
+    """Execute an EvaluationRun with EvaluationService."""
+    from .evaluation_service import EvaluationService
+
+    payload = job.payload
+    run_id = payload["run_id"]
+    async with get_session_factory()() as db:
+        # Retries resume the run: already stored triples are skipped
+        service = EvaluationService(db)
+        await service.run_evaluation(
+            run_id=run_id,
+            brand_ids=payload["brand_ids"],
+            models=payload["models"],
+            prompt_ids=payload.get("prompt_ids"),
+            share_responses=payload.get("share_responses", False),
+            early_stop=payload.get("early_stop", False),
+            retry_on_failure=will_retry(job),
+        )
+    return {"run_id": run_id}
+
+
+@job_handler("diagnosis")
+async def run_diagnosis_job(job: BackgroundJob) -> dict:
+    """Run the diagnosis pipeline, publishing each stage's partial results on the job."""
+    from ..api.routes.diagnosis import DiagnosisRequest, run_diagnosis, save_diagnosis
+
+    payload = dict(job.payload)
+    diagnosis_id = payload.pop("diagnosis_id")
+    partial: Dict[str, Any] = {"stage": None}
+
+    async def on_stage(stage: str, data: dict):
+        partial["stage"] = stage
+        partial.update(data)
+        try:
+            await update_job_result(job.id, partial)
+        except Exception as e:
+            # Progress reporting must not abort the diagnosis
+            print(f"[jobs] Failed to store {stage} results for job {job.id}: {e}")
+
+    response = await run_diagnosis(DiagnosisRequest(**payload), diagnosis_id, on_stage)
+    async with get_session_factory()() as db:
+        await save_diagnosis(db, response)
+    return {**partial, "stage": "completed", "response": response.model_dump(mode="json")}
+
+
+# In-process worker started from the FastAPI lifespan
+_worker: Optional[JobWorker] = None
+_worker_task: Optional[asyncio.Task] = None
+
+
+def start_job_worker():
+    """Start a worker loop inside the current event loop."""
+    global _worker, _worker_task
+    if _worker_task is not None:
+        return
+    _worker = JobWorker()
+    _worker_task = asyncio.create_task(_worker.run())
+
+
+async def stop_job_worker():
+    """Stop the in-process worker, releasing any job it holds."""
+    global _worker, _worker_task
+    if _worker is None:
+        return
+    await _worker.stop()
+    _worker_task.cancel()
+    try:
+        await _worker_task
+    except asyncio.CancelledError:
+        pass
+    _worker = None
+    _worker_task = None
@@ -8,6 +8,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict
 from datetime import datetime
 
+from ..brand_matcher import BrandMatcher
+
 
 class BrandExtractor:
     """
@@ -91,6 +93,12 @@ class BrandExtractor:
             self.alias_to_brand[brand.lower()] = brand
             for alias in info.get("aliases", []):
                 self.alias_to_brand[alias.lower()] = brand
+
+        # One automaton over every alias instead of a regex per alias
+        self.matcher = BrandMatcher(
+            [(brand, alias) for alias, brand in self.alias_to_brand.items()]
+        )
+        self.alias_order = {alias: i for i, alias in enumerate(self.alias_to_brand)}
     
     def extract_brands(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -105,24 +113,24 @@ class BrandExtractor:
         mentions = []
         text_lower = text.lower()
         
-        for alias, brand in self.alias_to_brand.items():
-            # Word boundary matching
-            pattern = r'\b' + re.escape(alias) + r'\b'
-            matches = list(re.finditer(pattern, text_lower, re.IGNORECASE))
+        # Word boundary matching, reported alias by alias
+        hits = sorted(
+            self.matcher.find_all(text),
+            key=lambda hit: (self.alias_order[hit.term], hit.start),
+        )
+        for hit in hits:
+            # Extract context around mention
+            start = max(0, hit.start - 50)
+            end = min(len(text), hit.end + 50)
+            context = text[start:end]
             
-            for match in matches:
-                # Extract context around mention
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                
-                mentions.append({
-                    "brand": brand,
-                    "category": self.KNOWN_BRANDS[brand]["category"],
-                    "position": match.start(),
-                    "context": context,
-                    "matched_term": match.group(),
-                })
+            mentions.append({
+                "brand": hit.key,
+                "category": self.KNOWN_BRANDS[hit.key]["category"],
+                "position": hit.start,
+                "context": context,
+                "matched_term": text_lower[hit.start:hit.end],
+            })
         
         # Remove duplicates (same brand in same position)
         seen = set()
@@ -0,0 +1,147 @@
+"""
+Buffered bulk writer for EvaluationResult rows.
+
+Adding one ORM object per result costs a unit-of-work flush and an INSERT
+round-trip each. The writer buffers plain row dicts and writes them in
+batches: multi-row INSERT ... VALUES on SQLite, COPY on asyncpg and
+executemany elsewhere. The rows join the session's transaction, so the
+caller still decides when to commit.
+
+A row whose (run, brand, prompt, model) is already stored is skipped on
+SQLite and PostgreSQL, so a job that is run twice cannot write duplicates;
+other databases reject the batch through the unique index.
+"""
+
+import json
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, insert
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.evaluation import EvaluationResult
+from .count_cache import mark_written
+
+# SQLite caps bound parameters per statement (999 before 3.32)
+SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+
+class ResultBulkWriter:
+    """Buffers EvaluationResult rows and inserts them in batches."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            db: Session whose transaction the rows are written in
+            batch_size: Flush once this many rows are buffered
+            flush_interval: Flush on the next add once the oldest buffered
+                row has waited this many seconds
+        """
+        self.db = db
+        self.batch_size = max(1, batch_size or settings.RESULT_BATCH_SIZE)
+        self.flush_interval = flush_interval or settings.RESULT_FLUSH_INTERVAL
+        self.table = EvaluationResult.__table__
+        self.columns = [column.name for column in self.table.columns]
+        self.json_columns = {
+            column.name for column in self.table.columns if isinstance(column.type, JSON)
+        }
+        self.rows_written = 0
+        self.rows_skipped = 0
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._first_buffered_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def add(self, row: Dict[str, Any]) -> bool:
+        """
+        Buffer a row, flushing if the batch is full or has waited too long.
+
+        Returns:
+            True if the buffer was flushed
+        """
+        if not self._buffer:
+            self._first_buffered_at = time.monotonic()
+        self._buffer.append(row)
+
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._first_buffered_at >= self.flush_interval
+        ):
+            await self.flush()
+            return True
+        return False
+
+    async def flush(self):
+        """Write all buffered rows."""
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+
+        conn = await self.db.connection()
+        dialect = conn.dialect
+        if dialect.name == "sqlite":
+            written = await self._insert_values(conn, rows)
+        elif dialect.driver == "asyncpg":
+            written = await self._copy(conn, rows)
+        else:
+            await conn.execute(insert(self.table), rows)
+            written = len(rows)
+        # Connection-level writes bypass the session's flush events
+        mark_written(self.db, self.table.name)
+        self.rows_written += written
+        if written < len(rows):
+            self.rows_skipped += len(rows) - written
+            print(f"[results] Skipped {len(rows) - written} results that were already stored")
+
+    async def _insert_values(self, conn, rows: List[Dict[str, Any]]) -> int:
+        """Multi-row INSERT OR IGNORE ... VALUES, chunked under the bind parameter limit."""
+        chunk_size = max(1, SQLITE_MAX_VARIABLES // len(self.columns))
+        written = 0
+        for start in range(0, len(rows), chunk_size):
+            stmt = sqlite.insert(self.table).values(rows[start:start + chunk_size])
+            result = await conn.execute(stmt.on_conflict_do_nothing())
+            written += result.rowcount
+        return written
+
+    async def _copy(self, conn, rows: List[Dict[str, Any]]) -> int:
+        """
+        COPY rows in through asyncpg's binary copy protocol.
+
+        COPY cannot skip conflicting rows, so they are copied into a
+        temporary staging table and moved over with ON CONFLICT DO NOTHING.
+        """
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        staging = f"{self.table.name}_staging"
+        columns = ", ".join(f'"{name}"' for name in self.columns)
+        records = [
+            tuple(
+                json.dumps(row.get(name)) if name in self.json_columns else row.get(name)
+                for name in self.columns
+            )
+            for row in rows
+        ]
+        await driver.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+            f"(LIKE {self.table.name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+        await driver.copy_records_to_table(staging, records=records, columns=self.columns)
+        status = await driver.execute(
+            f"INSERT INTO {self.table.name} ({columns}) SELECT {columns} FROM {staging} "
+            "ON CONFLICT DO NOTHING"
+        )
+        await driver.execute(f"TRUNCATE {staging}")
+        # Status tag: "INSERT 0 <rows>"
+        return int(status.rsplit(" ", 1)[-1])
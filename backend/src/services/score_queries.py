@@ -0,0 +1,258 @@
+"""
+Shared scorecard queries.
+
+Reads of "the latest scorecard per brand" go through the latest_score_cards
+projection table, a pointer per brand, so dashboards join on primary keys
+instead of ranking every scorecard on each request.
+
+On SQLite and PostgreSQL, AFTER INSERT / DELETE triggers on score_cards
+keep the pointers current for every writer, including the seed and
+evaluation scripts that write raw SQL. The evaluation engine also upserts
+and repoints them itself, which is what keeps other databases in sync.
+rank_latest_score_cards() computes the same set from scratch with
+ROW_NUMBER(); at startup it is upserted over the projection to repair
+anything written before the triggers existed.
+
+Pointers are never left to ON DELETE CASCADE: SQLite does not enforce the
+foreign keys.
+"""
+
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import ColumnElement, Select, delete, func, insert, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.util import AliasedClass
+
+from ..models.brand import Brand
+from ..models.scorecard import LatestScoreCard, ScoreCard
+
+_UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Trigger bodies share these statements (NEW / OLD rows, as both dialects spell them)
+_POINT_TO_NEW = """
+    INSERT INTO latest_score_cards (brand_id, score_card_id, created_at)
+    VALUES (NEW.brand_id, NEW.id, NEW.created_at)
+    ON CONFLICT (brand_id) DO UPDATE
+    SET score_card_id = excluded.score_card_id, created_at = excluded.created_at
+    WHERE latest_score_cards.created_at <= excluded.created_at;
+"""
+_REPOINT_FROM_OLD = """
+    DELETE FROM latest_score_cards WHERE score_card_id = OLD.id;
+    INSERT INTO latest_score_cards (brand_id, score_card_id, created_at)
+    SELECT brand_id, id, created_at FROM score_cards
+    WHERE brand_id = OLD.brand_id
+      AND NOT EXISTS (SELECT 1 FROM latest_score_cards WHERE brand_id = OLD.brand_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT 1;
+"""
+
+SYNC_TRIGGERS_DDL = {
+    "sqlite": [
+        "CREATE TRIGGER IF NOT EXISTS score_cards_latest_insert "
+        f"AFTER INSERT ON score_cards BEGIN {_POINT_TO_NEW} END",
+        "CREATE TRIGGER IF NOT EXISTS score_cards_latest_delete "
+        f"AFTER DELETE ON score_cards BEGIN {_REPOINT_FROM_OLD} END",
+    ],
+    "postgresql": [
+        # The FK cascade may already have dropped the pointer; the NOT EXISTS
+        # repoint covers both orders
+        f"""CREATE OR REPLACE FUNCTION score_cards_latest_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {_POINT_TO_NEW}
+                RETURN NEW;
+            END IF;
+            {_REPOINT_FROM_OLD}
+            RETURN OLD;
+        END
+        $$ LANGUAGE plpgsql""",
+        "DROP TRIGGER IF EXISTS score_cards_latest_sync ON score_cards",
+        "CREATE TRIGGER score_cards_latest_sync AFTER INSERT OR DELETE ON score_cards "
+        "FOR EACH ROW EXECUTE FUNCTION score_cards_latest_sync()",
+    ],
+}
+
+
+def rank_latest_score_cards(
+    workspace_id: Optional[str] = None,
+    brand_ids: Optional[Sequence[str]] = None,
+) -> Select:
+    """
+    Select the latest scorecard of each brand, ranked from the scorecards.
+
+    ROW_NUMBER() over the (brand_id, created_at) index; ties on created_at
+    are broken by ID so each brand gets exactly one row.
+
+    Args:
+        workspace_id: Only brands of this workspace
+        brand_ids: Only these brands
+
+    Returns:
+        Query over every ScoreCard column
+    """
+    ranked = select(
+        ScoreCard,
+        func.row_number()
+        .over(
+            partition_by=ScoreCard.brand_id,
+            order_by=(ScoreCard.created_at.desc(), ScoreCard.id.desc()),
+        )
+        .label("recency"),
+    )
+    if workspace_id is not None:
+        ranked = ranked.join(Brand, Brand.id == ScoreCard.brand_id).where(
+            Brand.workspace_id == workspace_id
+        )
+    if brand_ids is not None:
+        ranked = ranked.where(ScoreCard.brand_id.in_(brand_ids))
+    ranked = ranked.subquery("ranked_score_cards")
+    return select(*(ranked.c[column.name] for column in ScoreCard.__table__.columns)).where(
+        ranked.c.recency == 1
+    )
+
+
+def latest_score_cards(
+    workspace_id: Optional[str] = None,
+    brand_ids: Optional[Sequence[str]] = None,
+) -> AliasedClass:
+    """
+    ScoreCard entity over only the latest scorecard of each brand.
+
+    Select from it like from ScoreCard, e.g.:
+
+        latest = latest_score_cards(workspace_id=workspace_id)
+        select(latest, Brand.name).join(Brand, Brand.id == latest.brand_id)
+
+    Args:
+        workspace_id: Only brands of this workspace
+        brand_ids: Only these brands
+
+    Returns:
+        Aliased ScoreCard entity
+    """
+    query = select(ScoreCard).join(
+        LatestScoreCard, LatestScoreCard.score_card_id == ScoreCard.id
+    )
+    if workspace_id is not None:
+        query = query.join(Brand, Brand.id == LatestScoreCard.brand_id).where(
+            Brand.workspace_id == workspace_id
+        )
+    if brand_ids is not None:
+        query = query.where(LatestScoreCard.brand_id.in_(brand_ids))
+    return aliased(ScoreCard, query.subquery("latest_score_cards"))
+
+
+async def record_latest_score_cards(db: AsyncSession, cards: Iterable[ScoreCard]):
+    """
+    Point the projection at newly written scorecards.
+
+    The cards must be flushed (their created_at set). A card older than the
+    one a brand already points at is ignored, so writers may race.
+    """
+    rows = {}
+    for card in cards:
+        current = rows.get(card.brand_id)
+        if current is None or card.created_at >= current["created_at"]:
+            rows[card.brand_id] = {
+                "brand_id": card.brand_id,
+                "score_card_id": card.id,
+                "created_at": card.created_at,
+            }
+    if not rows:
+        return
+
+    dialect_insert = _UPSERT_DIALECTS.get(db.bind.dialect.name)
+    if dialect_insert is None:
+        # No portable upsert: recompute the affected brands instead
+        brand_ids = list(rows)
+        await db.execute(delete(LatestScoreCard).where(LatestScoreCard.brand_id.in_(brand_ids)))
+        await db.execute(_insert_ranked(rank_latest_score_cards(brand_ids=brand_ids)))
+        return
+
+    stmt = dialect_insert(LatestScoreCard).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LatestScoreCard.brand_id],
+        set_={
+            "score_card_id": stmt.excluded.score_card_id,
+            "created_at": stmt.excluded.created_at,
+        },
+        where=LatestScoreCard.created_at <= stmt.excluded.created_at,
+    )
+    await db.execute(stmt)
+
+
+async def delete_score_cards(db: AsyncSession, *criteria: ColumnElement):
+    """
+    Delete the scorecards matching the criteria and repoint the brands
+    whose latest scorecard was among them to their next newest one.
+    """
+    deleted = select(ScoreCard.id).where(*criteria)
+    result = await db.execute(
+        select(LatestScoreCard.brand_id).where(LatestScoreCard.score_card_id.in_(deleted))
+    )
+    brand_ids = result.scalars().all()
+    await db.execute(delete(ScoreCard).where(*criteria))
+    if brand_ids:
+        await db.execute(delete(LatestScoreCard).where(LatestScoreCard.brand_id.in_(brand_ids)))
+        await db.execute(_insert_ranked(rank_latest_score_cards(brand_ids=brand_ids)))
+
+
+def _ranked_rows(ranked: Select) -> Select:
+    """Projection rows (brand_id, score_card_id, created_at) of a rank_latest_score_cards() query."""
+    ranked = ranked.subquery()
+    # WHERE keeps SQLite from parsing a following ON CONFLICT as a join constraint
+    return select(ranked.c.brand_id, ranked.c.id, ranked.c.created_at).where(true())
+
+
+def _insert_ranked(ranked: Select):
+    """INSERT ... SELECT of projection rows from a rank_latest_score_cards() query."""
+    return insert(LatestScoreCard).from_select(
+        ["brand_id", "score_card_id", "created_at"], _ranked_rows(ranked)
+    )
+
+
+def setup_latest_score_card_sync(connection: Connection) -> None:
+    """Create the triggers that keep the projection in sync. Idempotent."""
+    for statement in SYNC_TRIGGERS_DDL.get(connection.dialect.name, []):
+        connection.exec_driver_sql(statement)
+
+
+def backfill_latest_score_cards(connection: Connection) -> None:
+    """
+    Bring the projection up to date with the scorecards table.
+
+    Pointers to scorecards or brands that no longer exist are dropped, then
+    every brand's newest scorecard is upserted over its pointer unless the
+    pointer already holds a newer one. Idempotent.
+    """
+    dropped = connection.execute(
+        delete(LatestScoreCard).where(
+            LatestScoreCard.score_card_id.not_in(select(ScoreCard.id))
+            | LatestScoreCard.brand_id.not_in(select(Brand.id))
+        )
+    ).rowcount
+
+    dialect_insert = _UPSERT_DIALECTS.get(connection.dialect.name)
+    if dialect_insert is None:
+        # No portable upsert: rebuild the whole projection
+        connection.execute(delete(LatestScoreCard))
+        updated = connection.execute(_insert_ranked(rank_latest_score_cards())).rowcount
+    else:
+        stmt = dialect_insert(LatestScoreCard).from_select(
+            ["brand_id", "score_card_id", "created_at"], _ranked_rows(rank_latest_score_cards())
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LatestScoreCard.brand_id],
+            set_={
+                "score_card_id": stmt.excluded.score_card_id,
+                "created_at": stmt.excluded.created_at,
+            },
+            where=(LatestScoreCard.created_at <= stmt.excluded.created_at)
+            & (LatestScoreCard.score_card_id != stmt.excluded.score_card_id),
+        )
+        updated = connection.execute(stmt).rowcount
+    if dropped or updated:
+        print(f"[scores] Backfilled latest scorecards: {updated} updated, {dropped} dangling dropped")
@@ -0,0 +1,234 @@
+"""
+Full-text search over evaluation results and brand names.
+
+`ILIKE '%term%'` cannot use an index, so every search scanned all response
+bodies. The backend is picked from the database dialect:
+
+- SQLite: FTS5 tables (bm25-ranked word search over prompts and responses,
+  trigram substring search over brand names), kept in sync by triggers.
+- PostgreSQL: a GIN index on the results' tsvector and a pg_trgm GIN index
+  on brand names, both expression indexes the database maintains itself.
+- Anything else, or when the extensions are missing: LIKE matching.
+
+Sync happens in the database, so rows written by the bulk result writer
+(multi-row INSERT / COPY) are indexed too.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import ColumnElement, Float, Select, String, case, func, literal_column, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+from ..core.config import settings
+from ..models.brand import Brand
+from ..models.evaluation import EvaluationResult
+
+
+def search_terms(search: str) -> List[str]:
+    """Split user input into word tokens (drops search-syntax characters)."""
+    return re.findall(r"\w+", search)
+
+
+def _brand_name_order(search: str) -> list:
+    """Order brand matches by prefix match first, then by shorter name."""
+    return [
+        case((Brand.name.ilike(f"{search}%"), 0), else_=1),
+        func.length(Brand.name),
+        Brand.name,
+    ]
+
+
+class SearchBackend:
+    """LIKE substring matching: works on any database but scans the table."""
+
+    name = "like"
+
+    def setup(self, connection: Connection) -> None:
+        """Create the search tables / indexes. Idempotent."""
+
+    def filter_results(self, query: Select, search: str) -> Tuple[Select, Optional[ColumnElement]]:
+        """
+        Restrict a query over EvaluationResult to rows matching the search.
+
+        Returns:
+            (filtered query, relevance of each row where lower is better,
+            or None if matches are unranked)
+        """
+        pattern = f"%{search}%"
+        return query.where(
+            EvaluationResult.prompt_text.ilike(pattern)
+            | EvaluationResult.response_text.ilike(pattern)
+        ), None
+
+    def filter_brands(self, query: Select, search: str) -> Tuple[Select, list]:
+        """
+        Restrict a query over Brand to names containing the search.
+
+        Returns:
+            (filtered query, ORDER BY clauses putting the best matches first)
+        """
+        return query.where(Brand.name.ilike(f"%{search}%")), _brand_name_order(search)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """FTS5 word search over results and trigram search over brand names."""
+
+    name = "sqlite_fts5"
+
+    # The FTS tables store the row ID rather than using the rowid as external
+    # content: rowids of tables with a text primary key change on VACUUM
+    RESULTS_DDL = [
+        """CREATE VIRTUAL TABLE evaluation_results_fts USING fts5(
+            id UNINDEXED, prompt_text, response_text, tokenize='porter unicode61'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS evaluation_results_fts_insert
+        AFTER INSERT ON evaluation_results BEGIN
+            INSERT INTO evaluation_results_fts (id, prompt_text, response_text)
+            VALUES (new.id, new.prompt_text, new.response_text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS evaluation_results_fts_delete
+        AFTER DELETE ON evaluation_results BEGIN
+            DELETE FROM evaluation_results_fts WHERE id = old.id;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS evaluation_results_fts_update
+        AFTER UPDATE OF prompt_text, response_text ON evaluation_results BEGIN
+            UPDATE evaluation_results_fts
+            SET prompt_text = new.prompt_text, response_text = new.response_text
+            WHERE id = new.id;
+        END""",
+        """INSERT INTO evaluation_results_fts (id, prompt_text, response_text)
+        SELECT id, prompt_text, response_text FROM evaluation_results""",
+    ]
+    BRANDS_DDL = [
+        "CREATE VIRTUAL TABLE brands_fts USING fts5(id UNINDEXED, name, tokenize='trigram')",
+        """CREATE TRIGGER IF NOT EXISTS brands_fts_insert AFTER INSERT ON brands BEGIN
+            INSERT INTO brands_fts (id, name) VALUES (new.id, new.name);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS brands_fts_delete AFTER DELETE ON brands BEGIN
+            DELETE FROM brands_fts WHERE id = old.id;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS brands_fts_update AFTER UPDATE OF name ON brands BEGIN
+            UPDATE brands_fts SET name = new.name WHERE id = new.id;
+        END""",
+        "INSERT INTO brands_fts (id, name) SELECT id, name FROM brands",
+    ]
+
+    def __init__(self):
+        self.results_ready = False
+        self.brands_ready = False
+
+    def _create(self, connection: Connection, table: str, statements: List[str]) -> bool:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).first()
+        if exists:
+            return True
+        try:
+            with connection.begin_nested():
+                for statement in statements:
+                    connection.exec_driver_sql(statement)
+        except DBAPIError as e:
+            # FTS5 (or the trigram tokenizer, SQLite >= 3.34) not compiled in
+            print(f"[search] {table} unavailable, falling back to LIKE: {e.orig}")
+            return False
+        print(f"[search] Created {table}")
+        return True
+
+    def setup(self, connection: Connection) -> None:
+        self.results_ready = self._create(connection, "evaluation_results_fts", self.RESULTS_DDL)
+        self.brands_ready = self._create(connection, "brands_fts", self.BRANDS_DDL)
+
+    def filter_results(self, query: Select, search: str) -> Tuple[Select, Optional[ColumnElement]]:
+        terms = search_terms(search)
+        if not self.results_ready or not terms:
+            return super().filter_results(query, search)
+        # Every word must match, as a prefix so partial words still find rows
+        match = " ".join(f'"{term}"*' for term in terms)
+        fts = (
+            text(
+                "SELECT id, rank FROM evaluation_results_fts "
+                "WHERE evaluation_results_fts MATCH :match"
+            )
+            .bindparams(match=match)
+            .columns(id=String, rank=Float)
+            .subquery("fts")
+        )
+        # bm25 rank: lower is better
+        return query.join(fts, fts.c.id == EvaluationResult.id), fts.c.rank
+
+    def filter_brands(self, query: Select, search: str) -> Tuple[Select, list]:
+        search = search.strip()
+        # Trigrams cannot match fewer than three characters
+        if not self.brands_ready or len(search) < 3:
+            return super().filter_brands(query, search)
+        phrase = '"' + search.replace('"', '""') + '"'
+        fts = (
+            text("SELECT id FROM brands_fts WHERE brands_fts MATCH :phrase")
+            .bindparams(phrase=phrase)
+            .columns(id=String)
+            .subquery("brand_fts")
+        )
+        return query.join(fts, fts.c.id == Brand.id), _brand_name_order(search)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """tsvector / GIN search over results and pg_trgm search over brand names."""
+
+    name = "postgres_fts"
+
+    # Queries must repeat this expression verbatim for the planner to use the index
+    RESULT_DOCUMENT = "to_tsvector('english', evaluation_results.prompt_text || ' ' || evaluation_results.response_text)"
+
+    def __init__(self):
+        self.trigram_ready = False
+
+    def setup(self, connection: Connection) -> None:
+        connection.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_evaluation_results_search "
+            f"ON evaluation_results USING GIN (({self.RESULT_DOCUMENT}))"
+        )
+        try:
+            with connection.begin_nested():
+                connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                connection.exec_driver_sql(
+                    "CREATE INDEX IF NOT EXISTS ix_brands_name_trgm "
+                    "ON brands USING GIN (name gin_trgm_ops)"
+                )
+            self.trigram_ready = True
+        except DBAPIError as e:
+            print(f"[search] pg_trgm unavailable, brand search falls back to LIKE: {e.orig}")
+
+    def filter_results(self, query: Select, search: str) -> Tuple[Select, Optional[ColumnElement]]:
+        terms = search_terms(search)
+        if not terms:
+            return super().filter_results(query, search)
+        document = literal_column(self.RESULT_DOCUMENT)
+        tsquery = func.to_tsquery(literal_column("'english'"), " & ".join(f"{term}:*" for term in terms))
+        return query.where(document.op("@@")(tsquery)), -func.ts_rank(document, tsquery)
+
+    def filter_brands(self, query: Select, search: str) -> Tuple[Select, list]:
+        # ILIKE '%x%' is served by the trigram index
+        query, order = super().filter_brands(query, search)
+        if self.trigram_ready:
+            order = [func.similarity(Brand.name, search).desc(), *order]
+        return query, order
+
+
+_BACKENDS = {
+    "sqlite": SQLiteSearchBackend,
+    "postgresql": PostgresSearchBackend,
+}
+_backends: Dict[str, SearchBackend] = {}
+
+
+def get_search_backend(dialect: Optional[str]) -> SearchBackend:
+    """Return the shared search backend for a database dialect (e.g. "sqlite")."""
+    if settings.SEARCH_BACKEND == "like":
+        dialect = None
+    backend = _backends.get(dialect)
+    if backend is None:
+        backend = _BACKENDS.get(dialect, SearchBackend)()
+        _backends[dialect] = backend
+    return backend
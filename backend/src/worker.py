@@ -0,0 +1,52 @@
+"""
+Standalone background job worker.
+
+Run one or more of these next to the API to execute queued jobs:
+
+    python -m src.worker
+
+Set JOB_WORKER_ENABLED=false on the API service if only dedicated
+workers should run jobs.
+"""
+
+import asyncio
+import signal
+
+from .core.config import settings
+from .core.database import init_db, close_db
+from . import models  # noqa: F401  (register all tables)
+from .services.ai_clients import close_ai_clients, init_http_clients, close_http_clients
+from .services.job_queue import JobWorker
+
+
+async def main():
+    print(f"Starting {settings.APP_NAME} job worker")
+    await init_db()
+    init_http_clients()
+
+    worker = JobWorker()
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    runner = asyncio.create_task(worker.run())
+    await stop.wait()
+
+    print("Shutting down worker...")
+    await worker.stop()
+    runner.cancel()
+    try:
+        await runner
+    except asyncio.CancelledError:
+        pass
+    await close_ai_clients()
+    await close_http_clients()
+    await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
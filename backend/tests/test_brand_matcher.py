@@ -0,0 +1,79 @@
+import re
+
+from src.services.brand_matcher import BrandMatcher
+
+
+def regex_hits(text, terms):
+    """Reference: one \\b term \\b regex per term, as BrandExtractor used to do."""
+    hits = set()
+    for term in terms:
+        for match in re.finditer(r"\b" + re.escape(term.lower()) + r"\b", text.lower()):
+            hits.add((term.lower(), match.start(), match.end()))
+    return hits
+
+
+def test_matches_word_boundary_regex():
+    terms = ["Nike", "Air Jordan", "H&M", "Disney+", "MS", "Model 3", "Coca-Cola", "ai"]
+    matcher = BrandMatcher([(term, term) for term in terms])
+    text = (
+        "Top picks:\n1. Nike and Air Jordan\n2. H&M, Disney+x, Disney+ MS-DOS\n"
+        "Nikes are not Nike. Model 3 vs Model 30. coca-cola! AI ai-powered said"
+    )
+
+    found = {(hit.term, hit.start, hit.end) for hit in matcher.find_all(text)}
+
+    assert found == regex_hits(text, terms)
+
+
+def test_same_term_never_overlaps():
+    matcher = BrandMatcher([("x", "a a")])
+    hits = matcher.find_all("a a a")
+    assert [(h.start, h.end) for h in hits] == [(0, 3)]
+
+
+def test_substring_mode_and_line_rank():
+    matcher = BrandMatcher({"b1": ["Acme"], "b2": ["Globex"]}, word_boundary=False)
+    text = "Intro line\n2. The ACMEcorp pick\n- Globex"
+
+    hits = matcher.find_by_key(text)
+
+    assert [(h.line, h.rank) for h in hits["b1"]] == [(1, 2)]
+    assert [(h.line, h.rank) for h in hits["b2"]] == [(2, None)]
+    assert text[hits["b1"][0].start:hits["b1"][0].end] == "ACME"
+
+
+def test_compact_variants_map_back_to_original_offsets():
+    matcher = BrandMatcher({"mcd": ["McDonald's"]}, word_boundary=False, compact_variants=True)
+    text = "Try Mc Donalds\nor McDonald's"
+
+    hits = matcher.find_all(text)
+
+    assert [(h.compact, h.line) for h in hits] == [(True, 0), (False, 1)]
+    assert text[hits[0].start:hits[0].end] == "Mc Donalds"
+
+
+def test_large_catalog():
+    catalog = {f"brand{i}": [f"Brand {i:04d}"] for i in range(2000)}
+    matcher = BrandMatcher(catalog)
+
+    hits = matcher.find_all("I like brand 0042 and Brand 1999, not brand 00420.")
+
+    assert [h.key for h in hits] == ["brand42", "brand1999"]
+
+
+def test_offsets_survive_case_folding_that_changes_length():
+    matcher = BrandMatcher({"ist": ["İstanbul Kids"], "gap": ["Gap"]}, compact_variants=True)
+    # "İ" lowercases to two code points
+    text = "İİ Straße\n1. İstanbul Kids\n2. GAP"
+
+    hits = matcher.find_all(text)
+
+    assert [text[h.start:h.end] for h in hits] == ["İstanbul Kids", "GAP"]
+    assert [(h.line, h.rank) for h in hits] == [(1, 1), (2, 2)]
+
+
+def test_case_insensitive_like_lower_not_casefold():
+    # Same results as the regex-on-lower() analyzer: "ß" does not match "ss"
+    matcher = BrandMatcher({"s": ["Straße"]})
+
+    assert [h.start for h in matcher.find_all("STRASSE, Strasse; Straße and STRAßE")] == [18, 29]
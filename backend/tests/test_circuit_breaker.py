@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import pytest
+
+from src.services.ai_clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.evaluation_scheduler import EvaluationScheduler
+
+
+def test_opens_on_error_rate_and_recovers_after_probe():
+    breaker = CircuitBreaker("test", min_calls=4, open_seconds=0.05)
+    for _ in range(2):
+        breaker.record_success(0.1)
+    breaker.record_failure("boom")
+    assert breaker.state == "closed"
+    breaker.record_failure("boom")
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.snapshot()["rejected_count"] == 1
+
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # Only one probe at a time
+    breaker.record_success(0.1)
+    assert breaker.state == "closed"
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker("test", min_calls=1, open_seconds=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.opened_count == 2
+
+
+def test_slow_calls_open_the_breaker():
+    breaker = CircuitBreaker("test", min_calls=2, slow_call_seconds=1.0, slow_rate_threshold=1.0)
+    breaker.record_success(5.0)
+    breaker.record_success(5.0)
+    assert breaker.state == "open"
+
+
+def test_scheduler_defers_jobs_until_breaker_closes():
+    breaker = CircuitBreaker("flaky", min_calls=1, open_seconds=0.05)
+    breaker.record_failure()
+    calls = []
+
+    async def job():
+        if not breaker.allow():
+            raise CircuitOpenError("flaky")
+        breaker.record_success()
+        calls.append(breaker.state)
+        return "ok"
+
+    async def main():
+        scheduler = EvaluationScheduler(
+            max_concurrency=4, circuit_breakers=lambda provider: breaker, max_defer=5
+        )
+        return [result async for result in scheduler.run([("flaky", job)] * 3)]
+
+    assert asyncio.run(main()) == ["ok", "ok", "ok"]
+    assert calls == ["closed", "closed", "closed"]
+
+
+def test_scheduler_gives_up_after_max_defer():
+    breaker = CircuitBreaker("down", min_calls=1, open_seconds=60)
+    breaker.record_failure()
+
+    async def job():
+        if not breaker.allow():
+            raise CircuitOpenError("down")
+        return "ok"
+
+    async def main():
+        scheduler = EvaluationScheduler(
+            max_concurrency=1, circuit_breakers=lambda provider: breaker, max_defer=0.05
+        )
+        return [result async for result in scheduler.run([("down", job)])]
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(main())
@@ -0,0 +1,78 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.core.database import Base
+from src.models.prompt import Prompt
+from src.services.count_cache import CountCache, get_count_cache, normalize_filter
+
+
+def test_key_ignores_unset_filters_and_order():
+    assert CountCache.key("raw", {"brand": "Nike", "intent": None, "search": ""}) == CountCache.key(
+        "raw", {"search": None, "brand": "Nike"}
+    )
+    assert CountCache.key("raw", {"mentioned": False}) != CountCache.key("raw", {})
+    # Filters match the raw value, so "discovery " counts different rows
+    assert CountCache.key("prompts", {"category": "discovery "}) != CountCache.key(
+        "prompts", {"category": "discovery"}
+    )
+
+
+def test_filters_are_normalized_before_keying_and_querying():
+    assert normalize_filter(" discovery ") == "discovery"
+    assert normalize_filter("   ") is None
+    assert normalize_filter(None) is None
+    assert CountCache.key("prompts", {"category": normalize_filter("discovery ")}) == CountCache.key(
+        "prompts", {"category": "discovery"}
+    )
+
+
+def test_invalidation_and_lru():
+    cache = CountCache(max_entries=2)
+    versions = cache.versions(["brands"])
+    cache.put("a", 1, versions)
+    cache.put("b", 2, versions)
+    assert cache.get("a", ["brands"]) == 1
+
+    cache.put("c", 3, versions)  # Evicts "b", the least recently used
+    assert cache.get("b", ["brands"]) is None
+
+    cache.invalidate(["prompts"])
+    assert cache.get("a", ["brands"]) == 1
+    cache.invalidate(["brands"])
+    assert cache.get("a", ["brands"]) is None
+
+
+def test_value_counted_during_a_write_is_discarded():
+    cache = CountCache()
+    versions = cache.versions(["brands"])
+    cache.invalidate(["brands"])  # Commit lands while the count runs
+    cache.put("a", 1, versions)
+    assert cache.get("a", ["brands"]) is None
+
+
+def _prompt(prompt_id):
+    return Prompt(id=prompt_id, text="best kids shoes", intent_category="discovery")
+
+
+def test_committed_writes_invalidate_their_tables():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Prompt.__table__])
+    cache = get_count_cache()
+
+    def cached_after(write):
+        cache.put("prompts", 0, cache.versions(["prompts"]))
+        with Session(engine) as session:
+            write(session)
+        return cache.get("prompts", ["prompts"])
+
+    def rollback(session):
+        session.add(_prompt("p0"))
+        session.flush()
+        session.rollback()
+
+    assert cached_after(rollback) == 0
+    assert cached_after(lambda session: (session.add(_prompt("p1")), session.commit())) is None
+    assert cached_after(lambda session: session.execute(select(Prompt)).all()) == 0
+    assert cached_after(
+        lambda session: (session.execute(Prompt.__table__.delete()), session.commit())
+    ) is None
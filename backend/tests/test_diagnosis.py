@@ -0,0 +1,39 @@
+import asyncio
+
+from src.api.routes.diagnosis import evaluate_prompt
+
+ANSWER = "Acme is a solid brand.\nCustomers call it trusted, see https://acme.com"
+
+
+def _model(calls):
+    async def model_fn(prompt, stop_condition=None):
+        calls.append(stop_condition)
+        if stop_condition is not None:
+            # Streaming stops as soon as the first line is complete
+            first_line = ANSWER.split("\n")[0] + "\n"
+            if stop_condition(first_line):
+                return first_line
+        return ANSWER
+    return model_fn
+
+
+def test_brand_specific_prompts_are_never_cut_off():
+    calls = []
+    result = asyncio.run(evaluate_prompt(
+        "Acme", "is Acme good", "ChatGPT", _model(calls), "brand_specific", early_stop=True,
+    ))
+
+    assert calls == [None]
+    assert result["response_text"] == ANSWER
+    assert result["has_citation"] is True
+
+
+def test_generic_prompts_stop_early():
+    calls = []
+    result = asyncio.run(evaluate_prompt(
+        "Acme", "best brands", "ChatGPT", _model(calls), "generic", early_stop=True,
+    ))
+
+    assert calls[0] is not None
+    assert result["response_text"] == ANSWER.split("\n")[0] + "\n"
+    assert result["mentioned"] is True
@@ -0,0 +1,31 @@
+import asyncio
+
+from src.services.event_broker import EventBroker
+
+
+def test_subscribers_receive_events_for_their_topic_only():
+    broker = EventBroker()
+
+    async def main():
+        async with broker.subscribe("run-1") as first, broker.subscribe("run-2") as second:
+            broker.publish("run-1", "progress", {"progress": 50})
+            assert second.empty()
+            return await first.get()
+
+    event = asyncio.run(main())
+
+    assert (event.type, event.data) == ("progress", {"progress": 50})
+    assert event.encode() == f'id: {event.id}\nevent: progress\ndata: {{"progress": 50}}\n\n'
+    broker.publish("run-1", "progress")  # No subscribers left; dropped silently
+
+
+def test_slow_subscriber_loses_oldest_events():
+    broker = EventBroker(max_queue_size=2)
+
+    async def main():
+        async with broker.subscribe("run") as queue:
+            for i in range(3):
+                broker.publish("run", "result", {"n": i})
+            return [queue.get_nowait().data["n"] for _ in range(queue.qsize())]
+
+    assert asyncio.run(main()) == [1, 2]
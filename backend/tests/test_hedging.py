@@ -0,0 +1,73 @@
+import asyncio
+
+from src.services.ai_clients.hedging import RequestHedger
+
+
+def warmed_hedger(**kwargs):
+    hedger = RequestHedger("test", min_samples=5, min_delay=0.01, **kwargs)
+    hedger.latencies.extend([0.02] * 10)
+    return hedger
+
+
+def test_no_hedge_without_enough_samples():
+    hedger = RequestHedger("test", min_samples=5)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return "ok"
+
+    assert asyncio.run(hedger.run(call)) == "ok"
+    assert calls == [1]
+    assert hedger.snapshot()["hedged"] == 0
+    assert hedger.snapshot()["samples"] == 1
+
+
+def test_slow_call_is_hedged_and_hedge_wins():
+    hedger = warmed_hedger(budget=1.0)
+    delays = [0.3, 0.01]
+    finished = []
+
+    async def call():
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        finished.append(delay)
+        return delay
+
+    async def main():
+        result = await hedger.run(call)
+        await asyncio.sleep(0.35)  # The primary would have finished by now
+        return result
+
+    assert asyncio.run(main()) == 0.01
+    # The losing primary was cancelled rather than left running
+    assert finished == [0.01]
+    stats = hedger.snapshot()
+    assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+    assert 0 < stats["primary_elapsed_ms"] < 300
+
+
+def test_failed_hedge_falls_back_to_primary():
+    hedger = warmed_hedger(budget=1.0)
+    results = [(0.1, "primary"), (0.0, None)]
+
+    async def call():
+        delay, result = results.pop(0)
+        await asyncio.sleep(delay)
+        return result
+
+    assert asyncio.run(hedger.run(call)) == "primary"
+    assert hedger.snapshot()["hedge_wins"] == 0
+
+
+def test_budget_caps_hedging():
+    hedger = warmed_hedger(budget=0.0)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    assert asyncio.run(hedger.run(call)) == "ok"
+    assert len(calls) == 1
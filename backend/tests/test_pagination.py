@@ -0,0 +1,56 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+
+from src.core.pagination import decode_cursor, encode_cursor, keyset_paginate, split_page
+
+
+def test_cursor_round_trip():
+    values = ["brand-1", "Gemini", "a1b2", datetime(2026, 1, 2, 3, 4, 5)]
+
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 4) == values
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor(["a", "b"])])
+def test_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 3)
+
+
+def test_split_page_uses_last_row_of_page():
+    rows = [SimpleNamespace(brand_id="b", id=str(i)) for i in range(3)]
+
+    page, cursor = split_page(rows, ["brand_id", "id"], limit=2)
+
+    assert [row.id for row in page] == ["0", "1"]
+    assert decode_cursor(cursor, 2) == ["b", "1"]
+    assert split_page(rows, ["brand_id", "id"], limit=3) == (rows, None)
+
+
+def test_keyset_pages_cover_rows_with_duplicate_sort_prefixes_once():
+    table = Table("rows", MetaData(), Column("id", String, primary_key=True), Column("brand", String),
+                  Column("score", Integer))
+    engine = create_engine("sqlite://")
+    table.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(table), [
+            {"id": f"r{i:03d}", "brand": f"brand-{i % 4}", "score": i % 3} for i in range(53)
+        ])
+
+        columns = [table.c.score, table.c.brand, table.c.id]
+        seen, cursor = [], None
+        while True:
+            rows = conn.execute(keyset_paginate(select(table), columns, cursor, limit=10)).all()
+            page, cursor = split_page(rows, ["score", "brand", "id"], limit=10)
+            seen += [row.id for row in page]
+            if cursor is None:
+                break
+
+    assert sorted(seen) == sorted(f"r{i:03d}" for i in range(53))
+    assert len(seen) == 53
@@ -0,0 +1,64 @@
+from src.services.response_analyzer import BrandResponseAnalyzer, MentionStopCondition
+
+
+def test_numbered_list_rank_and_sentiment():
+    analyzer = BrandResponseAnalyzer("Acme Co")
+    text = "Top picks:\n1. Globex - solid\n2. **Acme Co** - trusted, highly rated\nVisit https://acmeco.com"
+
+    result = analyzer.analyze(text)
+
+    assert result == {
+        "mentioned": True,
+        "rank": 2,
+        "sentiment": "positive",
+        "snippet": "2. **Acme Co** - trusted, highly rated",
+        "has_citation": True,
+    }
+
+
+def test_compact_variant_and_bullet_fallback_rank():
+    analyzer = BrandResponseAnalyzer("Acme Co")
+    text = "Options:\n* **Globex** great\n* **Initech** ok\n* acme-co, avoid the overpriced ones"
+
+    result = analyzer.analyze(text)
+
+    assert result["mentioned"] is True
+    assert result["rank"] == 3
+    assert result["sentiment"] == "negative"
+    assert result["has_citation"] is False
+
+
+def test_brand_specific_echo_is_not_a_mention():
+    analyzer = BrandResponseAnalyzer("Acme")
+    text = "I don't have specific information about Acme."
+
+    assert analyzer.analyze(text, "generic")["mentioned"] is True
+    assert analyzer.analyze(text, "brand_specific") == {
+        "mentioned": False,
+        "rank": None,
+        "sentiment": None,
+        "snippet": None,
+        "has_citation": False,
+    }
+
+
+def test_not_mentioned():
+    result = BrandResponseAnalyzer("Acme").analyze("Globex is the best.")
+    assert result["mentioned"] is False
+    assert result["sentiment"] is None
+
+
+def test_stop_condition_waits_for_complete_line():
+    stop = MentionStopCondition(BrandResponseAnalyzer("Acme").matcher, ["Acme"], max_rank=5)
+
+    assert stop("Here you go:\n1. Globex\n2. Acme Wid") is False
+    assert stop("Here you go:\n1. Globex\n2. Acme Widgets\n") is True
+    assert stop.ranks == {"Acme": 2}
+
+
+def test_stop_condition_gives_up_past_max_rank():
+    stop = MentionStopCondition(BrandResponseAnalyzer("Acme").matcher, ["Acme"], max_rank=2)
+
+    assert stop("1. Globex\n2. Initech\n") is False
+    assert stop("1. Globex\n2. Initech\n3. Hooli\n") is True
+    assert stop.ranks == {}
@@ -0,0 +1,49 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.database import Base
+from src.models.evaluation import EvaluationResult
+from src.services.result_writer import ResultBulkWriter
+
+
+def _result(result_id, prompt_id):
+    return {
+        "id": result_id, "evaluation_run_id": "run-1", "brand_id": "brand-1",
+        "prompt_id": prompt_id, "model_name": "ChatGPT", "prompt_text": "best baby clothes",
+        "intent_category": "discovery", "response_text": "Try Pact.",
+        "response_time_ms": 0, "is_mentioned": False, "mention_rank": None,
+        "mention_context": None, "is_cited": False, "citation_urls": [],
+        "representation_score": 0, "description_text": None, "sentiment": None,
+        "intent_fit_score": None, "evaluated_at": datetime(2026, 1, 1),
+    }
+
+
+def test_already_stored_results_are_skipped(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'results.db'}")
+
+    async def main():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: Base.metadata.create_all(sync_conn, tables=[EvaluationResult.__table__])
+            )
+
+        async with AsyncSession(engine) as db:
+            writer = ResultBulkWriter(db, batch_size=10)
+            await writer.add(_result("r1", "p1"))
+            await writer.flush()
+            # A second worker running the same job writes the same triples again
+            await writer.add(_result("r2", "p1"))
+            await writer.add(_result("r3", "p2"))
+            await writer.flush()
+            await db.commit()
+
+            ids = (await db.execute(select(EvaluationResult.id).order_by(EvaluationResult.id))).scalars().all()
+            return ids, writer.rows_written, writer.rows_skipped
+
+    try:
+        assert asyncio.run(main()) == (["r1", "r3"], 2, 1)
+    finally:
+        asyncio.run(engine.dispose())
@@ -0,0 +1,176 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.core.database import Base
+from src.models.brand import Brand
+from src.models.scorecard import LatestScoreCard, ScoreCard
+from src.services.score_queries import (
+    backfill_latest_score_cards,
+    delete_score_cards,
+    latest_score_cards,
+    rank_latest_score_cards,
+    record_latest_score_cards,
+    setup_latest_score_card_sync,
+)
+
+TABLES = [Brand.__table__, ScoreCard.__table__, LatestScoreCard.__table__]
+
+
+def _brand(brand_id, workspace_id):
+    return {
+        "id": brand_id, "workspace_id": workspace_id, "name": brand_id, "slug": brand_id,
+        "category": "Kids Fashion", "price_tier": "mid-range",
+        "target_keywords": [], "competitors": [],
+        "created_at": datetime(2026, 1, 1), "updated_at": datetime(2026, 1, 1),
+    }
+
+
+def _card(card_id, brand_id, day, score):
+    created = datetime(2026, 1, day)
+    return {
+        "id": card_id, "brand_id": brand_id, "composite_score": score,
+        "model_scores": {}, "created_at": created, "updated_at": created,
+    }
+
+
+def _seed(conn):
+    conn.execute(insert(Brand), [_brand("a", "ws-1"), _brand("b", "ws-1"), _brand("c", "ws-2")])
+    conn.execute(insert(ScoreCard), [
+        _card("a1", "a", 1, 10), _card("a2", "a", 3, 30), _card("a3", "a", 2, 20),
+        # Same timestamp: exactly one card is returned
+        _card("b1", "b", 5, 50), _card("b2", "b", 5, 55),
+        _card("c1", "c", 9, 90),
+    ])
+
+
+def test_rank_latest_score_card_per_brand():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=TABLES)
+    with engine.begin() as conn:
+        _seed(conn)
+
+        ranked = conn.execute(rank_latest_score_cards(workspace_id="ws-1")).all()
+        assert sorted((row.brand_id, row.composite_score) for row in ranked) == [("a", 30), ("b", 55)]
+
+        ranked = conn.execute(rank_latest_score_cards(brand_ids=["c"])).all()
+        assert [row.id for row in ranked] == ["c1"]
+
+
+def test_projection_is_backfilled_and_read_as_score_cards():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=TABLES)
+    with engine.begin() as conn:
+        _seed(conn)
+        backfill_latest_score_cards(conn)
+        backfill_latest_score_cards(conn)  # Idempotent
+
+    with Session(engine) as session:
+        latest = latest_score_cards(workspace_id="ws-1")
+        cards = session.execute(select(latest).order_by(latest.brand_id)).scalars().all()
+        assert [(card.brand_id, card.composite_score) for card in cards] == [("a", 30), ("b", 55)]
+        assert all(isinstance(card, ScoreCard) for card in cards)
+
+        latest = latest_score_cards(brand_ids=["a", "c"])
+        rows = session.execute(
+            select(latest.id, Brand.workspace_id).join(Brand, Brand.id == latest.brand_id).order_by(latest.id)
+        ).all()
+        assert rows == [("a2", "ws-1"), ("c1", "ws-2")]
+
+
+def _pointers(conn):
+    return conn.execute(
+        select(LatestScoreCard.brand_id, LatestScoreCard.score_card_id).order_by(LatestScoreCard.brand_id)
+    ).all()
+
+
+def test_backfill_moves_pointers_to_cards_written_outside_the_engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=TABLES)
+    with engine.begin() as conn:
+        _seed(conn)
+        backfill_latest_score_cards(conn)
+
+        # Raw inserts and deletes, as the seed scripts do (no FK enforcement)
+        conn.execute(insert(ScoreCard), [_card("a9", "a", 20, 99), _card("b0", "b", 1, 5)])
+        conn.execute(delete(ScoreCard).where(ScoreCard.id == "c1"))
+        conn.execute(insert(ScoreCard), [_card("c2", "c", 8, 80)])
+        backfill_latest_score_cards(conn)
+
+        assert _pointers(conn) == [("a", "a9"), ("b", "b2"), ("c", "c2")]
+
+
+def test_triggers_follow_raw_sql_writes():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=TABLES)
+    with engine.begin() as conn:
+        setup_latest_score_card_sync(conn)
+        setup_latest_score_card_sync(conn)  # Idempotent
+        _seed(conn)
+        assert _pointers(conn) == [("a", "a2"), ("b", "b2"), ("c", "c1")]
+
+        # What the seed and evaluation scripts do
+        conn.exec_driver_sql("DELETE FROM score_cards WHERE brand_id = 'a' AND created_at > '2026-01-01 12:00'")
+        assert _pointers(conn) == [("a", "a1"), ("b", "b2"), ("c", "c1")]
+        conn.exec_driver_sql("DELETE FROM score_cards")
+        assert _pointers(conn) == []
+        conn.execute(insert(ScoreCard), [_card("c7", "c", 7, 70), _card("c6", "c", 6, 60)])
+        assert _pointers(conn) == [("c", "c7")]
+
+    with Session(engine) as session:
+        latest = latest_score_cards(workspace_id="ws-2")
+        assert session.execute(select(latest.composite_score)).scalars().all() == [70]
+
+
+def test_deleting_cards_repoints_their_brands(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'scores.db'}")
+
+    async def main():
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=TABLES))
+            await conn.run_sync(_seed)
+            await conn.run_sync(backfill_latest_score_cards)
+
+        async with AsyncSession(engine) as db:
+            await delete_score_cards(db, ScoreCard.id.in_(["a2", "c1"]))
+            await db.commit()
+            async with engine.connect() as conn:
+                return await conn.run_sync(_pointers)
+
+    try:
+        assert asyncio.run(main()) == [("a", "a3"), ("b", "b2")]
+    finally:
+        asyncio.run(engine.dispose())
+
+
+def test_record_keeps_the_newest_card(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'scores.db'}")
+
+    async def main():
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=TABLES))
+            await conn.run_sync(_seed)
+            await conn.run_sync(backfill_latest_score_cards)
+
+        async with AsyncSession(engine) as db:
+            newer = ScoreCard(id="a4", brand_id="a", composite_score=40, model_scores={},
+                              created_at=datetime(2026, 2, 1))
+            older = ScoreCard(id="c0", brand_id="c", composite_score=1, model_scores={},
+                              created_at=datetime(2025, 1, 1))
+            db.add_all([newer, older])
+            await db.flush()
+            await record_latest_score_cards(db, [newer, older])
+            await db.commit()
+
+            result = await db.execute(
+                select(LatestScoreCard.brand_id, LatestScoreCard.score_card_id).order_by(LatestScoreCard.brand_id)
+            )
+            return result.all()
+
+    try:
+        assert asyncio.run(main()) == [("a", "a4"), ("b", "b2"), ("c", "c1")]
+    finally:
+        asyncio.run(engine.dispose())
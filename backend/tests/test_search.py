@@ -0,0 +1,73 @@
+from sqlalchemy import create_engine, insert, select
+
+from src.core.database import Base
+from src.models.brand import Brand
+from src.models.evaluation import EvaluationResult
+from src.services.search import SearchBackend, SQLiteSearchBackend
+
+
+def _result(result_id, prompt_text, response_text):
+    return {
+        "id": result_id, "evaluation_run_id": "run-1", "brand_id": "brand-1",
+        "prompt_id": f"prompt-{result_id}", "model_name": "ChatGPT", "prompt_text": prompt_text,
+        "intent_category": "discovery", "response_text": response_text,
+        "response_time_ms": 0, "is_mentioned": False, "is_cited": False,
+        "citation_urls": [], "representation_score": 0,
+    }
+
+
+def _brand(brand_id, name):
+    return {
+        "id": brand_id, "workspace_id": "ws-1", "name": name, "slug": name.lower(),
+        "category": "Kids Fashion", "price_tier": "mid-range",
+        "target_keywords": [], "competitors": [],
+    }
+
+
+def _setup():
+    engine = create_engine("sqlite://")
+    backend = SQLiteSearchBackend()
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, tables=[EvaluationResult.__table__, Brand.__table__])
+        conn.execute(insert(EvaluationResult), [_result("r1", "best organic baby clothes", "Try Pact.")])
+        conn.execute(insert(Brand), [_brand("b1", "Carter's")])
+        backend.setup(conn)
+    return engine, backend
+
+
+def test_results_are_ranked_and_synced_by_triggers():
+    engine, backend = _setup()
+    assert backend.results_ready
+    with engine.begin() as conn:
+        conn.execute(insert(EvaluationResult), [
+            _result("r2", "cheap kids shoes", "Organic cotton is rare; organic organic."),
+            _result("r3", "rain boots", "Hunter makes good boots."),
+        ])
+
+        query, rank = backend.filter_results(select(EvaluationResult.id), "organ")
+        ids = conn.execute(query.order_by(rank)).scalars().all()
+        assert ids == ["r2", "r1"]
+
+        conn.execute(EvaluationResult.__table__.delete().where(EvaluationResult.id == "r2"))
+        query, rank = backend.filter_results(select(EvaluationResult.id), 'organic "')
+        assert conn.execute(query.order_by(rank)).scalars().all() == ["r1"]
+
+
+def test_brand_substring_search_prefers_prefix_matches():
+    engine, backend = _setup()
+    assert backend.brands_ready
+    with engine.begin() as conn:
+        conn.execute(insert(Brand), [_brand("b2", "Little Carters Co"), _brand("b3", "Gap Kids")])
+
+        for search in ("carter", "ca"):
+            query, order = backend.filter_brands(select(Brand.name), search)
+            names = conn.execute(query.order_by(*order)).scalars().all()
+            assert names == ["Carter's", "Little Carters Co"]
+
+
+def test_like_backend_matches_substrings():
+    engine, _ = _setup()
+    with engine.begin() as conn:
+        query, rank = SearchBackend().filter_results(select(EvaluationResult.id), "ganic baby")
+        assert conn.execute(query).scalars().all() == ["r1"]
+        assert rank is None
@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect, useCallback, useMemo, Fragment } from 'react';
+import { useState, useEffect, useCallback, useMemo, useRef, Fragment } from 'react';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { BarChart3, Trophy, Grid3X3, Database, Loader2, ChevronDown, ChevronUp, ChevronLeft, ChevronRight, Search, X, TrendingUp, Users, Eye, Star, Zap } from 'lucide-react';
@@ -862,6 +862,8 @@ function RawDataTab({ category }: { category: string }) {
   const [search, setSearch] = useState('');
   const [pageSize, setPageSize] = useState(50);
   const [page, setPage] = useState(1);
+  // next_cursor of each visited page, so paging forward and back uses keyset pagination
+  const cursors = useRef<Record<number, string>>({});
 
   useEffect(() => {
     const catParam = category ? `?category=${encodeURIComponent(category)}` : '';
@@ -877,6 +879,10 @@ function RawDataTab({ category }: { category: string }) {
     setPage(1);
   }, [category]);
 
+  useEffect(() => {
+    cursors.current = {};
+  }, [category, filterBrand, filterIntent, filterMentioned, search, pageSize]);
+
   const loadData = useCallback(() => {
     setLoading(true);
     const params = new URLSearchParams();
@@ -887,15 +893,29 @@ function RawDataTab({ category }: { category: string }) {
     if (search) params.set('search', search);
     params.set('page', String(page));
     params.set('page_size', String(pageSize));
+    const cursor = cursors.current[page];
+    if (cursor) params.set('cursor', cursor);
 
-    fetch(`${API_URL}/api/v1/industry/raw?${params}`)
+    // Aborted when the filters or page change, so a stale response can
+    // neither overwrite the table nor store its cursor for the new filters
+    const controller = new AbortController();
+    fetch(`${API_URL}/api/v1/industry/raw?${params}`, { signal: controller.signal })
       .then(r => { if (!r.ok) throw new Error('Failed'); return r.json(); })
-      .then(d => { setData(d.data); setPagination(d.pagination); })
-      .catch(e => setError(e.message))
-      .finally(() => setLoading(false));
+      .then(d => {
+        if (controller.signal.aborted) return;
+        if (d.pagination.next_cursor) cursors.current[page + 1] = d.pagination.next_cursor;
+        setData(d.data);
+        setPagination(d.pagination);
+      })
+      .catch(e => { if (!controller.signal.aborted) setError(e.message); })
+      .finally(() => { if (!controller.signal.aborted) setLoading(false); });
+    return controller;
   }, [category, filterBrand, filterIntent, filterMentioned, search, page, pageSize]);
 
-  useEffect(() => { loadData(); }, [loadData]);
+  useEffect(() => {
+    const controller = loadData();
+    return () => controller.abort();
+  }, [loadData]);
 
   return (
     <div className="space-y-4">
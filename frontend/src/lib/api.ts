@@ -15,6 +15,7 @@ import type {
   EvaluationRun,
   EvaluationRunDetail,
   EvaluationResult,
+  EvaluationResultPage,
   EvaluationCreate,
   PaginatedResponse,
   Prompt,
@@ -292,10 +293,19 @@ export const evaluationsApi = {
     brandId?: string,
     modelName?: string
   ): Promise<EvaluationResult[]> {
-    let url = `/evaluations/${runId}/results?workspace_id=${workspaceId}`;
+    // Full rows (incl. response_text); follow the cursor until the last page
+    let url = `/evaluations/${runId}/results?workspace_id=${workspaceId}&fields=*&limit=1000`;
     if (brandId) url += `&brand_id=${brandId}`;
     if (modelName) url += `&model_name=${modelName}`;
-    return fetchApi<EvaluationResult[]>(url);
+    const results: EvaluationResult[] = [];
+    let cursor: string | null = null;
+    do {
+      const pageUrl: string = cursor ? `${url}&cursor=${encodeURIComponent(cursor)}` : url;
+      const page = await fetchApi<EvaluationResultPage>(pageUrl);
+      results.push(...page.results);
+      cursor = page.next_cursor;
+    } while (cursor);
+    return results;
   },
 };
 
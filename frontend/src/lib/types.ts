@@ -149,6 +149,12 @@ export interface EvaluationResult {
 
 export interface EvaluationRunDetail extends EvaluationRun {
   results: EvaluationResult[];
+  next_cursor: string | null;
+}
+
+export interface EvaluationResultPage {
+  results: EvaluationResult[];
+  next_cursor: string | null;
 }
 
 export interface EvaluationCreate {